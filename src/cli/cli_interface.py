@@ -16,12 +16,14 @@ from core.config_manager import ConfigManager
 from core.video_scanner import VideoScanner
 from core.thumbnail_extractor import ThumbnailExtractor
 from core.image_composer import ImageComposer, CompositionSettings
+from core.unified_processor import UnifiedProcessor
+from core.page_writer import PageWriter
+from core.extraction_bundle import ExtractionBundle
 from utils.file_utils import (
     ensure_directory_exists,
     create_output_directory,
     format_file_size,
-    estimate_processing_time,
-    generate_multi_page_filenames
+    estimate_processing_time
 )
 
 
@@ -128,6 +130,13 @@ Examples:
             help="Position text overlays on thumbnails or above them"
         )
         
+        parser.add_argument(
+            "--layout",
+            choices=["grid", "uniform_cells", "packed"],
+            help="Sheet layout; uniform_cells fits every frame into a fixed 16:9 cell at extraction time, "
+                 "packed bin-packs strips of different heights at native size"
+        )
+        
         parser.add_argument(
             "--no-frame",
             action="store_true",
@@ -147,6 +156,72 @@ Examples:
             help="Maximum rows per image (0=unlimited, creates multiple images if exceeded)"
         )
         
+        parser.add_argument(
+            "--extraction-mode",
+            choices=["seek", "single_pass"],
+            help="Frame extraction mode: seek to each position, or read all positions in one forward pass"
+        )
+        
+        parser.add_argument(
+            "--frame-backend",
+            choices=["opencv", "ffmpeg"],
+            help="Frame source: OpenCV full-resolution decode, or ffmpeg with decode-time downscaling"
+        )
+        
+        parser.add_argument(
+            "--jobs",
+            "-j",
+            type=int,
+            metavar="NUM",
+            help="Number of worker processes for thumbnail extraction (0=one per CPU)"
+        )
+        
+        parser.add_argument(
+            "--page-jobs",
+            type=int,
+            metavar="NUM",
+            help="Number of threads rendering and saving pages concurrently (1=sequential)"
+        )
+        
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Disable the persistent metadata cache, thumbnail cache and scan index"
+        )
+        
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Only process new or changed files and re-render the pages they affect"
+        )
+        
+        parser.add_argument(
+            "--streaming",
+            action="store_true",
+            help="Scan, extract and write pages in one streaming pipeline with bounded memory"
+        )
+        
+        parser.add_argument(
+            "--banded",
+            action="store_true",
+            help="Write PNG contact sheets in horizontal bands without holding the whole image in memory"
+        )
+        
+        parser.add_argument(
+            "--recompose",
+            nargs="?",
+            const="",
+            metavar="BUNDLE",
+            help="Rebuild the contact sheet from a saved extraction bundle without reading the videos "
+                 "(default: the bundle next to the output)"
+        )
+        
+        parser.add_argument(
+            "--no-bundle",
+            action="store_true",
+            help="Do not save the extraction bundle used by --recompose"
+        )
+        
         parser.add_argument(
             "--version",
             action="version",
@@ -197,8 +272,8 @@ Examples:
             config = self.config_manager.load_config()
             
             # Initialize components
-            self.video_scanner = VideoScanner(config.get("supported_extensions"))
-            self.thumbnail_extractor = ThumbnailExtractor()
+            self.video_scanner = self.create_video_scanner(config)
+            self.thumbnail_extractor = self.create_thumbnail_extractor(config)
             
             # Create composition settings from config
             composition_settings = CompositionSettings(
@@ -214,7 +289,8 @@ Examples:
                 frame_color=config.get("frame_color", "#CCCCCC"),
                 frame_thickness=config.get("frame_thickness", 2),
                 frame_padding=config.get("frame_padding", 10),
-                max_rows_per_image=config.get("max_rows_per_image", 0)
+                max_rows_per_image=config.get("max_rows_per_image", 0),
+                layout_mode=config.get("layout_mode", "grid")
             )
             
             self.image_composer = ImageComposer(composition_settings)
@@ -225,6 +301,49 @@ Examples:
             print(f"Error initializing components: {e}")
             return False
     
+    def create_video_scanner(self, config: dict) -> VideoScanner:
+        """
+        Create a video scanner from configuration.
+        
+        Args:
+            config: Configuration dictionary.
+            
+        Returns:
+            Configured VideoScanner instance.
+        """
+        scan_index_dir = None
+        if config.get("scan_index_enabled", True):
+            scan_index_dir = self.config_manager.get_cache_dir(config)
+        
+        return VideoScanner(config.get("supported_extensions"), config.get("scan_workers", 8), scan_index_dir)
+    
+    def create_thumbnail_extractor(self, config: dict) -> ThumbnailExtractor:
+        """
+        Create a thumbnail extractor from configuration.
+        
+        Args:
+            config: Configuration dictionary.
+            
+        Returns:
+            Configured ThumbnailExtractor instance.
+        """
+        metadata_cache_dir = None
+        if config.get("metadata_cache_enabled", True):
+            metadata_cache_dir = self.config_manager.get_cache_dir(config)
+        
+        thumbnail_cache_dir = None
+        if config.get("thumbnail_cache_enabled", True):
+            thumbnail_cache_dir = self.config_manager.get_cache_dir(config)
+        
+        return ThumbnailExtractor(
+            extraction_mode=config.get("extraction_mode", "seek"),
+            frame_backend=config.get("frame_backend", "opencv"),
+            metadata_cache_dir=metadata_cache_dir,
+            thumbnail_cache_dir=thumbnail_cache_dir,
+            thumbnail_cache_max_bytes=config.get("thumbnail_cache_max_mb", 1024) * 1024 * 1024,
+            uniform_cells=config.get("layout_mode", "grid") == "uniform_cells"
+        )
+    
     def apply_cli_overrides(self, args: argparse.Namespace) -> dict:
         """
         Apply command-line argument overrides to configuration.
@@ -274,6 +393,9 @@ Examples:
         if hasattr(args, 'overlay_position') and args.overlay_position:
             config["overlay_position"] = args.overlay_position
         
+        if hasattr(args, 'layout') and args.layout:
+            config["layout_mode"] = args.layout
+        
         if hasattr(args, 'no_frame') and args.no_frame:
             config["show_frame"] = False
         
@@ -286,6 +408,41 @@ Examples:
             else:
                 print("Warning: Max rows must be non-negative (0=unlimited)")
         
+        if hasattr(args, 'extraction_mode') and args.extraction_mode:
+            config["extraction_mode"] = args.extraction_mode
+        
+        if hasattr(args, 'frame_backend') and args.frame_backend:
+            config["frame_backend"] = args.frame_backend
+        
+        if hasattr(args, 'jobs') and args.jobs is not None:
+            if args.jobs >= 0:
+                config["max_workers"] = args.jobs
+            else:
+                print("Warning: Jobs must be non-negative (0=one per CPU)")
+        
+        if hasattr(args, 'page_jobs') and args.page_jobs is not None:
+            if args.page_jobs >= 1:
+                config["page_workers"] = args.page_jobs
+            else:
+                print("Warning: Page jobs must be at least 1")
+        
+        if hasattr(args, 'no_bundle') and args.no_bundle:
+            config["save_extraction_bundle"] = False
+        
+        if hasattr(args, 'no_cache') and args.no_cache:
+            config["metadata_cache_enabled"] = False
+            config["thumbnail_cache_enabled"] = False
+            config["scan_index_enabled"] = False
+        
+        if hasattr(args, 'incremental') and args.incremental:
+            config["incremental_mode"] = True
+        
+        if hasattr(args, 'streaming') and args.streaming:
+            config["streaming_pipeline"] = True
+        
+        if hasattr(args, 'banded') and args.banded:
+            config["banded_output"] = True
+        
         return config
     
     def update_image_composer_settings(self, config: dict) -> None:
@@ -310,7 +467,8 @@ Examples:
                 frame_color=config.get("frame_color", "#CCCCCC"),
                 frame_thickness=config.get("frame_thickness", 2),
                 frame_padding=config.get("frame_padding", 10),
-                max_rows_per_image=config.get("max_rows_per_image", 0)
+                max_rows_per_image=config.get("max_rows_per_image", 0),
+                layout_mode=config.get("layout_mode", "grid")
             )
             
             # Update the image composer with new settings
@@ -413,6 +571,62 @@ Examples:
         print(f"Estimated output image size: {estimated_size[0]}x{estimated_size[1]} pixels")
         print("\n=== END DRY RUN ===")
     
+    def run_unified(self, config: dict, recursive: bool, mode_name: str) -> int:
+        """
+        Run the folder workflow through the unified processor.
+        
+        Used for the incremental and streaming modes, which are implemented
+        by UnifiedProcessor.
+        
+        Args:
+            config: Configuration dictionary with CLI overrides applied.
+            recursive: Whether subdirectories are scanned (these modes always scan recursively).
+            mode_name: Name of the mode for messages.
+            
+        Returns:
+            Exit code (0 for success, non-zero for error).
+        """
+        if not recursive:
+            print(f"Warning: --no-recursive is ignored in {mode_name} mode")
+        
+        print(f"Running in {mode_name} mode...")
+        
+        processor = UnifiedProcessor(self.config_manager)
+        processor.set_log_callback(print)
+        
+        if not processor.process_thumbnails(config):
+            print(f"Error: Processing in {mode_name} mode failed")
+            return 1
+        
+        elapsed_time = time.time() - self.start_time
+        print(f"Total processing time: {elapsed_time:.1f}s")
+        return 0
+    
+    def run_recompose(self, config: dict, bundle_path: str) -> int:
+        """
+        Rebuild the contact sheet from an extraction bundle.
+        
+        Args:
+            config: Configuration dictionary with CLI overrides applied.
+            bundle_path: Bundle to read, or an empty string for the bundle
+                next to the output.
+            
+        Returns:
+            Exit code (0 for success, non-zero for error).
+        """
+        print("Re-composing from extraction bundle...")
+        
+        processor = UnifiedProcessor(self.config_manager)
+        processor.set_log_callback(print)
+        
+        if not processor.recompose_from_bundle(config, bundle_path or None):
+            print("Error: Re-compose failed")
+            return 1
+        
+        elapsed_time = time.time() - self.start_time
+        print(f"Total processing time: {self._format_elapsed_time(elapsed_time)}")
+        return 0
+    
     def run(self, args: Optional[List[str]] = None) -> int:
         """
         Main execution method for the CLI interface.
@@ -440,6 +654,13 @@ Examples:
             
             # Update image composer with overridden settings
             self.update_image_composer_settings(config)
+            self.video_scanner = self.create_video_scanner(config)
+            self.thumbnail_extractor = self.create_thumbnail_extractor(config)
+            
+            # Re-composing needs neither source folders nor videos
+            if parsed_args.recompose is not None:
+                self.start_time = time.time()
+                return self.run_recompose(config, parsed_args.recompose)
             
             # Check for source folders
             source_folders = config.get("source_folders", [])
@@ -457,6 +678,11 @@ Examples:
             self.start_time = time.time()
             recursive = not parsed_args.no_recursive
             
+            if config.get("incremental_mode", False):
+                return self.run_unified(config, recursive, "incremental")
+            if config.get("streaming_pipeline", False):
+                return self.run_unified(config, recursive, "streaming")
+            
             print("Scanning folders...")
             if parsed_args.verbose:
                 for folder in source_folders:
@@ -481,11 +707,16 @@ Examples:
                 accessible_files,
                 positions,
                 config.get("thumbnail_width", 320),
-                self.progress_callback if not parsed_args.verbose else None
+                self.progress_callback if not parsed_args.verbose else None,
+                config.get("max_workers", 1)
             )
             
             print()  # New line after progress bar
             
+            cache_summary = self.thumbnail_extractor.get_cache_summary()
+            if cache_summary:
+                print(cache_summary)
+            
             # Filter successful videos
             successful_videos = [vd for vd in processed_videos if vd.processing_status == "success"]
             failed_videos = len(processed_videos) - len(successful_videos)
@@ -499,34 +730,29 @@ Examples:
             
             print("Composing final image...")
             
-            # Create contact sheet
-            contact_sheet = self.image_composer.create_contact_sheet(successful_videos)
-            
             # Ensure output directory exists
             output_path = config.get("output_path", "output/overview.jpg")
             if not create_output_directory(output_path):
                 print(f"Error: Could not create output directory for {output_path}")
                 return 1
             
-            # Save the contact sheet
-            contact_sheet.save(output_path, quality=95, optimize=True)
-            
-            # Check for additional pages and save them
-            additional_pages = self.image_composer.get_additional_pages()
-            saved_files = [output_path]
-            
-            if additional_pages:
-                # Generate filenames for all pages
-                total_pages = len(additional_pages) + 1  # +1 for the main page
-                all_filenames = generate_multi_page_filenames(output_path, total_pages)
-                
-                # Save additional pages
-                for i, page in enumerate(additional_pages):
-                    page_filename = all_filenames[i + 1]  # Skip first filename (already used)
-                    page.save(page_filename, quality=95, optimize=True)
-                    saved_files.append(page_filename)
-                
-                print(f"Multi-page output: {total_pages} images created")
+            if config.get("save_extraction_bundle", True):
+                bundle = ExtractionBundle(ExtractionBundle.get_bundle_path(output_path))
+                if bundle.save(processed_videos, config):
+                    print(f"Extraction bundle saved to: {bundle.bundle_path}")
+            
+            # Save each page as soon as it is composed
+            writer = PageWriter(output_path, workers=config.get("page_workers", 4), quality=95, optimize=True)
+            saved_files = writer.write_contact_sheets(
+                self.image_composer, successful_videos, config.get("banded_output", False)
+            )
+            
+            if len(saved_files) > 1:
+                print(f"Multi-page output: {len(saved_files)} images created")
+            
+            coverage = writer.get_average_coverage() if config.get("layout_mode", "grid") == "packed" else None
+            if coverage is not None:
+                print(f"Packing efficiency: {coverage:.1%} of page area covered by strips")
             
             # Show completion summary
             elapsed_time = time.time() - self.start_time
@@ -535,7 +761,7 @@ Examples:
             if len(saved_files) == 1:
                 print(f"Contact sheet saved to: {output_path}")
                 print(f"Output size: {format_file_size(total_output_size)}")
-                print(f"Image dimensions: {contact_sheet.size[0]}x{contact_sheet.size[1]} pixels")
+                print(f"Image dimensions: {writer.page_sizes[0][0]}x{writer.page_sizes[0][1]} pixels")
             else:
                 print(f"Contact sheets saved:")
                 for filename in saved_files:
@@ -10,6 +10,8 @@ import os
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
+from utils.file_utils import get_user_cache_dir
+
 
 class ConfigManager:
     """Manages application configuration with JSON file persistence."""
@@ -57,12 +59,31 @@ class ConfigManager:
             "frame_thickness": 2,
             "frame_padding": 10,
             "max_rows_per_image": 0,  # 0 = unlimited (single image)
+            "layout_mode": "grid",  # "grid", "uniform_cells" (fixed 16:9 cells, no strip resampling) or "packed" (bin-packed strips)
+            # Extraction settings
+            "extraction_mode": "seek",  # "seek" or "single_pass"
+            "frame_backend": "opencv",  # "opencv" or "ffmpeg"
+            "max_workers": 1,  # Worker processes for extraction (1 = sequential, 0 = one per CPU)
+            "scan_workers": 8,  # Threads listing directories concurrently (1 = sequential)
+            "page_workers": 4,  # Threads rendering and encoding pages concurrently (1 = sequential)
+            # Cache settings
+            "cache_dir": "",  # Empty = per-user cache directory
+            "metadata_cache_enabled": True,
+            "thumbnail_cache_enabled": True,
+            "scan_index_enabled": True,  # Skip listing directories whose mtime is unchanged
+            "thumbnail_cache_max_mb": 1024,  # LRU budget of the thumbnail cache
+            "incremental_mode": False,  # Only re-render pages whose files or settings changed
+            "streaming_pipeline": False,  # Overlap scanning, extraction and page writing
+            "pipeline_queue_size": 32,  # Max files between scanning and composing in streaming mode
+            "banded_output": False,  # Stream single PNG sheets to disk in horizontal bands
+            "save_extraction_bundle": True,  # Save thumbnails next to the output for re-composing
             # FCPXML-specific settings
             "fcpxml_file_path": "",
             "fcpxml_show_placeholders": True,
             "fcpxml_use_interval_positions": True,
             "fcpxml_placeholder_color": "#F0F0F0",
             "fcpxml_similarity_threshold": 0.6,
+            "fcpxml_resource_metadata": True,  # Skip probing FCPXML-described sources
             # UI state settings
             "basic_settings_expanded": False,
             "last_fcpxml_folder": ""
@@ -111,6 +132,58 @@ class ConfigManager:
             if not isinstance(config["supported_extensions"], list):
                 return False
             
+            if "extraction_mode" in config and config["extraction_mode"] not in ("seek", "single_pass"):
+                return False
+            
+            if "layout_mode" in config and config["layout_mode"] not in ("grid", "uniform_cells", "packed"):
+                return False
+            
+            if "frame_backend" in config and config["frame_backend"] not in ("opencv", "ffmpeg"):
+                return False
+            
+            if "max_workers" in config and (not isinstance(config["max_workers"], int) or config["max_workers"] < 0):
+                return False
+            
+            if "scan_workers" in config and (not isinstance(config["scan_workers"], int) or config["scan_workers"] < 1):
+                return False
+            
+            if "page_workers" in config and (not isinstance(config["page_workers"], int) or config["page_workers"] < 1):
+                return False
+            
+            if "cache_dir" in config and not isinstance(config["cache_dir"], str):
+                return False
+            
+            if "metadata_cache_enabled" in config and not isinstance(config["metadata_cache_enabled"], bool):
+                return False
+            
+            if "thumbnail_cache_enabled" in config and not isinstance(config["thumbnail_cache_enabled"], bool):
+                return False
+            
+            if "scan_index_enabled" in config and not isinstance(config["scan_index_enabled"], bool):
+                return False
+            
+            if "incremental_mode" in config and not isinstance(config["incremental_mode"], bool):
+                return False
+            
+            if "streaming_pipeline" in config and not isinstance(config["streaming_pipeline"], bool):
+                return False
+            
+            if "banded_output" in config and not isinstance(config["banded_output"], bool):
+                return False
+            
+            if "save_extraction_bundle" in config and not isinstance(config["save_extraction_bundle"], bool):
+                return False
+            
+            if "pipeline_queue_size" in config and (
+                not isinstance(config["pipeline_queue_size"], int) or config["pipeline_queue_size"] < 1
+            ):
+                return False
+            
+            if "thumbnail_cache_max_mb" in config and (
+                not isinstance(config["thumbnail_cache_max_mb"], int) or config["thumbnail_cache_max_mb"] < 0
+            ):
+                return False
+            
             # Validate FCPXML-specific settings if present
             if "fcpxml_file_path" in config and not isinstance(config["fcpxml_file_path"], str):
                 return False
@@ -122,6 +195,9 @@ class ConfigManager:
             if "fcpxml_use_interval_positions" in config and not isinstance(config["fcpxml_use_interval_positions"], bool):
                 return False
             
+            if "fcpxml_resource_metadata" in config and not isinstance(config["fcpxml_resource_metadata"], bool):
+                return False
+            
             if "fcpxml_similarity_threshold" in config:
                 threshold = config["fcpxml_similarity_threshold"]
                 if not isinstance(threshold, (int, float)) or not (0.0 <= threshold <= 1.0):
@@ -198,6 +274,20 @@ class ConfigManager:
         
         return os.path.exists(fcpxml_path) and os.path.isfile(fcpxml_path)
     
+    def get_cache_dir(self, config: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Get the directory used for persistent caches.
+        
+        Args:
+            config: Configuration dictionary to read from. If None, uses current config.
+            
+        Returns:
+            Configured cache directory, or the per-user cache directory if unset.
+        """
+        config = config if config is not None else self._config
+        cache_dir = config.get('cache_dir', '')
+        return cache_dir if cache_dir else get_user_cache_dir()
+    
     def get_timeline_config(self) -> Dict[str, Any]:
         """
         Get timeline-specific configuration settings.
@@ -210,7 +300,8 @@ class ConfigManager:
             'fcpxml_show_placeholders': self._config.get('fcpxml_show_placeholders', True),
             'fcpxml_use_interval_positions': self._config.get('fcpxml_use_interval_positions', True),
             'fcpxml_placeholder_color': self._config.get('fcpxml_placeholder_color', '#F0F0F0'),
-            'fcpxml_similarity_threshold': self._config.get('fcpxml_similarity_threshold', 0.6)
+            'fcpxml_similarity_threshold': self._config.get('fcpxml_similarity_threshold', 0.6),
+            'fcpxml_resource_metadata': self._config.get('fcpxml_resource_metadata', True)
         }
     
     def save_config(self, config: Optional[Dict[str, Any]] = None) -> bool:
@@ -398,8 +489,8 @@ class ConfigManager:
             else:
                 # Validate file extension
                 file_extension = Path(fcpxml_path).suffix.lower()
-                if file_extension not in ['.fcpxml']:
-                    errors.append(f"Unsupported file format: {file_extension}. Supported formats: .fcpxml")
+                if file_extension not in ['.fcpxml', '.edl']:
+                    errors.append(f"Unsupported file format: {file_extension}. Supported formats: .fcpxml, .edl")
         
         # Check similarity threshold
         threshold = timeline_config['fcpxml_similarity_threshold']
@@ -426,7 +517,7 @@ class ConfigManager:
                 # Remove FCPXML-specific keys
                 fcpxml_keys = ['fcpxml_file_path', 'fcpxml_show_placeholders', 
                               'fcpxml_use_interval_positions', 'fcpxml_placeholder_color', 
-                              'fcpxml_similarity_threshold']
+                              'fcpxml_similarity_threshold', 'fcpxml_resource_metadata']
                 for key in fcpxml_keys:
                     template_config.pop(key, None)
             
@@ -0,0 +1,306 @@
+"""
+Deep Zoom writer module for the Footage Thumbnailer application.
+
+This module writes contact sheets as Deep Zoom Image (DZI) tile pyramids with
+a small static HTML viewer, so very large sheets can be browsed smoothly. The
+pyramid is built from horizontal bands of the sheet; no zoom level is ever
+held in memory as a whole.
+"""
+
+import html
+import json
+import math
+import os
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from PIL import Image
+
+
+VIEWER_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>__TITLE__</title>
+<style>
+  html, body { margin: 0; height: 100%; overflow: hidden; background: #333; font-family: sans-serif; }
+  #viewer { position: absolute; inset: 0; cursor: grab; }
+  #viewer img { position: absolute; user-select: none; -webkit-user-drag: none; }
+  #help { position: absolute; left: 8px; bottom: 8px; color: #ddd; font-size: 12px; }
+</style>
+</head>
+<body>
+<div id="viewer"></div>
+<div id="help">Drag to pan, scroll to zoom, double-click to fit</div>
+<script>
+const dzi = __DZI__;
+const viewer = document.getElementById("viewer");
+const maxLevel = Math.ceil(Math.log2(Math.max(dzi.width, dzi.height)));
+let scale = 1, offsetX = 0, offsetY = 0, drag = null;
+const tiles = new Map();
+
+function fit() {
+  scale = Math.min(viewer.clientWidth / dzi.width, viewer.clientHeight / dzi.height, 1);
+  offsetX = (viewer.clientWidth - dzi.width * scale) / 2;
+  offsetY = Math.max(0, (viewer.clientHeight - dzi.height * scale) / 2);
+  render();
+}
+
+function render() {
+  const level = Math.max(0, Math.min(maxLevel, maxLevel + Math.ceil(Math.log2(scale))));
+  const factor = Math.pow(2, maxLevel - level);
+  const levelWidth = Math.ceil(dzi.width / factor), levelHeight = Math.ceil(dzi.height / factor);
+  const tilePixels = dzi.tileSize * factor * scale;
+  const firstCol = Math.max(0, Math.floor(-offsetX / tilePixels));
+  const firstRow = Math.max(0, Math.floor(-offsetY / tilePixels));
+  const lastCol = Math.min(Math.ceil(levelWidth / dzi.tileSize) - 1, Math.floor((viewer.clientWidth - offsetX) / tilePixels));
+  const lastRow = Math.min(Math.ceil(levelHeight / dzi.tileSize) - 1, Math.floor((viewer.clientHeight - offsetY) / tilePixels));
+  const visible = new Set();
+  for (let row = firstRow; row <= lastRow; row++) {
+    for (let col = firstCol; col <= lastCol; col++) {
+      const key = level + "/" + col + "_" + row;
+      visible.add(key);
+      let img = tiles.get(key);
+      if (!img) {
+        img = document.createElement("img");
+        img.src = dzi.tilesUrl + key + "." + dzi.format;
+        tiles.set(key, img);
+        viewer.appendChild(img);
+      }
+      img.style.left = (offsetX + col * tilePixels) + "px";
+      img.style.top = (offsetY + row * tilePixels) + "px";
+      img.style.width = (Math.min(dzi.tileSize, levelWidth - col * dzi.tileSize) * factor * scale) + "px";
+      img.style.height = (Math.min(dzi.tileSize, levelHeight - row * dzi.tileSize) * factor * scale) + "px";
+    }
+  }
+  for (const [key, img] of tiles) {
+    if (!visible.has(key)) { img.remove(); tiles.delete(key); }
+  }
+}
+
+viewer.addEventListener("mousedown", e => { drag = [e.clientX - offsetX, e.clientY - offsetY]; viewer.style.cursor = "grabbing"; });
+window.addEventListener("mouseup", () => { drag = null; viewer.style.cursor = "grab"; });
+window.addEventListener("mousemove", e => { if (drag) { offsetX = e.clientX - drag[0]; offsetY = e.clientY - drag[1]; render(); } });
+viewer.addEventListener("wheel", e => {
+  e.preventDefault();
+  const zoom = Math.exp(-e.deltaY * 0.002);
+  const newScale = Math.min(4, Math.max(0.001, scale * zoom));
+  offsetX = e.clientX - (e.clientX - offsetX) * newScale / scale;
+  offsetY = e.clientY - (e.clientY - offsetY) * newScale / scale;
+  scale = newScale;
+  render();
+}, { passive: false });
+viewer.addEventListener("dblclick", fit);
+window.addEventListener("resize", render);
+fit();
+</script>
+</body>
+</html>
+"""
+
+
+class _PyramidLevel:
+    """Row buffer of one pyramid level that cuts full tile rows into tiles."""
+
+    def __init__(self, level: int, width: int, tile_size: int):
+        """
+        Initialize the level.
+
+        Args:
+            level: Level number (the full-resolution level is the highest).
+            width: Width of the level in pixels.
+            tile_size: Tile edge length in pixels.
+        """
+        self.level = level
+        self.width = width
+        self.tile_size = tile_size
+        self.buffer: Optional[Image.Image] = None
+        self.filled = 0
+        self.tile_row = 0
+
+
+class DziWriter:
+    """Writes a Deep Zoom tile pyramid and viewer from the bands of a sheet."""
+
+    def __init__(self, output_path: str, tile_size: int = 256, tile_format: str = "jpg", quality: int = 90):
+        """
+        Initialize the writer.
+
+        Args:
+            output_path: Path of the .dzi descriptor. Tiles go to "<stem>_files"
+                and the viewer to "<stem>.html" next to it.
+            tile_size: Tile edge length in pixels.
+            tile_format: Tile file format ("jpg" or "png").
+            quality: JPEG quality of the tiles.
+        """
+        self.output_path = output_path
+        self.tile_size = tile_size
+        self.tile_format = tile_format
+        self.quality = quality
+
+        path = Path(output_path)
+        self.tiles_dir = str(path.parent / f"{path.stem}_files")
+        self.viewer_path = str(path.parent / f"{path.stem}.html")
+
+    @staticmethod
+    def get_max_level(width: int, height: int) -> int:
+        """
+        Get the number of the full-resolution level of a pyramid.
+
+        Args:
+            width: Image width.
+            height: Image height.
+
+        Returns:
+            Highest level number; level 0 is 1x1 pixels.
+        """
+        return max(0, math.ceil(math.log2(max(width, height, 1))))
+
+    def write(self, size: Tuple[int, int], bands: Iterable[Image.Image]) -> str:
+        """
+        Write the pyramid of an image given as horizontal bands.
+
+        Each level keeps at most one tile row in memory. Full tile rows are
+        cut into tiles and passed on to the next lower level at half size.
+
+        Args:
+            size: (width, height) of the image.
+            bands: RGB images as wide as the image, top to bottom.
+
+        Returns:
+            Path of the .dzi descriptor.
+        """
+        width, height = size
+        max_level = self.get_max_level(width, height)
+
+        levels = []
+        level_width = width
+        for level in range(max_level, -1, -1):
+            levels.append(_PyramidLevel(level, level_width, self.tile_size))
+            level_width = (level_width + 1) // 2
+
+        for band in bands:
+            self._add_rows(levels, 0, band)
+            del band
+        self._flush(levels, 0)
+
+        Path(self.output_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(self.output_path, 'w', encoding='utf-8') as f:
+            f.write(self._get_descriptor(width, height))
+        self._write_viewer(width, height)
+
+        return self.output_path
+
+    def write_image(self, image: Image.Image) -> str:
+        """
+        Write the pyramid of a complete image.
+
+        Args:
+            image: Image to tile.
+
+        Returns:
+            Path of the .dzi descriptor.
+        """
+        return self.write(image.size, [image.convert('RGB')])
+
+    def _add_rows(self, levels: List[_PyramidLevel], index: int, rows: Image.Image) -> None:
+        """
+        Append rows to a level, emitting every tile row that fills up.
+
+        Args:
+            levels: All pyramid levels, full resolution first.
+            index: Index of the level in levels.
+            rows: Rows to append, as wide as the level.
+        """
+        level = levels[index]
+        top = 0
+        while top < rows.height:
+            if level.buffer is None:
+                level.buffer = Image.new('RGB', (level.width, self.tile_size))
+                level.filled = 0
+            count = min(self.tile_size - level.filled, rows.height - top)
+            level.buffer.paste(rows.crop((0, top, rows.width, top + count)), (0, level.filled))
+            level.filled += count
+            top += count
+            if level.filled == self.tile_size:
+                self._emit_tile_row(levels, index)
+
+    def _flush(self, levels: List[_PyramidLevel], index: int) -> None:
+        """
+        Emit the partial last tile row of a level and of all lower levels.
+
+        Args:
+            levels: All pyramid levels, full resolution first.
+            index: Index of the first level to flush.
+        """
+        for i in range(index, len(levels)):
+            if levels[i].buffer is not None and levels[i].filled:
+                self._emit_tile_row(levels, i)
+
+    def _emit_tile_row(self, levels: List[_PyramidLevel], index: int) -> None:
+        """
+        Write the buffered tile row of a level and pass it down at half size.
+
+        Args:
+            levels: All pyramid levels, full resolution first.
+            index: Index of the level in levels.
+        """
+        level = levels[index]
+        tile_row = level.buffer.crop((0, 0, level.width, level.filled)) if level.filled < self.tile_size else level.buffer
+        level.buffer = None
+
+        level_dir = os.path.join(self.tiles_dir, str(level.level))
+        os.makedirs(level_dir, exist_ok=True)
+        for col, left in enumerate(range(0, level.width, self.tile_size)):
+            tile = tile_row.crop((left, 0, min(left + self.tile_size, level.width), tile_row.height))
+            tile_path = os.path.join(level_dir, f"{col}_{level.tile_row}.{self.tile_format}")
+            if self.tile_format == "jpg":
+                tile.save(tile_path, format="JPEG", quality=self.quality)
+            else:
+                tile.save(tile_path, format=self.tile_format.upper())
+        level.tile_row += 1
+
+        if index + 1 < len(levels):
+            # Tile rows start at even offsets, so 2x2 box reduction of each
+            # row equals reducing the whole level
+            self._add_rows(levels, index + 1, tile_row.reduce(2))
+
+    def _get_descriptor(self, width: int, height: int) -> str:
+        """
+        Build the DZI XML descriptor.
+
+        Args:
+            width: Image width.
+            height: Image height.
+
+        Returns:
+            Descriptor XML text.
+        """
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<Image xmlns="http://schemas.microsoft.com/deepzoom/2008" '
+            f'TileSize="{self.tile_size}" Overlap="0" Format="{self.tile_format}">\n'
+            f'  <Size Width="{width}" Height="{height}"/>\n'
+            '</Image>\n'
+        )
+
+    def _write_viewer(self, width: int, height: int) -> None:
+        """
+        Write the static HTML viewer next to the descriptor.
+
+        Args:
+            width: Image width.
+            height: Image height.
+        """
+        settings = {
+            "width": width,
+            "height": height,
+            "tileSize": self.tile_size,
+            "format": self.tile_format,
+            "tilesUrl": f"{Path(self.tiles_dir).name}/",
+        }
+        page = (VIEWER_TEMPLATE
+                .replace("__TITLE__", html.escape(Path(self.output_path).stem))
+                .replace("__DZI__", json.dumps(settings)))
+        with open(self.viewer_path, 'w', encoding='utf-8') as f:
+            f.write(page)
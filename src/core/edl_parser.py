@@ -0,0 +1,238 @@
+"""
+EDL parser for the Footage Thumbnailer application.
+
+This module handles parsing of Samplitude EDL files (as written by Samplitude,
+VEGAS and MAGIX Video deluxe) and extracting video file references for
+timeline-based thumbnail generation.
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Any
+
+from .timeline_data_models import TimelineEntry
+
+
+# Sample rate assumed when the header does not state one
+DEFAULT_SAMPLE_RATE = 48000
+
+# Header line stating the sample rate all positions are counted in
+SAMPLE_RATE_PATTERN = re.compile(r'^Sample Rate:\s*(\d+)')
+
+# Start of the source table, e.g. 'Source Table Entries: 610'
+SOURCE_TABLE_PATTERN = re.compile(r'^Source Table Entries:\s*(\d+)')
+
+# Source table row: ID, quoted file path, media type
+SOURCE_PATTERN = re.compile(r'^\s*(\d+)\s+"([^"]*)"\s+(\w+)')
+
+# Start of a track table, e.g. 'Track 1: "Track:" Solo: 0 Mute: 0'
+TRACK_PATTERN = re.compile(r'^Track\s+(\d+):')
+
+# Track table row: source ID, track, Play-In, Play-Out, Record-In, Record-Out (in samples)
+CLIP_PATTERN = re.compile(r'^\s*(\d+)\s+(\d+)\s+(-?\d+)\s+(-?\d+)\s+(-?\d+)\s+(-?\d+)\s')
+
+
+class EDLParser:
+    """Parser for Samplitude EDL file format."""
+
+    def __init__(self):
+        """Initialize the EDL parser."""
+        self._reset_state()
+
+    def _reset_state(self):
+        """Reset parser state for new file."""
+        self.entries = []
+        self.sample_rate = DEFAULT_SAMPLE_RATE
+        # File paths of the VIDEO sources by source ID
+        self.sources: Dict[int, str] = {}
+        self.source_count = 0
+        self.line_number = 0
+
+    def parse_edl_file(self, file_path: str) -> List[TimelineEntry]:
+        """
+        Parse an EDL file and extract video entries.
+
+        The file is read line by line. Play-In/Play-Out are positions on the
+        timeline and Record-In/Record-Out positions within the source file,
+        all counted in samples at the header's sample rate.
+
+        Args:
+            file_path: Path to the EDL file.
+
+        Returns:
+            List of TimelineEntry objects in timeline order.
+
+        Raises:
+            FileNotFoundError: If the EDL file doesn't exist.
+            ValueError: If the EDL file format is unsupported or malformed.
+        """
+        file_path = Path(file_path)
+
+        if not file_path.exists():
+            raise FileNotFoundError(f"EDL file not found: {file_path}")
+
+        if not file_path.is_file():
+            raise ValueError(f"Path is not a file: {file_path}")
+
+        self._reset_state()
+
+        try:
+            with open(file_path, 'r', encoding='utf-8-sig', errors='replace') as f:
+                header = f.readline()
+                self.line_number = 1
+                if not header.startswith('Samplitude EDL File Format'):
+                    raise ValueError("Invalid EDL file format")
+
+                self._parse_lines(f)
+
+            # Tracks are listed one after another - bring clips into timeline order
+            self.entries.sort(key=lambda entry: entry.start_time)
+            for source_id, entry in enumerate(self.entries, 1):
+                entry.source_id = source_id
+
+            return self.normalize_file_paths(self.entries)
+
+        except OSError as e:
+            raise ValueError(f"Error reading EDL file {file_path}: {e}")
+        except ValueError as e:
+            raise ValueError(f"Error parsing EDL file {file_path} (line {self.line_number}): {e}")
+
+    def _parse_lines(self, lines) -> None:
+        """
+        Parse the source table and track tables from the remaining lines.
+
+        Args:
+            lines: Iterable of text lines after the header.
+        """
+        sources_left = 0
+        track = None
+
+        for line in lines:
+            self.line_number += 1
+
+            if sources_left:
+                match = SOURCE_PATTERN.match(line)
+                if match:
+                    sources_left -= 1
+                    source_id, path, media_type = match.groups()
+                    if media_type.upper() == "VIDEO":
+                        self.sources[int(source_id)] = path
+                    continue
+                sources_left = 0
+
+            if track is not None:
+                match = CLIP_PATTERN.match(line)
+                if match:
+                    self._add_clip(track, *(int(value) for value in match.groups()))
+                    continue
+                if line.startswith('#') or not line.strip():
+                    continue
+                # Volume, pan and marker tables follow the tracks
+                track = None
+
+            match = TRACK_PATTERN.match(line)
+            if match:
+                track = int(match.group(1))
+                continue
+
+            match = SOURCE_TABLE_PATTERN.match(line)
+            if match:
+                sources_left = self.source_count = int(match.group(1))
+                continue
+
+            match = SAMPLE_RATE_PATTERN.match(line)
+            if match and int(match.group(1)) > 0:
+                self.sample_rate = int(match.group(1))
+
+    def _add_clip(self, track: int, source_id: int, clip_track: int, play_in: int, play_out: int,
+                  record_in: int, record_out: int) -> None:
+        """
+        Add a track table row as a timeline entry if it shows a video source.
+
+        Args:
+            track: Number of the track table the row belongs to.
+            source_id: Source table ID of the clip's file.
+            clip_track: Track number stated in the row.
+            play_in: Timeline start in samples.
+            play_out: Timeline end in samples.
+            record_in: Start within the source file in samples.
+            record_out: End within the source file in samples.
+        """
+        file_path = self.sources.get(source_id)
+        if file_path is None:
+            # Audio source or unknown ID
+            return
+
+        rate = float(self.sample_rate)
+        self.entries.append(TimelineEntry(
+            source_id=source_id,
+            file_path=file_path,
+            media_type="VIDEO",
+            # Timeline positioning (when in sequence)
+            start_time=play_in / rate,
+            end_time=play_out / rate,
+            # Clip positioning (within original footage)
+            clip_start_time=record_in / rate,
+            clip_end_time=record_out / rate,
+            track_info={"track": clip_track or track, "edl_source_id": source_id}
+        ))
+
+    def extract_video_entries(self, entries: List[TimelineEntry]) -> List[TimelineEntry]:
+        """
+        Filter entries to only include video entries.
+
+        Args:
+            entries: List of all EDL entries.
+
+        Returns:
+            List of video entries only.
+        """
+        return [entry for entry in entries if entry.media_type.upper() == "VIDEO"]
+
+    def normalize_file_paths(self, entries: List[TimelineEntry]) -> List[TimelineEntry]:
+        """
+        Normalize file paths in EDL entries.
+
+        EDL files written on Windows use backslashes, which are converted to
+        forward slashes as in FCPXML entries.
+
+        Args:
+            entries: List of EDL entries to normalize.
+
+        Returns:
+            List of entries with normalized file paths.
+        """
+        for entry in entries:
+            entry.file_path = os.path.normpath(entry.file_path.replace('\\', '/')).replace('\\', '/')
+        return entries
+
+    def get_unique_files(self, entries: List[TimelineEntry]) -> List[str]:
+        """
+        Get unique file paths from EDL entries.
+
+        Args:
+            entries: List of EDL entries.
+
+        Returns:
+            List of unique file paths.
+        """
+        return sorted({entry.file_path for entry in entries})
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get parsing statistics.
+
+        Returns:
+            Dictionary containing parsing statistics.
+        """
+        unique_files = self.get_unique_files(self.entries)
+
+        return {
+            "source_table_entries": self.source_count,
+            "video_sources": len(self.sources),
+            "total_entries": len(self.entries),
+            "video_entries": len(self.entries),
+            "unique_files": len(unique_files),
+            "unique_file_paths": unique_files
+        }
@@ -0,0 +1,169 @@
+"""
+Extraction bundle module for the Footage Thumbnailer application.
+
+This module saves extraction results (video metadata and thumbnail pixels) as
+a zip archive next to the output, so that a contact sheet can be re-composed
+with different layout settings without reading the source videos again.
+"""
+
+import io
+import json
+import os
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from PIL import Image
+
+from core.thumbnail_extractor import ThumbnailData, VideoData, VideoMetadata
+from core.video_scanner import VideoFile
+
+
+# Configuration keys that determine the extracted thumbnails
+EXTRACTION_SETTINGS_KEYS = (
+    "positions",
+    "thumbnail_width",
+    "extraction_mode",
+    "frame_backend",
+    "layout_mode",
+)
+
+# Timeline attributes attached to VideoData objects in FCPXML mode
+TIMELINE_ATTRIBUTES = (
+    "source_id",
+    "start_time",
+    "end_time",
+    "clip_start_time",
+    "clip_end_time",
+    "is_placeholder",
+)
+
+
+class ExtractionBundle:
+    """Zip archive of the videos and thumbnails of an extraction run."""
+
+    VERSION = 1
+    INDEX_NAME = "bundle.json"
+
+    def __init__(self, bundle_path: str):
+        """
+        Initialize the bundle.
+
+        Args:
+            bundle_path: Path of the bundle zip file.
+        """
+        self.bundle_path = bundle_path
+        # Extraction settings of the run that wrote the bundle
+        self.settings: Dict[str, Any] = {}
+
+    @staticmethod
+    def get_bundle_path(output_path: str) -> str:
+        """
+        Get the bundle path belonging to an output image.
+
+        Args:
+            output_path: Output path of the contact sheet.
+
+        Returns:
+            Bundle path next to the output (e.g. "output/overview.bundle.zip").
+        """
+        path = Path(output_path)
+        return str(path.parent / f"{path.stem}.bundle.zip")
+
+    def save(self, video_data_list: List[VideoData], config: Dict[str, Any]) -> bool:
+        """
+        Write the videos and their thumbnails to the bundle.
+
+        Thumbnails are stored as PNG files, so re-composed sheets are
+        pixel-identical to sheets built from a fresh extraction.
+
+        Args:
+            video_data_list: Video data objects in sheet order.
+            config: Configuration the videos were extracted with.
+
+        Returns:
+            True if the bundle was saved, False otherwise.
+        """
+        self.settings = {key: config.get(key) for key in EXTRACTION_SETTINGS_KEYS}
+        videos = []
+        temp_path = f"{self.bundle_path}.tmp"
+
+        try:
+            Path(self.bundle_path).parent.mkdir(parents=True, exist_ok=True)
+            with zipfile.ZipFile(temp_path, 'w') as archive:
+                for video_index, video_data in enumerate(video_data_list):
+                    entry = video_data.to_dict()
+                    entry["timeline"] = {
+                        name: getattr(video_data, name)
+                        for name in TIMELINE_ATTRIBUTES if hasattr(video_data, name)
+                    }
+
+                    for thumbnail_index, (thumbnail, thumbnail_entry) in enumerate(
+                        zip(video_data.thumbnails, entry["thumbnails"])
+                    ):
+                        name = f"thumbnails/{video_index:06d}_{thumbnail_index:03d}.png"
+                        buffer = io.BytesIO()
+                        thumbnail.image.save(buffer, format='PNG', compress_level=1)
+                        # PNG data is already compressed
+                        archive.writestr(name, buffer.getvalue(), zipfile.ZIP_STORED)
+                        thumbnail_entry["image"] = name
+
+                    videos.append(entry)
+
+                index = {"version": self.VERSION, "settings": self.settings, "videos": videos}
+                archive.writestr(self.INDEX_NAME, json.dumps(index, indent=1), zipfile.ZIP_DEFLATED)
+
+            os.replace(temp_path, self.bundle_path)
+            return True
+
+        except (OSError, ValueError, TypeError) as e:
+            print(f"Error saving extraction bundle {self.bundle_path}: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return False
+
+    def load(self) -> Optional[List[VideoData]]:
+        """
+        Read the videos and their thumbnails from the bundle.
+
+        Returns:
+            Video data objects in sheet order, or None if the bundle is
+            missing or unreadable.
+        """
+        try:
+            with zipfile.ZipFile(self.bundle_path, 'r') as archive:
+                index = json.loads(archive.read(self.INDEX_NAME))
+                if index.get("version") != self.VERSION:
+                    print(f"Warning: Unsupported extraction bundle version in {self.bundle_path}")
+                    return None
+
+                video_data_list = []
+                for entry in index["videos"]:
+                    thumbnails = []
+                    for thumbnail_entry in entry["thumbnails"]:
+                        with Image.open(io.BytesIO(archive.read(thumbnail_entry["image"]))) as image:
+                            image.load()
+                            thumbnails.append(ThumbnailData.from_dict(thumbnail_entry, image.convert('RGB')))
+
+                    video_data = VideoData(
+                        file=VideoFile.from_dict(entry["file"]),
+                        metadata=VideoMetadata.from_dict(entry["metadata"]),
+                        thumbnails=thumbnails,
+                        processing_status=entry["processing_status"],
+                        error_message=entry.get("error_message")
+                    )
+                    for name, value in entry.get("timeline", {}).items():
+                        setattr(video_data, name, value)
+                    video_data_list.append(video_data)
+
+            self.settings = dict(index.get("settings", {}))
+            return video_data_list
+
+        except FileNotFoundError:
+            print(f"Error: Extraction bundle not found: {self.bundle_path}")
+            return None
+        except (OSError, ValueError, KeyError, TypeError, zipfile.BadZipFile) as e:
+            print(f"Error: Unreadable extraction bundle {self.bundle_path}: {e}")
+            return None
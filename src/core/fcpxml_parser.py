@@ -8,16 +8,38 @@ for timeline-based thumbnail generation.
 import os
 import re
 import urllib.parse
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
 from xml.etree import ElementTree as ET
 
-from .timeline_data_models import TimelineEntry, TimelineVideoMatch
+from .timeline_data_models import TimelineEntry, TimelineResource, TimelineVideoMatch
 
 
 # FCPXMLEntry is now simply an alias for TimelineEntry
 FCPXMLEntry = TimelineEntry
 
+# Timeline elements that can hold media or other story elements
+STORY_ELEMENTS = {
+    'spine', 'asset-clip', 'clip', 'video', 'ref-clip', 'mc-clip', 'sync-clip',
+    'gap', 'title', 'transition'
+}
+
+
+@dataclass(frozen=True)
+class _ClipSpan:
+    """Part of a media file shown on a timeline."""
+    resource: TimelineResource
+    start_time: float
+    duration: float
+    # Position of start_time within the media, in seconds
+    clip_start_time: float
+    
+    @property
+    def end_time(self) -> float:
+        """Timeline time at which the span ends."""
+        return self.start_time + self.duration
+
 
 class FCPXMLParser:
     """Parser for FCPXML file format."""
@@ -29,7 +51,11 @@ class FCPXMLParser:
     def _reset_state(self):
         """Reset parser state for new file."""
         self.entries = []
-        self.resources = {}
+        self.formats: Dict[str, Dict[str, Any]] = {}
+        self.resources: Dict[str, TimelineResource] = {}
+        # Compound and multicam media elements, kept until the timeline is parsed
+        self.media: Dict[str, ET.Element] = {}
+        self._media_spans: Dict[Tuple[Optional[str], Optional[str]], List[_ClipSpan]] = {}
         self.line_number = 0
     
     def parse_fcpxml_file(self, file_path: str) -> List[TimelineEntry]:
@@ -57,19 +83,8 @@ class FCPXMLParser:
         self._reset_state()
         
         try:
-            # Parse the XML file
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            
-            # Check if it's a valid FCPXML file
-            if root.tag != 'fcpxml':
-                raise ValueError("Invalid FCPXML file format")
-            
-            # Parse resources section to get file paths
-            self._parse_resources(root)
-            
-            # Parse timeline to get video entries
-            self._parse_timeline(root)
+            # Stream the document instead of building the whole tree
+            self._parse_stream(file_path)
             
             # Extract and normalize video entries
             video_entries = self.extract_video_entries(self.entries)
@@ -80,88 +95,334 @@ class FCPXMLParser:
         except Exception as e:
             raise ValueError(f"Error parsing FCPXML file {file_path}: {e}")
     
-    def _parse_resources(self, root: ET.Element) -> None:
+    def _parse_stream(self, file_path: Path) -> None:
         """
-        Parse the resources section of FCPXML file.
+        Parse resources and the timeline while streaming the document.
+        
+        Each element is dropped as soon as it has been handled, so memory
+        stays flat however many events, keyword collections or metadata
+        blocks a library export contains. Only the subtree of the timeline
+        sequence is kept until it is complete, and compound and multicam
+        media until the timeline has been parsed.
         
         Args:
-            root: Root element of the FCPXML document.
+            file_path: Path to the FCPXML file.
+            
+        Raises:
+            ValueError: If the root element is not fcpxml.
         """
-        resources_elem = root.find('resources')
-        if resources_elem is None:
+        # Open elements, root first
+        elements: List[ET.Element] = []
+        sequence = None
+        pending_sequence = None
+        sequence_found = False
+        resources_parsed = False
+        
+        for event, elem in ET.iterparse(str(file_path), events=('start', 'end')):
+            if event == 'start':
+                if not elements and elem.tag != 'fcpxml':
+                    raise ValueError("Invalid FCPXML file format")
+                if (elem.tag == 'sequence' and not sequence_found
+                        and (len(elements) < 2 or elements[1].tag != 'resources')):
+                    # Only the first sequence outside the resources is the timeline
+                    sequence = elem
+                    sequence_found = True
+                elements.append(elem)
+                continue
+            
+            elements.pop()
+            if not elements:
+                break
+            parent = elements[-1]
+            
+            if sequence is not None and elem is not sequence:
+                # Part of the timeline - handled once the sequence is complete
+                continue
+            if len(elements) > 2 and elements[1].tag == 'resources':
+                # Part of a resource - handled with it
+                continue
+            
+            if len(elements) == 2 and parent.tag == 'resources':
+                if elem.tag == 'format':
+                    self._parse_format(elem)
+                elif elem.tag == 'asset':
+                    self._parse_asset(elem)
+                elif elem.tag == 'media' and elem.get('id'):
+                    # Compound and multicam clips are expanded from the timeline
+                    self.media[elem.get('id')] = elem
+                    continue
+            elif len(elements) == 1 and elem.tag == 'resources':
+                self._apply_formats()
+                resources_parsed = True
+            elif elem is sequence:
+                sequence = None
+                if not resources_parsed:
+                    # Clips can only be resolved once the resources are known
+                    pending_sequence = elem
+                    continue
+                self._parse_sequence(elem)
+            
+            elem.clear()
+            parent.remove(elem)
+        
+        if pending_sequence is not None:
+            self._parse_sequence(pending_sequence)
+    
+    def _parse_format(self, format_elem: ET.Element) -> None:
+        """
+        Parse a format resource.
+        
+        Args:
+            format_elem: FCPXML format element.
+        """
+        format_id = format_elem.get('id')
+        if not format_id:
             return
         
-        # Process each asset in resources
-        for asset in resources_elem.findall('asset'):
-            asset_id = asset.get('id')
-            if asset_id:
-                # Extract file path from src attribute
-                src_url = asset.get('src')
-                if src_url:
-                    # Convert file:// URL to local path
-                    local_path = self._convert_file_url_to_path(src_url)
-                    if local_path:
-                        self.resources[asset_id] = local_path
+        frame_duration = self._parse_time_attribute(format_elem.get('frameDuration'))
+        self.formats[format_id] = {
+            "width": self._parse_int_attribute(format_elem.get('width')),
+            "height": self._parse_int_attribute(format_elem.get('height')),
+            "fps": 1.0 / frame_duration if frame_duration else None
+        }
     
-    def _parse_timeline(self, root: ET.Element) -> None:
+    def _parse_asset(self, asset: ET.Element) -> None:
         """
-        Parse the timeline section of FCPXML file.
+        Parse an asset resource into a resource record.
+        
+        The video format is filled in by _apply_formats() once all formats
+        are known.
         
         Args:
-            root: Root element of the FCPXML document.
+            asset: FCPXML asset element.
         """
-        # Find the sequence in the project
-        sequence = root.find('.//sequence')
-        if sequence is None:
+        asset_id = asset.get('id')
+        if not asset_id:
             return
         
-        # Find all asset clips in the spine
-        spine = sequence.find('spine')
-        if spine is None:
+        # Extract file path from src attribute (media-rep element since FCPXML 1.9)
+        src_url = asset.get('src')
+        if not src_url:
+            media_rep = asset.find("media-rep[@kind='original-media']")
+            src_url = media_rep.get('src') if media_rep is not None else None
+        if not src_url:
             return
         
-        source_id = 1
-        cumulative_offset = 0.0  # Keep track of cumulative time for proper start times
-        
-        for asset_clip in spine.findall('asset-clip'):
-            ref_id = asset_clip.get('ref')
-            if ref_id and ref_id in self.resources:
-                # Get the file path from resources
-                file_path = self.resources[ref_id]
-                
-                # Extract timing information
-                # These are timeline positions (when in timeline)
-                timeline_offset = self._parse_time_attribute(asset_clip.get('offset', '0s'))
-                timeline_duration = self._parse_time_attribute(asset_clip.get('duration', '0s'))
-                
-                # These are positions within the original footage
-                clip_start = self._parse_time_attribute(asset_clip.get('start', '0s'))
-                
-                # Calculate timeline start and end times
-                start_time = timeline_offset if timeline_offset is not None else cumulative_offset
-                end_time = start_time + timeline_duration if start_time is not None and timeline_duration is not None else None
-                
-                # Calculate clip end time
-                clip_end = clip_start + timeline_duration if clip_start is not None and timeline_duration is not None else None
-                
-                # Update cumulative offset for next clip
-                if start_time is not None and timeline_duration is not None:
-                    cumulative_offset = start_time + timeline_duration
-                
-                entry = TimelineEntry(
-                    source_id=source_id,
-                    file_path=file_path,
-                    media_type="VIDEO",
-                    # Timeline positioning (when in sequence)
-                    start_time=start_time,
-                    end_time=end_time,
-                    # Clip positioning (within original footage)
-                    clip_start_time=clip_start,
-                    clip_end_time=clip_end
-                )
-                
-                self.entries.append(entry)
-                source_id += 1
+        # Convert file:// URL to local path
+        local_path = self._convert_file_url_to_path(src_url)
+        if not local_path:
+            return
+        
+        has_video = asset.get('hasVideo')
+        if has_video is None and asset.get('hasAudio') == '1':
+            # hasVideo defaults to "0" and is omitted on audio-only assets
+            has_video = '0'
+        self.resources[asset_id] = TimelineResource(
+            resource_id=asset_id,
+            file_path=local_path,
+            name=asset.get('name'),
+            start=self._parse_time_attribute(asset.get('start')),
+            duration=self._parse_time_attribute(asset.get('duration')),
+            format_id=asset.get('format'),
+            has_video=has_video == '1' if has_video is not None else None
+        )
+    
+    def _apply_formats(self) -> None:
+        """Fill in the resolution and frame rate of every asset from its format."""
+        for resource in self.resources.values():
+            video_format = self.formats.get(resource.format_id, {})
+            resource.width = video_format.get("width")
+            resource.height = video_format.get("height")
+            resource.fps = video_format.get("fps")
+    
+    def _parse_int_attribute(self, value: Optional[str]) -> Optional[int]:
+        """
+        Parse an integer attribute.
+        
+        Args:
+            value: Attribute value.
+            
+        Returns:
+            Integer value or None if it is missing or invalid.
+        """
+        try:
+            return int(value) if value else None
+        except ValueError:
+            return None
+    
+    def _parse_sequence(self, sequence: ET.Element) -> None:
+        """
+        Parse the timeline sequence of FCPXML file.
+        
+        Every clip of the timeline is collected: the primary storyline,
+        connected clips and secondary storylines on lanes, and the contents
+        of compound (ref-clip), multicam (mc-clip), synchronized (sync-clip)
+        and plain clips. Entries are ordered by timeline start.
+        
+        Args:
+            sequence: Timeline sequence element.
+        """
+        spans = self._collect_spans(sequence, 0.0)
+        spans.sort(key=lambda span: span.start_time)
+        
+        for source_id, span in enumerate(spans, 1):
+            resource = span.resource
+            self.entries.append(TimelineEntry(
+                source_id=source_id,
+                file_path=resource.file_path,
+                media_type="AUDIO" if resource.has_video is False else "VIDEO",
+                # Timeline positioning (when in sequence)
+                start_time=span.start_time,
+                end_time=span.end_time,
+                # Clip positioning (within original footage)
+                clip_start_time=span.clip_start_time,
+                clip_end_time=span.clip_start_time + span.duration,
+                resource=resource
+            ))
+    
+    def _collect_spans(
+        self,
+        container: ET.Element,
+        shift: float,
+        connected: Optional[bool] = None
+    ) -> List[_ClipSpan]:
+        """
+        Collect the media clips of the story elements in a container.
+        
+        Each element's offset is a time in the container's local timeline.
+        An element's own local time t lies at offset + t - start in the
+        container, which is how nested times are composed.
+        
+        Args:
+            container: Element whose children are story elements.
+            shift: Output time of the container's local time 0.
+            connected: True for children on lanes only, False for children
+                without a lane only, None for all children.
+            
+        Returns:
+            List of clip spans in output time.
+        """
+        spans = []
+        # Elements without an offset follow the previous one, as in a spine
+        position = 0.0
+        
+        for elem in container:
+            if elem.tag not in STORY_ELEMENTS or elem.get('enabled') == '0':
+                continue
+            if connected is not None and (elem.get('lane') is not None) != connected:
+                continue
+            
+            offset = self._parse_time_attribute(elem.get('offset'))
+            if offset is None:
+                offset = position
+            duration = self._parse_time_attribute(elem.get('duration')) or 0.0
+            start = self._parse_time_attribute(elem.get('start'))
+            resource = self.resources.get(elem.get('ref')) if elem.tag in ('asset-clip', 'video') else None
+            if start is None:
+                # Without a start the clip begins at the first frame of its media
+                start = resource.start if resource is not None and resource.start else 0.0
+            position = offset + duration
+            local_shift = shift + offset - start
+            
+            if elem.tag == 'spine':
+                spans.extend(self._collect_spans(elem, local_shift))
+                continue
+            
+            if elem.tag in ('asset-clip', 'video'):
+                if resource is not None and elem.get('srcEnable') != 'audio':
+                    # Clip starts are timecodes of the media; make them relative to its first frame
+                    clip_start = max(0.0, start - resource.start) if resource.start else start
+                    spans.append(_ClipSpan(resource, shift + offset, duration, clip_start))
+            elif elem.tag in ('ref-clip', 'mc-clip'):
+                spans.extend(self._trim_spans(self._expand_media(elem), local_shift, start, start + duration))
+            elif elem.tag in ('clip', 'sync-clip'):
+                # The clip's own storyline is trimmed to it; connected clips are not
+                inner = self._collect_spans(elem, 0.0, connected=False)
+                spans.extend(self._trim_spans(inner, local_shift, start, start + duration))
+            
+            spans.extend(self._collect_spans(elem, local_shift, connected=True))
+        
+        return spans
+    
+    def _expand_media(self, clip: ET.Element) -> List[_ClipSpan]:
+        """
+        Get the clip spans of the compound or multicam media a clip refers to.
+        
+        Expansions are memoised per media (and multicam angle), so a compound
+        used many times is walked once and only shifted and trimmed per use.
+        
+        Args:
+            clip: ref-clip or mc-clip element.
+            
+        Returns:
+            Clip spans in the media's local time.
+        """
+        media_id = clip.get('ref')
+        angle_id = self._get_video_angle(clip) if clip.tag == 'mc-clip' else None
+        key = (media_id, angle_id)
+        if key in self._media_spans:
+            return self._media_spans[key]
+        
+        # Guards against media that contains itself
+        self._media_spans[key] = []
+        spans = []
+        media = self.media.get(media_id)
+        if media is not None:
+            if clip.tag == 'ref-clip':
+                sequence = media.find('sequence')
+                if sequence is not None:
+                    spans = self._collect_spans(sequence, 0.0)
+            else:
+                for angle in media.iterfind('multicam/mc-angle'):
+                    if angle_id is None or angle.get('angleID') == angle_id:
+                        spans = self._collect_spans(angle, 0.0)
+                        break
+        
+        self._media_spans[key] = spans
+        return spans
+    
+    def _get_video_angle(self, mc_clip: ET.Element) -> Optional[str]:
+        """
+        Get the multicam angle a clip shows video from.
+        
+        Args:
+            mc_clip: mc-clip element.
+            
+        Returns:
+            Angle ID, or None to use the first angle.
+        """
+        for source in mc_clip.iterfind('mc-source'):
+            if source.get('srcEnable', 'all') in ('all', 'video'):
+                return source.get('angleID')
+        return None
+    
+    def _trim_spans(self, spans: List[_ClipSpan], shift: float, window_start: float,
+                    window_end: float) -> List[_ClipSpan]:
+        """
+        Trim clip spans to a window of their local time and shift them.
+        
+        Args:
+            spans: Clip spans in local time.
+            shift: Output time of local time 0.
+            window_start: Start of the visible window in local time.
+            window_end: End of the visible window in local time.
+            
+        Returns:
+            Visible parts of the spans in output time.
+        """
+        trimmed = []
+        for span in spans:
+            start = max(span.start_time, window_start)
+            end = min(span.end_time, window_end)
+            if end <= start:
+                continue
+            trimmed.append(_ClipSpan(
+                span.resource,
+                start + shift,
+                end - start,
+                span.clip_start_time + (start - span.start_time)
+            ))
+        return trimmed
     
     def _convert_file_url_to_path(self, file_url: str) -> Optional[str]:
         """
@@ -266,7 +527,8 @@ class FCPXMLParser:
                 end_time=entry.end_time,
                 clip_start_time=entry.clip_start_time,
                 clip_end_time=entry.clip_end_time,
-                track_info=entry.track_info
+                track_info=entry.track_info,
+                resource=entry.resource
             )
             
             normalized_entries.append(normalized_entry)
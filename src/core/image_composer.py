@@ -6,21 +6,29 @@ add text overlays with metadata, and arrange them in grid layouts.
 """
 
 import math
-from typing import List, Dict, Any, Optional, Tuple
-from PIL import Image, ImageDraw, ImageFont
-from dataclasses import dataclass
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from PIL import Image, ImageDraw
+from dataclasses import dataclass, field, replace
 
 from core.thumbnail_extractor import VideoData, ThumbnailData
 from utils.image_utils import (
     add_text_overlay_to_image,
-    create_grid_layout,
+    add_text_overlays_to_image,
+    blend_overlays,
     create_text_header,
     add_frame_to_image,
+    parse_frame_color,
+    calculate_overlay_position,
+    get_text_overlay_tile,
+    get_font,
+    get_text_header_height,
     format_duration,
     format_datetime,
     calculate_optimal_font_size,
     ensure_image_rgb,
-    create_placeholder_image
+    create_placeholder_image,
+    fit_image_to_cell,
+    get_uniform_cell_size
 )
 
 
@@ -46,6 +54,56 @@ class CompositionSettings:
     frame_padding: int = 10
     # Multi-page settings
     max_rows_per_image: int = 0  # 0 = unlimited (single image)
+    # Layout settings
+    layout_mode: str = "grid"  # "grid", "uniform_cells" or "packed"
+
+
+@dataclass
+class StripLayout:
+    """
+    Precomputed layout of one video strip.
+    
+    All offsets are relative to the top-left corner of the strip, so the strip
+    can be drawn straight into a page canvas without intermediate images.
+    """
+    video_data: Optional[VideoData]
+    width: int
+    height: int
+    content_x: int = 0
+    content_y: int = 0
+    content_width: int = 0
+    content_height: int = 0
+    header_text: Optional[str] = None
+    header_height: int = 0
+    thumbnail_size: Tuple[int, int] = (0, 0)
+    thumbnail_offsets: List[Tuple[int, int]] = field(default_factory=list)
+    # (text, position) overlays of each thumbnail, in drawing order
+    overlays: List[List[Tuple[str, str]]] = field(default_factory=list)
+    font_size: int = 0
+    # Pre-rendered strip for layouts the engine cannot express
+    image: Optional[Image.Image] = None
+
+
+# In the packed layout, a strip may be placed out of reading order if that puts
+# it higher on the page by more than this fraction of its own height
+PACKING_ORDER_TOLERANCE = 0.25
+
+
+@dataclass
+class PageGeometry:
+    """Geometry of one contact sheet page."""
+    strips_per_row: int
+    num_rows: int
+    strip_width: int
+    row_height: int
+    width: int
+    height: int
+    # Height of each strip on the page after scaling to strip_width
+    strip_heights: List[int] = field(default_factory=list)
+    # Top-left corner of each strip in the packed layout; empty for grids
+    positions: List[Tuple[int, int]] = field(default_factory=list)
+    # Fraction of the page area covered by strips
+    coverage: float = 0.0
 
 
 class ImageComposer:
@@ -96,59 +154,29 @@ class ImageComposer:
         Returns:
             PIL Image object containing the contact sheet.
         """
-        # Process each video to create its thumbnail strip
+        # Lay out each video's thumbnail strip
         video_strips = []
         for video_data in video_data_list:
-            try:
-                strip = self._create_video_strip(video_data)
-                if strip:
-                    video_strips.append(strip)
-            except Exception as e:
-                print(f"Error creating strip for {video_data.file.filename}: {e}")
-                continue
+            strip = self.create_strip(video_data)
+            if strip:
+                video_strips.append(strip)
         
-        if not video_strips:
-            return create_placeholder_image(800, 600, "Failed to Create Thumbnails")
-        
-        # Arrange video strips in a grid layout
-        contact_sheet = self._arrange_strips_in_grid(video_strips)
-        
-        return contact_sheet
+        # Render the strips straight into the grid
+        return self.compose_page(video_strips)
     
     def create_multi_page_contact_sheets(self, video_data_list: List[VideoData]) -> Image.Image:
         """
         Create multiple contact sheet pages when max rows limit is exceeded.
         
+        All pages are held in memory; use iter_pages() to save them one at a time.
+        
         Args:
             video_data_list: List of VideoData objects containing thumbnails.
             
         Returns:
             PIL Image object containing the first page (additional pages saved separately).
         """
-        # Process each video to create its thumbnail strip
-        video_strips = []
-        for video_data in video_data_list:
-            try:
-                strip = self._create_video_strip(video_data)
-                if strip:
-                    video_strips.append(strip)
-            except Exception as e:
-                print(f"Error creating strip for {video_data.file.filename}: {e}")
-                continue
-        
-        if not video_strips:
-            return create_placeholder_image(800, 600, "Failed to Create Thumbnails")
-        
-        # Calculate how many videos per page
-        videos_per_row = self.settings.clips_per_row
-        max_videos_per_page = videos_per_row * self.settings.max_rows_per_image
-        
-        # Split video strips into pages
-        pages = []
-        for i in range(0, len(video_strips), max_videos_per_page):
-            page_strips = video_strips[i:i + max_videos_per_page]
-            page_image = self._arrange_strips_in_grid(page_strips)
-            pages.append(page_image)
+        pages = list(self.iter_pages(video_data_list))
         
         print(f"Generated {len(pages)} pages due to max_rows_per_image limit of {self.settings.max_rows_per_image}")
         
@@ -158,6 +186,110 @@ class ImageComposer:
         # Return the first page
         return pages[0] if pages else create_placeholder_image(800, 600, "No Pages Created")
     
+    def iter_pages(self, video_data_list: List[VideoData], max_height: Optional[int] = None) -> Iterator[Image.Image]:
+        """
+        Render contact sheet pages one at a time.
+        
+        Each page is laid out and composed only when the caller asks for it,
+        so a caller that saves and releases every page before requesting the
+        next holds at most one page in memory.
+        
+        Args:
+            video_data_list: List of VideoData objects containing thumbnails.
+            max_height: Largest page height the output format can store. Taller
+                pages are split into several pages (see split_strips_to_fit()).
+            
+        Yields:
+            PIL Image objects of the pages in order; a single placeholder page
+            if there is nothing to show.
+        """
+        if not video_data_list:
+            yield create_placeholder_image(800, 600, "No Videos to Process")
+            return
+        
+        # Filter out videos with no thumbnails or errors
+        valid_videos = [vd for vd in video_data_list 
+                       if vd.processing_status == "success" and vd.thumbnails]
+        
+        if not valid_videos:
+            yield create_placeholder_image(800, 600, "No Valid Thumbnails Found")
+            return
+        
+        for page_strips in self.iter_page_strips(valid_videos):
+            for strips in self.split_strips_to_fit(page_strips, max_height):
+                yield self.compose_page(strips)
+    
+    def iter_page_strips(self, video_data_list: List[VideoData]) -> Iterator[List[StripLayout]]:
+        """
+        Lay out the strips of successfully processed videos, one page at a time.
+        
+        Args:
+            video_data_list: List of VideoData objects containing thumbnails.
+            
+        Yields:
+            StripLayouts of each page in order. A single empty list is yielded
+            if no strip could be created.
+        """
+        videos_per_page = self.get_videos_per_page()
+        page_strips = []
+        page_count = 0
+        
+        for video_data in video_data_list:
+            if video_data.processing_status != "success" or not video_data.thumbnails:
+                continue
+            
+            strip = self.create_strip(video_data)
+            if strip:
+                page_strips.append(strip)
+            
+            if videos_per_page and len(page_strips) >= videos_per_page:
+                page_count += 1
+                strips, page_strips = page_strips, []
+                yield strips
+                del strips
+        
+        if page_strips or not page_count:
+            yield page_strips
+    
+    def split_strips_to_fit(self, strips: List[Any], max_height: Optional[int]) -> List[List[Any]]:
+        """
+        Split the strips of a page into pages no taller than a height limit.
+        
+        Used when a single sheet would exceed what the output format can store
+        (e.g. JPEG's 65,500 pixel limit). Only the height can be split; a sheet
+        that is too wide is reported as an error.
+        
+        Args:
+            strips: StripLayouts or strip images of one page.
+            max_height: Width and height limit in pixels, or None for no limit.
+            
+        Returns:
+            List of strip lists, one per page.
+        """
+        if not strips or not max_height:
+            return [strips]
+        
+        geometry = self.get_page_geometry(strips)
+        if geometry.width > max_height:
+            print(f"Error: A {geometry.width} pixel wide sheet exceeds the {max_height} pixel limit of the "
+                  f"output format; reduce clips_per_row or thumbnail_width, or use PNG output")
+        if geometry.height <= max_height:
+            return [strips]
+        
+        if geometry.positions:
+            print(f"Warning: A {geometry.width}x{geometry.height} sheet exceeds the {max_height} pixel "
+                  f"limit of the output format; splitting it into several pages")
+            return self._split_packed_strips(strips, max_height)
+        
+        padding = self.settings.padding
+        rows_per_page = max(1, (max_height - padding) // (geometry.row_height + padding))
+        strips_per_page = rows_per_page * geometry.strips_per_row
+        
+        print(f"Warning: A {geometry.width}x{geometry.height} sheet exceeds the {max_height} pixel "
+              f"limit of the output format; splitting it into pages of {rows_per_page} rows")
+        
+        return [strips[i:i + strips_per_page] for i in range(0, len(strips), strips_per_page)]
+    
     def get_additional_pages(self) -> List[Image.Image]:
         """
         Get additional pages created by multi-page mode.
@@ -167,6 +299,645 @@ class ImageComposer:
         """
         return getattr(self, '_additional_pages', [])
     
+    def create_strip(self, video_data: VideoData) -> Optional[StripLayout]:
+        """
+        Lay out the thumbnail strip of a single video.
+        
+        Used to compose pages incrementally, one video at a time. Nothing is
+        drawn until the strip is placed on a page by compose_page().
+        
+        Args:
+            video_data: VideoData object containing thumbnails.
+            
+        Returns:
+            StripLayout of the strip, or None if it could not be created.
+        """
+        try:
+            return self._layout_video_strip(video_data)
+        except Exception as e:
+            print(f"Error creating strip for {video_data.file.filename}: {e}")
+            return None
+    
+    def compose_page(self, strips: List[Any]) -> Image.Image:
+        """
+        Arrange strips into one contact sheet page.
+        
+        The page canvas is allocated once and every thumbnail, header, overlay
+        and frame is drawn directly into place.
+        
+        Args:
+            strips: StripLayouts from create_strip() or pre-rendered strip
+                images, in page order.
+            
+        Returns:
+            PIL Image object containing the page.
+        """
+        if not strips:
+            return create_placeholder_image(800, 600, "Failed to Create Thumbnails")
+        
+        layouts = self._as_layouts(strips)
+        geometry = self.get_page_geometry(layouts)
+        
+        canvas = Image.new('RGB', (geometry.width, geometry.height), self._get_background_rgb())
+        if geometry.positions:
+            self._draw_packed_strips(canvas, layouts, geometry, 0)
+        else:
+            self._draw_grid_rows(canvas, layouts, geometry, 0, geometry.num_rows, 0)
+        return canvas
+    
+    def iter_page_bands(self, strips: List[Any]) -> Iterator[Image.Image]:
+        """
+        Compose a page as horizontal bands, one grid row at a time.
+        
+        Stacking the bands gives the image compose_page() returns, but only
+        one band is ever held in memory.
+        
+        Args:
+            strips: StripLayouts from create_strip() or pre-rendered strip
+                images, in page order (at least one).
+            
+        Yields:
+            PIL Image objects of the bands, top to bottom, all as wide as the page.
+        """
+        layouts = self._as_layouts(strips)
+        geometry = self.get_page_geometry(layouts)
+        band_height = geometry.row_height + self.settings.padding
+        
+        if geometry.positions:
+            for top in range(0, geometry.height, band_height):
+                band = Image.new('RGB', (geometry.width, min(band_height, geometry.height - top)),
+                                 self._get_background_rgb())
+                self._draw_packed_strips(band, layouts, geometry, top)
+                yield band
+                del band
+            return
+        
+        for row in range(geometry.num_rows):
+            top = row * band_height
+            # The last band also holds the bottom padding
+            height = band_height if row < geometry.num_rows - 1 else geometry.height - top
+            band = Image.new('RGB', (geometry.width, height), self._get_background_rgb())
+            self._draw_grid_rows(band, layouts, geometry, row, row + 1, top)
+            yield band
+            del band
+    
+    def get_page_geometry(self, strips: List[Any]) -> PageGeometry:
+        """
+        Compute the geometry of a page without rendering it.
+        
+        Args:
+            strips: StripLayouts or strip images of the page (at least one).
+            
+        Returns:
+            PageGeometry of the page.
+        """
+        layouts = self._as_layouts(strips)
+        if self.settings.layout_mode == "packed":
+            return self._pack_strips(layouts)
+        
+        padding = self.settings.padding
+        
+        strips_per_row = min(self.settings.clips_per_row, len(layouts))
+        num_rows = math.ceil(len(layouts) / strips_per_row)
+        
+        strip_width = max(layout.width for layout in layouts)
+        if self.settings.layout_mode == "uniform_cells":
+            # Strips are built from equal cells and placed unscaled
+            strip_heights = [layout.height for layout in layouts]
+        else:
+            # Narrower strips are scaled to the widest one, keeping their aspect ratio
+            strip_heights = [
+                layout.height if layout.width == strip_width else int(strip_width * (layout.height / layout.width))
+                for layout in layouts
+            ]
+        row_height = max(strip_heights)
+        
+        width = (strips_per_row * strip_width) + ((strips_per_row + 1) * padding)
+        height = (num_rows * row_height) + ((num_rows + 1) * padding)
+        strip_widths = [
+            layout.width if self.settings.layout_mode == "uniform_cells" else strip_width
+            for layout in layouts
+        ]
+        
+        return PageGeometry(
+            strips_per_row=strips_per_row,
+            num_rows=num_rows,
+            strip_width=strip_width,
+            row_height=row_height,
+            width=width,
+            height=height,
+            strip_heights=strip_heights,
+            coverage=sum(w * h for w, h in zip(strip_widths, strip_heights)) / (width * height)
+        )
+    
+    def _pack_strips(self, layouts: List[StripLayout]) -> PageGeometry:
+        """
+        Place strips of differing sizes with skyline bin-packing.
+        
+        The page is as wide as the grid would be. Each strip, in page order,
+        goes to the lowest spot of the skyline (the outline of the strips
+        placed so far) where it fits. Among spots within
+        PACKING_ORDER_TOLERANCE of the lowest, the first one to the right of
+        the previous strip wins, so the sheet still reads left to right and
+        top to bottom. Strips are never scaled.
+        
+        Args:
+            layouts: Strip layouts of the page (at least one).
+            
+        Returns:
+            PageGeometry with the position of every strip.
+        """
+        padding = self.settings.padding
+        strips_per_row = min(self.settings.clips_per_row, len(layouts))
+        strip_width = max(layout.width for layout in layouts)
+        width = (strips_per_row * strip_width) + ((strips_per_row + 1) * padding)
+        
+        # (x, y, width) segments of the skyline, left to right, covering [padding, width).
+        # Every strip claims the padding to its right and below it.
+        skyline = [(padding, padding, width - padding)]
+        positions = []
+        previous_right = padding
+        
+        for layout in layouts:
+            claim_width = layout.width + padding
+            candidates = []
+            for i, (x, _, _) in enumerate(skyline):
+                if x + claim_width > width:
+                    break
+                y = max(sy for sx, sy, _ in skyline[i:] if sx < x + claim_width)
+                candidates.append((x, y))
+            
+            lowest = min(y for _, y in candidates)
+            near = [c for c in candidates if c[1] <= lowest + PACKING_ORDER_TOLERANCE * layout.height]
+            following = [c for c in near if c[0] >= previous_right]
+            x, y = min(following or near)
+            
+            positions.append((x, y))
+            previous_right = x + claim_width
+            skyline = self._raise_skyline(skyline, x, claim_width, y + layout.height + padding)
+        
+        height = max(y for _, y, _ in skyline)
+        strip_heights = [layout.height for layout in layouts]
+        
+        return PageGeometry(
+            strips_per_row=strips_per_row,
+            num_rows=0,
+            strip_width=strip_width,
+            row_height=max(strip_heights),
+            width=width,
+            height=height,
+            strip_heights=strip_heights,
+            positions=positions,
+            coverage=sum(layout.width * layout.height for layout in layouts) / (width * height)
+        )
+    
+    @staticmethod
+    def _raise_skyline(
+        skyline: List[Tuple[int, int, int]],
+        x: int,
+        width: int,
+        y: int
+    ) -> List[Tuple[int, int, int]]:
+        """
+        Raise a span of the skyline to a new height.
+        
+        Args:
+            skyline: (x, y, width) segments, left to right.
+            x: Left edge of the span.
+            width: Width of the span.
+            y: New height of the span.
+            
+        Returns:
+            Updated skyline with neighboring segments of equal height merged.
+        """
+        right = x + width
+        segments = [(x, y, width)]
+        for sx, sy, sw in skyline:
+            if sx + sw <= x or sx >= right:
+                segments.append((sx, sy, sw))
+                continue
+            if sx < x:
+                segments.append((sx, sy, x - sx))
+            if sx + sw > right:
+                segments.append((right, sy, sx + sw - right))
+        segments.sort()
+        
+        merged = [segments[0]]
+        for sx, sy, sw in segments[1:]:
+            mx, my, mw = merged[-1]
+            if my == sy:
+                merged[-1] = (mx, my, mw + sw)
+            else:
+                merged.append((sx, sy, sw))
+        return merged
+    
+    def _split_packed_strips(self, strips: List[Any], max_height: int) -> List[List[Any]]:
+        """
+        Split packed strips into pages no taller than a height limit.
+        
+        Packing places strips in order, so the strips of a page are the
+        longest prefix of the remaining strips that ends above the limit.
+        
+        Args:
+            strips: StripLayouts or strip images.
+            max_height: Height limit in pixels.
+            
+        Returns:
+            List of strip lists, one per page.
+        """
+        pages = []
+        padding = self.settings.padding
+        
+        while strips:
+            geometry = self.get_page_geometry(strips)
+            count = 0
+            bottom = 0
+            for (_, y), strip_height in zip(geometry.positions, geometry.strip_heights):
+                bottom = max(bottom, y + strip_height + padding)
+                if bottom > max_height:
+                    break
+                count += 1
+            count = max(1, count)
+            
+            # A shorter page may be narrower and pack differently
+            while count > 1 and self.get_page_geometry(strips[:count]).height > max_height:
+                count -= 1
+            
+            pages.append(strips[:count])
+            strips = strips[count:]
+        
+        return pages
+    
+    def get_videos_per_page(self) -> int:
+        """
+        Get the number of videos placed on each page in multi-page mode.
+    
+        Returns:
+            Videos per page, or 0 if all videos go on a single image.
+        """
+        if self.settings.max_rows_per_image > 0:
+            return self.settings.clips_per_row * self.settings.max_rows_per_image
+        return 0
+    
+    def _get_background_rgb(self) -> Tuple[int, int, int]:
+        """
+        Get the RGB background color of strips and pages.
+        
+        Returns:
+            RGB tuple, white for colors other than "white" and "black".
+        """
+        if self.settings.background_color.lower() == "black":
+            return (0, 0, 0)
+        return (255, 255, 255)
+    
+    def _get_header_text(self, video_data: VideoData) -> str:
+        """
+        Build the metadata header text of a video strip.
+        
+        Args:
+            video_data: VideoData object containing metadata.
+            
+        Returns:
+            Header text, empty if no metadata is shown.
+        """
+        header_parts = []
+        
+        if self.settings.show_filename:
+            header_parts.append(video_data.file.filename)
+        
+        if self.settings.show_creation_date and video_data.metadata.creation_date:
+            date_str = format_datetime(video_data.metadata.creation_date)
+            if date_str:
+                header_parts.append(date_str)
+        
+        if self.settings.show_duration:
+            duration_str = format_duration(video_data.metadata.duration)
+            header_parts.append(f"Duration: {duration_str}")
+        
+        # Combine header parts
+        return "  |  ".join(header_parts) if header_parts else ""
+    
+    def _get_thumbnail_overlays(self, video_data: VideoData, index: int) -> List[Tuple[str, str]]:
+        """
+        Get the text overlays drawn on one thumbnail of a video strip.
+        
+        Args:
+            video_data: VideoData object containing thumbnails and metadata.
+            index: Index of the thumbnail within the strip.
+            
+        Returns:
+            List of (text, position) tuples in drawing order.
+        """
+        overlays = []
+        
+        if self.settings.overlay_position != "above_thumbnails":
+            if index == 0:  # First thumbnail - show filename and creation date
+                if self.settings.show_filename:
+                    overlays.append((video_data.file.filename, "top-left"))
+                
+                if self.settings.show_creation_date and video_data.metadata.creation_date:
+                    date_str = format_datetime(video_data.metadata.creation_date)
+                    if date_str:
+                        overlays.append((date_str, "top-right"))
+            
+            elif index == len(video_data.thumbnails) - 1:  # Last thumbnail - show duration
+                if self.settings.show_duration:
+                    overlays.append((format_duration(video_data.metadata.duration), "bottom-right"))
+        
+        # Add timestamp to all thumbnails if enabled
+        if self.settings.show_timestamp:
+            overlays.append((video_data.thumbnails[index].timestamp, "bottom-left"))
+        
+        return overlays
+    
+    def _layout_video_strip(self, video_data: VideoData) -> Optional[StripLayout]:
+        """
+        Compute the layout of a video strip from the composition settings.
+        
+        Args:
+            video_data: VideoData object containing thumbnails and metadata.
+            
+        Returns:
+            StripLayout of the strip, or None if the video has no thumbnails.
+        """
+        if not video_data.thumbnails:
+            return None
+        
+        if self.settings.layout_mode == "uniform_cells":
+            video_data = self._fit_thumbnails_to_cells(video_data)
+        
+        thumbnail_sizes = {thumbnail.image.size for thumbnail in video_data.thumbnails}
+        if len(thumbnail_sizes) > 1:
+            # Thumbnails are resized to a common height - render the strip as before
+            return self._wrap_strip_image(self._create_video_strip(video_data), video_data)
+        
+        settings = self.settings
+        thumbnail_width, thumbnail_height = thumbnail_sizes.pop()
+        count = len(video_data.thumbnails)
+        
+        header_text = None
+        header_height = 0
+        if settings.overlay_position == "above_thumbnails":
+            header_text = self._get_header_text(video_data)
+            header_height = get_text_header_height(header_text, settings.font_size, padding=5)
+        
+        content_width = count * thumbnail_width + (count - 1) * settings.padding
+        content_height = header_height + thumbnail_height
+        
+        frame_offset = settings.frame_thickness + settings.frame_padding if settings.show_frame else 0
+        
+        return StripLayout(
+            video_data=video_data,
+            width=content_width + 2 * frame_offset,
+            height=content_height + 2 * frame_offset,
+            content_x=frame_offset,
+            content_y=frame_offset,
+            content_width=content_width,
+            content_height=content_height,
+            header_text=header_text,
+            header_height=header_height,
+            thumbnail_size=(thumbnail_width, thumbnail_height),
+            thumbnail_offsets=[
+                (frame_offset + i * (thumbnail_width + settings.padding), frame_offset + header_height)
+                for i in range(count)
+            ],
+            overlays=[self._get_thumbnail_overlays(video_data, i) for i in range(count)],
+            font_size=calculate_optimal_font_size(thumbnail_width, settings.font_size)
+        )
+    
+    def _fit_thumbnails_to_cells(self, video_data: VideoData) -> VideoData:
+        """
+        Make sure all thumbnails of a video fill the cells of the uniform layout.
+        
+        Thumbnails extracted in "uniform_cells" mode already have the cell
+        size and are used as they are. Others (e.g. from a thumbnail cache or
+        bundle written in grid mode) are fitted once here.
+        
+        Args:
+            video_data: VideoData object containing thumbnails.
+            
+        Returns:
+            The VideoData itself, or a copy with fitted thumbnails.
+        """
+        cell_size = get_uniform_cell_size(max(thumbnail.image.width for thumbnail in video_data.thumbnails))
+        if all(thumbnail.image.size == cell_size for thumbnail in video_data.thumbnails):
+            return video_data
+        
+        return replace(video_data, thumbnails=[
+            replace(thumbnail, image=fit_image_to_cell(thumbnail.image, cell_size))
+            for thumbnail in video_data.thumbnails
+        ])
+    
+    def _wrap_strip_image(self, image: Optional[Image.Image], video_data: Optional[VideoData] = None) -> Optional[StripLayout]:
+        """
+        Wrap a pre-rendered strip image in a StripLayout.
+        
+        Args:
+            image: Rendered strip, or None.
+            video_data: VideoData the strip was rendered from, if known.
+            
+        Returns:
+            StripLayout drawing the image as-is, or None if image is None.
+        """
+        if image is None:
+            return None
+        return StripLayout(video_data=video_data, width=image.width, height=image.height, image=image)
+    
+    def _as_layouts(self, strips: List[Any]) -> List[StripLayout]:
+        """
+        Wrap pre-rendered strip images so they can be placed like layouts.
+        
+        Args:
+            strips: StripLayouts or strip images.
+            
+        Returns:
+            List of StripLayouts.
+        """
+        return [strip if isinstance(strip, StripLayout) else self._wrap_strip_image(strip)
+                for strip in strips]
+    
+    def _draw_grid_rows(
+        self,
+        canvas: Image.Image,
+        layouts: List[StripLayout],
+        geometry: PageGeometry,
+        first_row: int,
+        end_row: int,
+        top: int
+    ) -> None:
+        """
+        Draw a range of grid rows of a page into a canvas.
+        
+        Args:
+            canvas: RGB image to draw into.
+            layouts: Strip layouts of the whole page.
+            geometry: Geometry of the page from get_page_geometry().
+            first_row: First grid row to draw.
+            end_row: Grid row to stop before.
+            top: Page y coordinate of the canvas's top edge.
+        """
+        padding = self.settings.padding
+        first = first_row * geometry.strips_per_row
+        end = min(end_row * geometry.strips_per_row, len(layouts))
+        
+        for i in range(first, end):
+            layout = layouts[i]
+            row = i // geometry.strips_per_row
+            col = i % geometry.strips_per_row
+            strip_height = geometry.strip_heights[i]
+            
+            x = padding + (col * (geometry.strip_width + padding))
+            y = padding + (row * (geometry.row_height + padding)) - top
+            
+            # Center the strip vertically if it's smaller than the row
+            y += (geometry.row_height - strip_height) // 2
+            
+            if layout.width == geometry.strip_width or self.settings.layout_mode == "uniform_cells":
+                self._draw_strip(canvas, layout, x, y)
+            else:
+                strip = self._render_strip(layout).resize((geometry.strip_width, strip_height), Image.Resampling.LANCZOS)
+                canvas.paste(strip, (x, y))
+    
+    def _draw_packed_strips(
+        self,
+        canvas: Image.Image,
+        layouts: List[StripLayout],
+        geometry: PageGeometry,
+        top: int
+    ) -> None:
+        """
+        Draw the packed strips that overlap a canvas covering part of a page.
+        
+        Args:
+            canvas: RGB image to draw into.
+            layouts: Strip layouts of the whole page.
+            geometry: Packed geometry of the page from get_page_geometry().
+            top: Page y coordinate of the canvas's top edge.
+        """
+        bottom = top + canvas.height
+        
+        for layout, (x, y) in zip(layouts, geometry.positions):
+            if y >= bottom or y + layout.height <= top:
+                continue
+            if y >= top and y + layout.height <= bottom:
+                self._draw_strip(canvas, layout, x, y - top)
+            else:
+                # Strips crossing the canvas edge are rendered whole and clipped
+                canvas.paste(self._render_strip(layout), (x, y - top))
+    
+    def _render_strip(self, layout: StripLayout) -> Image.Image:
+        """
+        Render a strip layout into its own image.
+        
+        Args:
+            layout: Strip layout to render.
+            
+        Returns:
+            PIL Image object containing the strip.
+        """
+        if layout.image is not None:
+            return layout.image
+        
+        strip = Image.new('RGB', (layout.width, layout.height), self._get_background_rgb())
+        self._draw_strip(strip, layout, 0, 0)
+        return strip
+    
+    def _draw_strip(self, canvas: Image.Image, layout: StripLayout, x: int, y: int) -> None:
+        """
+        Draw a strip layout directly into a canvas.
+        
+        Args:
+            canvas: RGB image to draw into.
+            layout: Strip layout to draw.
+            x: Left edge of the strip on the canvas.
+            y: Top edge of the strip on the canvas.
+        """
+        if layout.image is not None:
+            canvas.paste(layout.image, (x, y))
+            return
+        
+        settings = self.settings
+        content_x = x + layout.content_x
+        content_y = y + layout.content_y
+        content_box = (content_x, content_y, content_x + layout.content_width, content_y + layout.content_height)
+        
+        if settings.show_frame:
+            canvas.paste(parse_frame_color(settings.frame_color), (x, y, x + layout.width, y + layout.height))
+        canvas.paste(self._get_background_rgb(), content_box)
+        
+        try:
+            if layout.header_text is not None:
+                header_image = create_text_header(
+                    layout.header_text,
+                    layout.content_width,
+                    settings.font_size,
+                    settings.text_color,
+                    settings.background_color,
+                    padding=5
+                )
+                canvas.paste(header_image, (content_x, content_y))
+            
+            thumbnail_width, thumbnail_height = layout.thumbnail_size
+            for thumbnail, (offset_x, offset_y), overlays in zip(
+                layout.video_data.thumbnails, layout.thumbnail_offsets, layout.overlays
+            ):
+                thumbnail_box = (x + offset_x, y + offset_y, x + offset_x + thumbnail_width, y + offset_y + thumbnail_height)
+                canvas.paste(ensure_image_rgb(thumbnail.image), thumbnail_box[:2])
+                self._draw_overlays(canvas, thumbnail_box, overlays, layout.font_size)
+        except Exception as e:
+            print(f"Error drawing strip for {layout.video_data.file.filename}: {e}")
+        
+        if settings.show_frame and settings.frame_padding > 0:
+            # The area inside the frame takes the color of the strip's top-left pixel
+            inner_color = canvas.getpixel((content_x, content_y))
+            left = x + settings.frame_thickness
+            top = y + settings.frame_thickness
+            right = x + layout.width - settings.frame_thickness
+            bottom = y + layout.height - settings.frame_thickness
+            for box in (
+                (left, top, right, content_box[1]),
+                (left, content_box[3], right, bottom),
+                (left, content_box[1], content_box[0], content_box[3]),
+                (content_box[2], content_box[1], right, content_box[3]),
+            ):
+                canvas.paste(inner_color, box)
+    
+    def _draw_overlays(
+        self,
+        canvas: Image.Image,
+        thumbnail_box: Tuple[int, int, int, int],
+        overlays: List[Tuple[str, str]],
+        font_size: int
+    ) -> None:
+        """
+        Blend the text overlays of a thumbnail already placed on a canvas.
+        
+        The overlays are clipped to the thumbnail, like add_text_overlays_to_image().
+        
+        Args:
+            canvas: RGB image to draw into.
+            thumbnail_box: (left, top, right, bottom) of the thumbnail on the canvas.
+            overlays: List of (text, position) tuples, drawn in order.
+            font_size: Font size in pixels.
+        """
+        thumbnail_size = (thumbnail_box[2] - thumbnail_box[0], thumbnail_box[3] - thumbnail_box[1])
+        tiles = []
+        
+        for text, position in overlays:
+            if not text.strip():
+                continue
+            tile = get_text_overlay_tile(
+                text,
+                font_size,
+                self.settings.text_color,
+                self.settings.overlay_background_color,
+                self.settings.overlay_background_opacity
+            )
+            x, y = calculate_overlay_position(thumbnail_size, tile.size, position, margin=5)
+            tiles.append((tile, x, y))
+        
+        blend_overlays(canvas, tiles, thumbnail_box)
+    
     def _create_video_strip(self, video_data: VideoData) -> Optional[Image.Image]:
         """
         Create a horizontal strip of thumbnails for a single video.
@@ -217,11 +988,8 @@ class ImageComposer:
         processed_thumbnails = []
         
         for i, thumbnail_data in enumerate(video_data.thumbnails):
-            # Start with the base thumbnail image
-            thumbnail_image = thumbnail_data.image.copy()
-            
-            # Ensure image is in RGB mode
-            thumbnail_image = ensure_image_rgb(thumbnail_image)
+            # Ensure image is in RGB mode (overlays are drawn into a copy)
+            thumbnail_image = ensure_image_rgb(thumbnail_data.image)
             
             # Calculate optimal font size based on thumbnail width
             font_size = calculate_optimal_font_size(
@@ -229,56 +997,15 @@ class ImageComposer:
                 self.settings.font_size
             )
             
-            # Add overlays based on position
-            if i == 0:  # First thumbnail - show filename and creation date
-                if self.settings.show_filename:
-                    thumbnail_image = add_text_overlay_to_image(
-                        thumbnail_image,
-                        video_data.file.filename,
-                        "top-left",
-                        font_size,
-                        self.settings.text_color,
-                        self.settings.overlay_background_color,
-                        self.settings.overlay_background_opacity
-                    )
-                
-                if self.settings.show_creation_date and video_data.metadata.creation_date:
-                    date_str = format_datetime(video_data.metadata.creation_date)
-                    if date_str:
-                        thumbnail_image = add_text_overlay_to_image(
-                            thumbnail_image,
-                            date_str,
-                            "top-right",
-                            font_size,
-                            self.settings.text_color,
-                            self.settings.overlay_background_color,
-                            self.settings.overlay_background_opacity
-                        )
-            
-            elif i == len(video_data.thumbnails) - 1:  # Last thumbnail - show duration
-                if self.settings.show_duration:
-                    duration_str = format_duration(video_data.metadata.duration)
-                    thumbnail_image = add_text_overlay_to_image(
-                        thumbnail_image,
-                        duration_str,
-                        "bottom-right",
-                        font_size,
-                        self.settings.text_color,
-                        self.settings.overlay_background_color,
-                        self.settings.overlay_background_opacity
-                    )
-            
-            # Add timestamp to all thumbnails if enabled
-            if self.settings.show_timestamp:
-                thumbnail_image = add_text_overlay_to_image(
-                    thumbnail_image,
-                    thumbnail_data.timestamp,
-                    "bottom-left",
-                    font_size,
-                    self.settings.text_color,
-                    self.settings.overlay_background_color,
-                    self.settings.overlay_background_opacity
-                )
+            # Add filename/date, duration and timestamp overlays
+            thumbnail_image = add_text_overlays_to_image(
+                thumbnail_image,
+                self._get_thumbnail_overlays(video_data, i),
+                font_size,
+                self.settings.text_color,
+                self.settings.overlay_background_color,
+                self.settings.overlay_background_opacity
+            )
             
             processed_thumbnails.append(thumbnail_image)
         
@@ -328,22 +1055,7 @@ class ImageComposer:
         thumbnail_strip = self._create_horizontal_strip(processed_thumbnails)
         
         # Create text header with metadata
-        header_parts = []
-        
-        if self.settings.show_filename:
-            header_parts.append(video_data.file.filename)
-        
-        if self.settings.show_creation_date and video_data.metadata.creation_date:
-            date_str = format_datetime(video_data.metadata.creation_date)
-            if date_str:
-                header_parts.append(date_str)
-        
-        if self.settings.show_duration:
-            duration_str = format_duration(video_data.metadata.duration)
-            header_parts.append(f"Duration: {duration_str}")
-        
-        # Combine header parts
-        header_text = "  |  ".join(header_parts) if header_parts else ""
+        header_text = self._get_header_text(video_data)
         
         # Create text header
         header_image = create_text_header(
@@ -423,70 +1135,6 @@ class ImageComposer:
         
         return strip
     
-    def _arrange_strips_in_grid(self, strips: List[Image.Image]) -> Image.Image:
-        """
-        Arrange video strips in a grid layout.
-        
-        Args:
-            strips: List of PIL Image objects representing video strips.
-            
-        Returns:
-            PIL Image object containing the final contact sheet.
-        """
-        if not strips:
-            return create_placeholder_image(800, 600, "No Strips to Arrange")
-        
-        # Calculate grid dimensions
-        total_strips = len(strips)
-        strips_per_row = min(self.settings.clips_per_row, total_strips)
-        num_rows = math.ceil(total_strips / strips_per_row)
-        
-        # Find the maximum dimensions
-        max_width = max(strip.width for strip in strips)
-        max_height = max(strip.height for strip in strips)
-        
-        # Resize all strips to have the same width (keep aspect ratio)
-        normalized_strips = []
-        for strip in strips:
-            if strip.width != max_width:
-                aspect_ratio = strip.height / strip.width
-                new_height = int(max_width * aspect_ratio)
-                strip = strip.resize((max_width, new_height), Image.Resampling.LANCZOS)
-            normalized_strips.append(strip)
-        
-        # Recalculate max height after normalization
-        max_height = max(strip.height for strip in normalized_strips)
-        
-        # Calculate total grid size
-        grid_width = (strips_per_row * max_width) + ((strips_per_row + 1) * self.settings.padding)
-        grid_height = (num_rows * max_height) + ((num_rows + 1) * self.settings.padding)
-        
-        # Create the grid image
-        if self.settings.background_color.lower() == "white":
-            bg_color = (255, 255, 255)
-        elif self.settings.background_color.lower() == "black":
-            bg_color = (0, 0, 0)
-        else:
-            bg_color = (255, 255, 255)  # Default to white
-        
-        grid_image = Image.new('RGB', (grid_width, grid_height), bg_color)
-        
-        # Place strips in the grid
-        for i, strip in enumerate(normalized_strips):
-            row = i // strips_per_row
-            col = i % strips_per_row
-            
-            x = self.settings.padding + (col * (max_width + self.settings.padding))
-            y = self.settings.padding + (row * (max_height + self.settings.padding))
-            
-            # Center the strip vertically if it's smaller than max_height
-            if strip.height < max_height:
-                y += (max_height - strip.height) // 2
-            
-            grid_image.paste(strip, (x, y))
-        
-        return grid_image
-    
     def calculate_grid_dimensions(self, video_count: int, clips_per_row: int) -> Tuple[int, int]:
         """
         Calculate grid dimensions for a given number of videos.
@@ -594,10 +1242,7 @@ class ImageComposer:
         overlay = Image.new('RGBA', (overlay_width, overlay_height), (0, 0, 0, 128))
         draw = ImageDraw.Draw(overlay)
         
-        try:
-            font = ImageFont.truetype("arial.ttf", font_size)
-        except OSError:
-            font = ImageFont.load_default()
+        font = get_font(font_size, ("arial.ttf",))
         
         # Draw text lines
         y_offset = margin
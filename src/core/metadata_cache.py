@@ -0,0 +1,127 @@
+"""
+Metadata cache module for the Footage Thumbnailer application.
+
+This module provides a persistent SQLite cache for video metadata so that
+unchanged files do not need to be probed with ffprobe on every run.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional
+
+from utils.file_utils import get_file_identity
+
+
+class MetadataCache:
+    """Persistent cache of video metadata keyed by normalized path, size and mtime."""
+    
+    DB_FILENAME = "metadata_cache.sqlite"
+    
+    def __init__(self, cache_dir: str):
+        """
+        Initialize the metadata cache.
+        
+        Args:
+            cache_dir: Directory holding the cache database. Created on first use.
+        """
+        self.cache_dir = cache_dir
+        self.db_path = os.path.join(cache_dir, self.DB_FILENAME)
+        self._connection = None
+        self._lock = threading.Lock()
+    
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Open the cache database lazily.
+        
+        Returns:
+            SQLite connection to the cache database.
+        """
+        if self._connection is None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            connection = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            # WAL lets several worker processes read and write concurrently
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS video_metadata ("
+                "path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, "
+                "metadata TEXT NOT NULL, updated REAL NOT NULL)"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+    
+    def get(self, video_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up cached metadata for a video file.
+        
+        Args:
+            video_path: Path to the video file.
+            
+        Returns:
+            Cached metadata dictionary, or None if missing or the file changed.
+        """
+        identity = get_file_identity(video_path)
+        if identity is None:
+            return None
+        
+        path, size, mtime_ns = identity
+        
+        try:
+            with self._lock:
+                row = self._get_connection().execute(
+                    "SELECT size, mtime_ns, metadata FROM video_metadata WHERE path = ?", (path,)
+                ).fetchone()
+        except Exception as e:
+            print(f"Warning: Metadata cache lookup failed: {e}")
+            return None
+        
+        if row is None or row[0] != size or row[1] != mtime_ns:
+            return None
+        
+        try:
+            return json.loads(row[2])
+        except ValueError:
+            return None
+    
+    def put(self, video_path: str, metadata: Dict[str, Any]) -> None:
+        """
+        Store metadata for a video file.
+        
+        Args:
+            video_path: Path to the video file.
+            metadata: Serializable metadata dictionary.
+        """
+        identity = get_file_identity(video_path)
+        if identity is None:
+            return
+        
+        path, size, mtime_ns = identity
+        
+        try:
+            with self._lock:
+                connection = self._get_connection()
+                connection.execute(
+                    "INSERT OR REPLACE INTO video_metadata (path, size, mtime_ns, metadata, updated) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (path, size, mtime_ns, json.dumps(metadata), time.time())
+                )
+                connection.commit()
+        except Exception as e:
+            print(f"Warning: Metadata cache update failed: {e}")
+    
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            connection = self._get_connection()
+            connection.execute("DELETE FROM video_metadata")
+            connection.commit()
+    
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
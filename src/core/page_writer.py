@@ -0,0 +1,389 @@
+"""
+Page writer module for the Footage Thumbnailer application.
+
+This module saves contact sheet pages one at a time as they are composed, so
+multi-page output never has to hold more than one page in memory. Pages can
+also be rendered and encoded on a pool of worker threads. Single sheets can be
+streamed to PNG in horizontal bands, or written as Deep Zoom tile pyramids
+(.dzi outputs).
+"""
+
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Deque, Iterable, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from core.dzi_writer import DziWriter
+from utils.file_utils import generate_multi_page_filenames
+
+
+# Largest width or height each format can store (libjpeg stops short of 65,535)
+MAX_IMAGE_DIMENSIONS = {
+    "JPEG": 65500,
+    "WEBP": 16383,
+    "GIF": 65535,
+}
+
+
+class PageWriter:
+    """Saves contact sheet pages under their multi-page filenames as they arrive."""
+
+    def __init__(self, output_path: str, image_format: Optional[str] = None, workers: int = 1,
+                 **save_options: Any):
+        """
+        Initialize the page writer.
+
+        Args:
+            output_path: Output path of the first page. Later pages get
+                "_pageNN" suffixes (see generate_multi_page_filenames()).
+            image_format: Pillow format name. If None, it is derived from the
+                file extension.
+            workers: Threads rendering and encoding pages concurrently in
+                write_strips() and write_contact_sheets() (1 = sequential).
+            **save_options: Options passed to Image.save() (e.g. quality=95).
+        """
+        self.output_path = output_path
+        self.image_format = image_format
+        self.workers = max(1, workers)
+        self.save_options = save_options
+        self.saved_paths: List[str] = []
+        self.page_sizes: List[Tuple[int, int]] = []
+        # Share of each page's area covered by strips (None for pages not
+        # written from strips)
+        self.page_coverage: List[Optional[float]] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # (page index, future) of pages submitted to the pool, oldest first
+        self._pending: Deque[Tuple[int, Future]] = deque()
+
+    @staticmethod
+    def get_image_format(output_path: str) -> str:
+        """
+        Determine the image format from the output file extension.
+
+        Args:
+            output_path: Output file path.
+
+        Returns:
+            "PNG" for .png files, "DZI" for Deep Zoom outputs, "JPEG" otherwise.
+        """
+        if output_path.lower().endswith('.png'):
+            return 'PNG'
+        if output_path.lower().endswith('.dzi'):
+            return 'DZI'
+        return 'JPEG'
+
+    def get_output_format(self) -> str:
+        """
+        Get the format pages are actually saved in.
+
+        Returns:
+            Pillow format name.
+        """
+        if self.image_format:
+            return self.image_format.upper()
+        extension = Path(self.output_path).suffix.lower()
+        if extension == '.dzi':
+            return 'DZI'
+        return Image.registered_extensions().get(extension, 'JPEG')
+
+    def get_max_dimension(self) -> Optional[int]:
+        """
+        Get the largest page width or height the output format can store.
+
+        Returns:
+            Limit in pixels, or None if the format has no practical limit.
+        """
+        return MAX_IMAGE_DIMENSIONS.get(self.get_output_format())
+
+    def get_page_path(self, page_number: int) -> str:
+        """
+        Get the output path of a page.
+
+        Args:
+            page_number: 1-based page number.
+
+        Returns:
+            Output path of the page.
+        """
+        if page_number <= 1:
+            return self.output_path
+        return generate_multi_page_filenames(self.output_path, page_number)[-1]
+
+    def _next_page_path(self) -> str:
+        """Get the path of the next page and make sure its directory exists."""
+        page_path = self.get_page_path(len(self.saved_paths) + 1)
+        if not self.saved_paths:
+            Path(page_path).parent.mkdir(parents=True, exist_ok=True)
+        return page_path
+
+    def write(self, page: Image.Image) -> str:
+        """
+        Save the next page.
+
+        Args:
+            page: Page image. The writer keeps no reference to it.
+
+        Returns:
+            Path the page was saved to.
+        """
+        page_path = self._next_page_path()
+        self.save_image(page, page_path)
+        self.saved_paths.append(page_path)
+        self.page_sizes.append(page.size)
+        self.page_coverage.append(None)
+        return page_path
+
+    def save_image(self, page: Image.Image, page_path: str) -> None:
+        """
+        Save a page image to a specific path in the writer's format.
+
+        Args:
+            page: Page image.
+            page_path: Destination path.
+        """
+        if self.get_output_format() == 'DZI':
+            self._create_dzi_writer(page_path).write_image(page)
+        else:
+            page.save(page_path, format=self.image_format, **self.save_options)
+
+    def _create_dzi_writer(self, page_path: str) -> DziWriter:
+        """Create the Deep Zoom writer of a page."""
+        return DziWriter(page_path, quality=self.save_options.get("quality", 90))
+
+    def write_pages(self, pages: Iterable[Image.Image]) -> List[str]:
+        """
+        Save pages from an iterable, releasing each one before the next is built.
+
+        Args:
+            pages: Page images, typically ImageComposer.iter_pages().
+
+        Returns:
+            Paths of all pages saved by this writer.
+        """
+        for page in pages:
+            self.write(page)
+            # Drop the reference before the iterator builds the next page
+            del page
+        return self.saved_paths
+
+    def write_bands(self, size: Tuple[int, int], bands: Iterable[Image.Image]) -> str:
+        """
+        Stream the next page to PNG band by band.
+
+        Only one band is held in memory; the page itself is never assembled.
+
+        Args:
+            size: (width, height) of the page.
+            bands: RGB images as wide as the page, top to bottom, whose heights
+                add up to the page height.
+
+        Returns:
+            Path the page was saved to.
+        """
+        page_path = self._next_page_path()
+        self._write_png_bands(page_path, size, bands)
+        self.saved_paths.append(page_path)
+        self.page_sizes.append(size)
+        self.page_coverage.append(None)
+        return page_path
+
+    def _write_png_bands(self, page_path: str, size: Tuple[int, int], bands: Iterable[Image.Image]) -> None:
+        """
+        Stream a PNG file band by band.
+
+        Args:
+            page_path: Destination path.
+            size: (width, height) of the page.
+            bands: RGB images as wide as the page, top to bottom.
+        """
+        width, height = size
+        compress_level = 9 if self.save_options.get("optimize") else self.save_options.get("compress_level", 6)
+        temp_path = f"{page_path}.tmp"
+
+        def write_chunk(f, chunk_type: bytes, data: bytes) -> None:
+            f.write(struct.pack(">I", len(data)))
+            f.write(chunk_type)
+            f.write(data)
+            f.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(chunk_type)) & 0xFFFFFFFF))
+
+        with open(temp_path, 'wb') as f:
+            f.write(b"\x89PNG\r\n\x1a\n")
+            # 8-bit truecolor, no interlacing
+            write_chunk(f, b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+
+            compressor = zlib.compressobj(compress_level)
+            previous_row = np.zeros((1, width * 3), dtype=np.uint8)
+            rows_written = 0
+            for band in bands:
+                if band.mode != 'RGB' or band.width != width:
+                    raise ValueError(f"Band of size {band.size} does not match a {width} pixel wide RGB page")
+                rows = np.asarray(band, dtype=np.uint8).reshape(band.height, width * 3)
+                rows_written += band.height
+                del band
+
+                # PNG "Up" filter (type 2): each byte minus the byte above it, modulo 256
+                scanlines = np.empty((rows.shape[0], rows.shape[1] + 1), dtype=np.uint8)
+                scanlines[:, 0] = 2
+                np.subtract(rows, np.vstack((previous_row, rows[:-1])), out=scanlines[:, 1:])
+                previous_row = rows[-1:].copy()
+                del rows
+
+                compressed = compressor.compress(scanlines.tobytes())
+                if compressed:
+                    write_chunk(f, b"IDAT", compressed)
+
+            if rows_written != height:
+                raise ValueError(f"Bands cover {rows_written} rows of a {height} pixel high page")
+
+            write_chunk(f, b"IDAT", compressor.flush())
+            write_chunk(f, b"IEND", b"")
+
+        Path(temp_path).replace(page_path)
+
+    def write_strips(self, composer: Any, strips: List[Any], banded: bool = False) -> List[str]:
+        """
+        Compose and save the strips of one page.
+
+        Pages too tall for the output format are split into several pages.
+        With several workers the pages are only submitted to the pool; they
+        are complete once close() returns.
+
+        Args:
+            composer: ImageComposer that created the strips.
+            strips: StripLayouts or strip images of the page.
+            banded: Stream PNG output in bands instead of composing the whole page.
+                Deep Zoom output is always built from bands.
+
+        Returns:
+            Paths of the pages saved for these strips.
+        """
+        first_page = len(self.saved_paths)
+
+        for page_strips in composer.split_strips_to_fit(strips, self.get_max_dimension()):
+            page_path = self._next_page_path()
+            self.page_coverage.append(composer.get_page_geometry(page_strips).coverage if page_strips else None)
+            if self.workers == 1:
+                size = self._render_page(composer, page_strips, page_path, banded)
+                self.saved_paths.append(page_path)
+                self.page_sizes.append(size)
+                continue
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="page")
+            # At most one page per worker is rendered or encoded at a time,
+            # which bounds memory to that many pages
+            while len(self._pending) >= self.workers:
+                self._collect_page()
+
+            # The path is assigned now, so pages keep their order whatever
+            # order they finish in
+            self.saved_paths.append(page_path)
+            self.page_sizes.append((0, 0))
+            self._pending.append((
+                len(self.saved_paths) - 1,
+                self._executor.submit(self._render_page, composer, page_strips, page_path, banded)
+            ))
+
+        return self.saved_paths[first_page:]
+
+    def _render_page(self, composer: Any, strips: List[Any], page_path: str, banded: bool) -> Tuple[int, int]:
+        """
+        Compose one page and save it to its path.
+
+        Args:
+            composer: ImageComposer that created the strips.
+            strips: StripLayouts or strip images of the page.
+            page_path: Destination path.
+            banded: Stream PNG output in bands instead of composing the whole page.
+
+        Returns:
+            (width, height) of the page.
+        """
+        output_format = self.get_output_format()
+
+        if strips and (output_format == 'DZI' or (banded and output_format == 'PNG')):
+            geometry = composer.get_page_geometry(strips)
+            size = (geometry.width, geometry.height)
+            if output_format == 'DZI':
+                self._create_dzi_writer(page_path).write(size, composer.iter_page_bands(strips))
+            else:
+                self._write_png_bands(page_path, size, composer.iter_page_bands(strips))
+            return size
+
+        page = composer.compose_page(strips)
+        self.save_image(page, page_path)
+        return page.size
+
+    def get_average_coverage(self) -> Optional[float]:
+        """
+        Get the share of the written page area that is covered by strips.
+
+        Call it after close(), once all page sizes are known.
+
+        Returns:
+            Coverage between 0 and 1 weighted by page area, or None if no
+            page was written from strips.
+        """
+        pages = [
+            (coverage, width * height)
+            for coverage, (width, height) in zip(self.page_coverage, self.page_sizes)
+            if coverage is not None and width * height
+        ]
+        total_area = sum(area for _, area in pages)
+        if not total_area:
+            return None
+        return sum(coverage * area for coverage, area in pages) / total_area
+
+    def _collect_page(self) -> None:
+        """Wait for the oldest page submitted to the pool and record its size."""
+        index, future = self._pending.popleft()
+        self.page_sizes[index] = future.result()
+
+    def close(self) -> List[str]:
+        """
+        Wait for all pages submitted to the pool and stop the pool.
+
+        Returns:
+            Paths of all pages saved by this writer.
+
+        Raises:
+            Exception: The first error raised while rendering or saving a page,
+                once the pages in progress have finished.
+        """
+        try:
+            while self._pending:
+                self._collect_page()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+            self._pending.clear()
+        return self.saved_paths
+
+    def write_contact_sheets(self, composer: Any, video_data_list: List[Any], banded: bool = False) -> List[str]:
+        """
+        Compose and save all contact sheet pages for a list of videos.
+
+        Args:
+            composer: ImageComposer holding the composition settings.
+            video_data_list: List of VideoData objects containing thumbnails.
+            banded: Stream PNG output in bands instead of composing whole pages.
+
+        Returns:
+            Paths of all pages saved by this writer.
+        """
+        if not any(vd.processing_status == "success" and vd.thumbnails for vd in video_data_list):
+            # Placeholder page
+            return self.write_pages(composer.iter_pages(video_data_list))
+
+        try:
+            for page_strips in composer.iter_page_strips(video_data_list):
+                self.write_strips(composer, page_strips, banded)
+        finally:
+            self.close()
+        return self.saved_paths
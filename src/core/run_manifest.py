@@ -0,0 +1,177 @@
+"""
+Run manifest module for the Footage Thumbnailer application.
+
+This module records which source files and settings produced which output
+pages, so that incremental runs can skip unchanged files and pages.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Configuration keys that affect the rendered pages
+RENDER_SETTINGS_KEYS = (
+    "positions",
+    "thumbnail_width",
+    "extraction_mode",
+    "frame_backend",
+    "clips_per_row",
+    "padding",
+    "background_color",
+    "font_size",
+    "text_color",
+    "overlay_background_color",
+    "overlay_background_opacity",
+    "overlay_position",
+    "show_frame",
+    "frame_color",
+    "frame_thickness",
+    "frame_padding",
+    "max_rows_per_image",
+    "layout_mode",
+)
+
+
+class RunManifest:
+    """Manifest of the files, settings and pages of the previous run."""
+
+    VERSION = 1
+
+    def __init__(self, manifest_path: str):
+        """
+        Initialize an empty run manifest.
+
+        Args:
+            manifest_path: Path of the manifest JSON file.
+        """
+        self.manifest_path = manifest_path
+        self.settings_hash: Optional[str] = None
+        # Normalized path -> {"size", "mtime_ns", "status"}
+        self.files: Dict[str, Dict[str, Any]] = {}
+        # One {"path", "signature"} entry per output page
+        self.pages: List[Dict[str, str]] = []
+
+    @staticmethod
+    def get_manifest_path(output_path: str) -> str:
+        """
+        Get the manifest path belonging to an output image.
+
+        Args:
+            output_path: Output path of the contact sheet.
+
+        Returns:
+            Manifest path next to the output (e.g. "output/overview.manifest.json").
+        """
+        path = Path(output_path)
+        return str(path.parent / f"{path.stem}.manifest.json")
+
+    @staticmethod
+    def compute_settings_hash(config: Dict[str, Any]) -> str:
+        """
+        Hash the settings that affect the rendered pages.
+
+        Args:
+            config: Configuration dictionary.
+
+        Returns:
+            Hex digest of the render settings.
+        """
+        settings = {key: config.get(key) for key in RENDER_SETTINGS_KEYS}
+        return hashlib.sha1(json.dumps(settings, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def compute_page_signature(settings_hash: str, identities: List[Tuple[str, int, int]]) -> str:
+        """
+        Compute the signature of a page from its settings and source files.
+
+        Args:
+            settings_hash: Hash from compute_settings_hash().
+            identities: (path, size, mtime_ns) of the files on the page, in page order.
+
+        Returns:
+            Hex digest identifying the page content.
+        """
+        digest = hashlib.sha1(settings_hash.encode('utf-8'))
+        for path, size, mtime_ns in identities:
+            digest.update(f"\n{path}|{size}|{mtime_ns}".encode('utf-8'))
+        return digest.hexdigest()
+
+    def load(self) -> bool:
+        """
+        Load the manifest from disk.
+
+        Returns:
+            True if a valid manifest was loaded, False otherwise.
+        """
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if data.get("version") != self.VERSION:
+                return False
+
+            self.settings_hash = data["settings_hash"]
+            self.files = dict(data["files"])
+            self.pages = list(data["pages"])
+            return True
+
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Warning: Ignoring unreadable run manifest {self.manifest_path}: {e}")
+            return False
+
+    def save(self) -> bool:
+        """
+        Write the manifest to disk.
+
+        Returns:
+            True if the manifest was saved, False otherwise.
+        """
+        data = {
+            "version": self.VERSION,
+            "settings_hash": self.settings_hash,
+            "files": self.files,
+            "pages": self.pages,
+        }
+
+        try:
+            temp_path = f"{self.manifest_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=1)
+            os.replace(temp_path, self.manifest_path)
+            return True
+
+        except OSError as e:
+            print(f"Error saving run manifest {self.manifest_path}: {e}")
+            return False
+
+    def get_file_status(self, identity: Tuple[str, int, int]) -> Optional[str]:
+        """
+        Get the recorded processing status of an unchanged file.
+
+        Args:
+            identity: (path, size, mtime_ns) of the file.
+
+        Returns:
+            Recorded status, or None if the file is new or has changed.
+        """
+        path, size, mtime_ns = identity
+        entry = self.files.get(path)
+        if entry is None or entry.get("size") != size or entry.get("mtime_ns") != mtime_ns:
+            return None
+        return entry.get("status")
+
+    def set_file(self, identity: Tuple[str, int, int], status: str) -> None:
+        """
+        Record the processing status of a file.
+
+        Args:
+            identity: (path, size, mtime_ns) of the file.
+            status: Processing status ("success" or "failed").
+        """
+        path, size, mtime_ns = identity
+        self.files[path] = {"size": size, "mtime_ns": mtime_ns, "status": status}
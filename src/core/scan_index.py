@@ -0,0 +1,171 @@
+"""
+Scan index module for the Footage Thumbnailer application.
+
+This module provides a persistent SQLite index of directory listings so that
+directories whose modification time has not changed are answered without
+listing them again.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from utils.file_utils import FileEntry
+
+
+class ScanIndex:
+    """Persistent index of directory listings keyed by directory path and mtime."""
+
+    DB_FILENAME = "scan_index.sqlite"
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize the scan index.
+
+        Args:
+            cache_dir: Directory holding the index database. Created on first use.
+        """
+        self.cache_dir = cache_dir
+        self.db_path = os.path.join(cache_dir, self.DB_FILENAME)
+        # Directory path -> (mtime_ns, extension signature, files, subdirectories)
+        self._entries: Optional[Dict[str, Tuple[int, str, List[FileEntry], List[str]]]] = None
+        self._dirty: Dict[str, Tuple[int, str, List[FileEntry], List[str]]] = {}
+        self._removed: List[str] = []
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> None:
+        """Load all index rows into memory (lock must be held)."""
+        self._entries = {}
+        if not os.path.exists(self.db_path):
+            return
+
+        try:
+            connection = sqlite3.connect(self.db_path, timeout=30)
+            try:
+                rows = connection.execute(
+                    "SELECT path, mtime_ns, extensions, files, subdirectories FROM directories"
+                ).fetchall()
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not read scan index: {e}")
+            return
+
+        for path, mtime_ns, extensions, files, subdirectories in rows:
+            try:
+                self._entries[path] = (
+                    mtime_ns,
+                    extensions,
+                    [FileEntry(*entry) for entry in json.loads(files)],
+                    json.loads(subdirectories)
+                )
+            except (ValueError, TypeError):
+                continue
+
+    def lookup(
+        self,
+        directory_path: str,
+        mtime_ns: int,
+        extension_signature: str
+    ) -> Optional[Tuple[List[FileEntry], List[str]]]:
+        """
+        Look up the indexed listing of an unchanged directory.
+
+        Args:
+            directory_path: Path of the directory.
+            mtime_ns: Current modification time of the directory.
+            extension_signature: Identifies the extension filter of the listing.
+
+        Returns:
+            Tuple of (files, subdirectories), or None if the directory is not
+            indexed or changed since it was indexed.
+        """
+        with self._lock:
+            if self._entries is None:
+                self._load()
+            entry = self._entries.get(directory_path)
+
+            if entry is None or entry[0] != mtime_ns or entry[1] != extension_signature:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return entry[2], entry[3]
+
+    def store(
+        self,
+        directory_path: str,
+        mtime_ns: int,
+        extension_signature: str,
+        files: List[FileEntry],
+        subdirectories: List[str]
+    ) -> None:
+        """
+        Record a fresh directory listing.
+
+        Args:
+            directory_path: Path of the directory.
+            mtime_ns: Modification time of the directory when it was listed.
+            extension_signature: Identifies the extension filter of the listing.
+            files: Matching files of the directory.
+            subdirectories: Subdirectories of the directory.
+        """
+        entry = (mtime_ns, extension_signature, files, subdirectories)
+
+        with self._lock:
+            if self._entries is None:
+                self._load()
+            previous = self._entries.get(directory_path)
+            if previous is not None:
+                # Subtrees of removed subdirectories are dropped from the index
+                self._removed.extend(set(previous[3]) - set(subdirectories))
+            self._entries[directory_path] = entry
+            self._dirty[directory_path] = entry
+
+    def save(self) -> None:
+        """Write listings recorded since the last save to disk."""
+        with self._lock:
+            if not self._dirty and not self._removed:
+                return
+            dirty, self._dirty = self._dirty, {}
+            removed, self._removed = self._removed, []
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            connection = sqlite3.connect(self.db_path, timeout=30)
+            try:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS directories ("
+                    "path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, extensions TEXT NOT NULL, "
+                    "files TEXT NOT NULL, subdirectories TEXT NOT NULL)"
+                )
+                for path in removed:
+                    connection.execute(
+                        "DELETE FROM directories WHERE path = ? OR substr(path, 1, ?) = ?",
+                        (path, len(path) + 1, path + os.sep)
+                    )
+                connection.executemany(
+                    "INSERT OR REPLACE INTO directories (path, mtime_ns, extensions, files, subdirectories) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (path, mtime_ns, extensions, json.dumps([list(f) for f in files]), json.dumps(subdirectories))
+                        for path, (mtime_ns, extensions, files, subdirectories) in dirty.items()
+                    ]
+                )
+                connection.commit()
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not update scan index: {e}")
+
+        with self._lock:
+            if self._entries is not None:
+                for path in removed:
+                    prefix = path + os.sep
+                    for key in [k for k in self._entries if k == path or k.startswith(prefix)]:
+                        if key not in dirty and key not in self._dirty:
+                            del self._entries[key]
@@ -0,0 +1,249 @@
+"""
+Thumbnail cache module for the Footage Thumbnailer application.
+
+This module provides a content-addressed disk cache of extracted thumbnails
+with a byte budget and least-recently-used eviction, so that changing only the
+composition settings does not require decoding the source videos again.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+
+from PIL import Image
+
+from utils.file_utils import get_file_identity
+
+
+class ThumbnailCache:
+    """Disk cache of thumbnails keyed by file identity, timestamp, width and extraction mode."""
+
+    DB_FILENAME = "thumbnail_cache.sqlite"
+    IMAGE_DIRNAME = "thumbnails"
+    # Access times of cache hits are written in batches of this size
+    TOUCH_BATCH_SIZE = 256
+
+    def __init__(self, cache_dir: str, max_bytes: int = 1024 * 1024 * 1024):
+        """
+        Initialize the thumbnail cache.
+
+        Args:
+            cache_dir: Directory holding the cache. Created on first use.
+            max_bytes: Byte budget for stored thumbnails. Least recently used
+                entries are evicted when it is exceeded.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.db_path = os.path.join(cache_dir, self.DB_FILENAME)
+        self.image_dir = os.path.join(cache_dir, self.IMAGE_DIRNAME)
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._total_bytes = 0
+        self._pending_touches = []
+        self._lock = threading.Lock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Open the cache index lazily.
+
+        Returns:
+            SQLite connection to the cache index.
+        """
+        if self._connection is None:
+            os.makedirs(self.image_dir, exist_ok=True)
+            connection = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS thumbnails ("
+                "key TEXT PRIMARY KEY, frame_number INTEGER NOT NULL, "
+                "size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON thumbnails (last_access)")
+            connection.commit()
+            self._total_bytes = connection.execute("SELECT COALESCE(SUM(size), 0) FROM thumbnails").fetchone()[0]
+            self._connection = connection
+        return self._connection
+
+    def make_key(
+        self,
+        video_path: str,
+        position_seconds: float,
+        thumbnail_width: int,
+        extraction_mode: str
+    ) -> Optional[str]:
+        """
+        Build the cache key for a thumbnail.
+
+        Args:
+            video_path: Path to the video file.
+            position_seconds: Resolved timestamp of the thumbnail in seconds.
+            thumbnail_width: Width of the thumbnail.
+            extraction_mode: Identifier of the extraction settings that affect pixels.
+
+        Returns:
+            Hex digest key, or None if the file cannot be accessed.
+        """
+        identity = get_file_identity(video_path)
+        if identity is None:
+            return None
+
+        path, size, mtime_ns = identity
+        key_source = f"{path}|{size}|{mtime_ns}|{position_seconds:.3f}|{thumbnail_width}|{extraction_mode}"
+        return hashlib.sha1(key_source.encode('utf-8')).hexdigest()
+
+    def _image_path(self, key: str) -> str:
+        """Get the file path of a cached thumbnail."""
+        return os.path.join(self.image_dir, key[:2], f"{key}.png")
+
+    def get(self, key: Optional[str]) -> Optional[Tuple[Image.Image, int]]:
+        """
+        Look up a cached thumbnail.
+
+        Args:
+            key: Cache key from make_key().
+
+        Returns:
+            Tuple of (image, frame_number), or None on a cache miss.
+        """
+        if key is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        try:
+            with self._lock:
+                connection = self._get_connection()
+                row = connection.execute(
+                    "SELECT frame_number FROM thumbnails WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    self._pending_touches.append((time.time(), key))
+                    if len(self._pending_touches) >= self.TOUCH_BATCH_SIZE:
+                        self._flush_touches(connection)
+
+            if row is not None:
+                with Image.open(self._image_path(key)) as image:
+                    image.load()
+                    result = image.convert('RGB')
+                with self._lock:
+                    self.hits += 1
+                return result, row[0]
+        except (OSError, sqlite3.Error) as e:
+            # Missing or unreadable image file - treat as a miss
+            if not isinstance(e, FileNotFoundError):
+                print(f"Warning: Thumbnail cache lookup failed: {e}")
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: Optional[str], image: Image.Image, frame_number: int) -> None:
+        """
+        Store a thumbnail and evict old entries if over budget.
+
+        Args:
+            key: Cache key from make_key().
+            image: Thumbnail image.
+            frame_number: Frame index the thumbnail was taken from.
+        """
+        if key is None or self.max_bytes <= 0:
+            return
+
+        image_path = self._image_path(key)
+
+        try:
+            with self._lock:
+                connection = self._get_connection()
+                os.makedirs(os.path.dirname(image_path), exist_ok=True)
+                temp_path = f"{image_path}.{os.getpid()}.tmp"
+                image.save(temp_path, format='PNG', compress_level=1)
+                os.replace(temp_path, image_path)
+                size = os.path.getsize(image_path)
+
+                previous = connection.execute(
+                    "SELECT size FROM thumbnails WHERE key = ?", (key,)
+                ).fetchone()
+                connection.execute(
+                    "INSERT OR REPLACE INTO thumbnails (key, frame_number, size, last_access) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, frame_number, size, time.time())
+                )
+                connection.commit()
+                self._total_bytes += size - (previous[0] if previous else 0)
+
+                if self._total_bytes > self.max_bytes:
+                    self._flush_touches(connection)
+                    self._evict(connection)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: Thumbnail cache update failed: {e}")
+
+    def _flush_touches(self, connection: sqlite3.Connection) -> None:
+        """
+        Write buffered access times of cache hits.
+
+        Args:
+            connection: Open cache index connection (lock must be held).
+        """
+        if self._pending_touches:
+            connection.executemany("UPDATE thumbnails SET last_access = ? WHERE key = ?", self._pending_touches)
+            connection.commit()
+            self._pending_touches = []
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """
+        Evict least recently used entries until the cache fits its budget.
+
+        Args:
+            connection: Open cache index connection (lock must be held).
+        """
+        # Other processes may share the cache, so start from the real total
+        self._total_bytes = connection.execute("SELECT COALESCE(SUM(size), 0) FROM thumbnails").fetchone()[0]
+
+        rows = connection.execute("SELECT key, size FROM thumbnails ORDER BY last_access ASC")
+        evicted = []
+        for key, size in rows:
+            if self._total_bytes <= self.max_bytes:
+                break
+            evicted.append(key)
+            self._total_bytes -= size
+
+        for key in evicted:
+            try:
+                os.remove(self._image_path(key))
+            except OSError:
+                pass
+
+        connection.executemany("DELETE FROM thumbnails WHERE key = ?", [(key,) for key in evicted])
+        connection.commit()
+
+    def get_total_bytes(self) -> int:
+        """
+        Get the number of bytes currently stored.
+
+        Returns:
+            Total size of cached thumbnails in bytes.
+        """
+        with self._lock:
+            connection = self._get_connection()
+            return connection.execute("SELECT COALESCE(SUM(size), 0) FROM thumbnails").fetchone()[0]
+
+    def flush(self) -> None:
+        """Write buffered access times of cache hits to the cache index."""
+        with self._lock:
+            if self._connection is not None:
+                try:
+                    self._flush_touches(self._connection)
+                except sqlite3.Error as e:
+                    print(f"Warning: Thumbnail cache update failed: {e}")
+
+    def close(self) -> None:
+        """Write buffered access times and close the cache index."""
+        self.flush()
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
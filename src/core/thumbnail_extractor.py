@@ -5,10 +5,13 @@ This module provides functionality to extract frames from video files at specifi
 time positions and retrieve video metadata using FFmpeg and OpenCV.
 """
 
+import io
 import os
 import re
 import cv2
 import ffmpeg
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from typing import List, Optional, Tuple, Dict, Any
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -16,6 +19,9 @@ from PIL import Image
 import numpy as np
 
 from core.video_scanner import VideoFile
+from core.metadata_cache import MetadataCache
+from core.thumbnail_cache import ThumbnailCache
+from utils.image_utils import fit_image_to_cell, get_uniform_cell_size
 
 
 @dataclass
@@ -38,6 +44,19 @@ class VideoMetadata:
             "codec": self.codec,
             "format": self.format
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "VideoMetadata":
+        """Create from a dictionary produced by to_dict()."""
+        creation_date = data.get("creation_date")
+        return cls(
+            duration=float(data["duration"]),
+            creation_date=datetime.fromisoformat(creation_date) if creation_date else None,
+            resolution=tuple(data["resolution"]),
+            fps=float(data["fps"]),
+            codec=data["codec"],
+            format=data["format"]
+        )
 
 
 @dataclass
@@ -55,6 +74,16 @@ class ThumbnailData:
             "timestamp": self.timestamp,
             "frame_number": self.frame_number
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], image: Image.Image) -> "ThumbnailData":
+        """Create from a dictionary produced by to_dict() and the thumbnail image."""
+        return cls(
+            image=image,
+            position=float(data["position"]),
+            timestamp=data["timestamp"],
+            frame_number=int(data["frame_number"])
+        )
 
 
 @dataclass
@@ -77,18 +106,73 @@ class VideoData:
         }
 
 
+# Supported frame extraction modes:
+# "seek"        - seek to every requested position independently (original behavior)
+# "single_pass" - visit positions in frame order in one forward pass over the file
+EXTRACTION_MODES = ("seek", "single_pass")
+
+# Supported frame sources:
+# "opencv" - decode full-resolution frames with OpenCV and resize them in Python
+# "ffmpeg" - let an ffmpeg pipe scale frames to the thumbnail size while decoding
+FRAME_BACKENDS = ("opencv", "ffmpeg")
+
+# In single-pass mode, targets closer than this to the current decoder position
+# are reached by grabbing frames forward instead of seeking (which restarts
+# decoding at the previous keyframe).
+SINGLE_PASS_MAX_GAP_SECONDS = 2.0
+
+# Default byte budget of the persistent thumbnail cache
+DEFAULT_THUMBNAIL_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+
 class ThumbnailExtractor:
     """Extracts thumbnails and metadata from video files."""
     
-    def __init__(self):
-        """Initialize the thumbnail extractor."""
+    def __init__(
+        self,
+        extraction_mode: str = "seek",
+        frame_backend: str = "opencv",
+        metadata_cache_dir: Optional[str] = None,
+        thumbnail_cache_dir: Optional[str] = None,
+        thumbnail_cache_max_bytes: int = DEFAULT_THUMBNAIL_CACHE_MAX_BYTES,
+        uniform_cells: bool = False
+    ):
+        """
+        Initialize the thumbnail extractor.
+        
+        Args:
+            extraction_mode: Frame extraction mode ("seek" or "single_pass").
+                Only applies to the OpenCV frame backend.
+            frame_backend: Frame source ("opencv" or "ffmpeg").
+            metadata_cache_dir: Directory of the persistent metadata cache.
+                If None, metadata is only cached for the lifetime of this extractor.
+            thumbnail_cache_dir: Directory of the persistent thumbnail cache.
+                If None, thumbnails are always decoded.
+            thumbnail_cache_max_bytes: Byte budget of the thumbnail cache.
+            uniform_cells: Fit every frame into a fixed 16:9 cell derived from
+                the thumbnail width (letterboxed or pillarboxed), instead of
+                keeping the frame's own aspect ratio.
+        """
         self.temp_frame_count = 0
+        self.extraction_mode = extraction_mode if extraction_mode in EXTRACTION_MODES else "seek"
+        self.frame_backend = frame_backend if frame_backend in FRAME_BACKENDS else "opencv"
+        self.metadata_cache_dir = metadata_cache_dir
+        self.metadata_cache = MetadataCache(metadata_cache_dir) if metadata_cache_dir else None
+        # Per-run memo so each file is probed at most once
+        self._metadata_memo: Dict[str, VideoMetadata] = {}
+        self.thumbnail_cache_dir = thumbnail_cache_dir
+        self.thumbnail_cache_max_bytes = thumbnail_cache_max_bytes
+        self.thumbnail_cache = (
+            ThumbnailCache(thumbnail_cache_dir, thumbnail_cache_max_bytes) if thumbnail_cache_dir else None
+        )
+        self.uniform_cells = uniform_cells
     
     def extract_thumbnails(
         self, 
         video_path: str, 
         positions: List[str],
-        thumbnail_width: int = 320
+        thumbnail_width: int = 320,
+        metadata: Optional[VideoMetadata] = None
     ) -> List[ThumbnailData]:
         """
         Extract thumbnails from a video at specified positions.
@@ -97,17 +181,145 @@ class ThumbnailExtractor:
             video_path: Path to the video file.
             positions: List of position strings (e.g., ["0%", "50%", "99%"]).
             thumbnail_width: Target width for thumbnails.
+            metadata: Already known metadata of the video. Probed if None.
             
         Returns:
             List of ThumbnailData objects containing extracted thumbnails.
         """
-        thumbnails = []
-        
         try:
             # Get video metadata first
-            metadata = self.get_video_metadata(video_path)
             if metadata is None:
-                return thumbnails
+                metadata = self.get_video_metadata(video_path)
+            if metadata is None:
+                return []
+            
+            if self.thumbnail_cache is not None:
+                return self._extract_thumbnails_cached(video_path, positions, thumbnail_width, metadata)
+            
+            return self._decode_thumbnails(video_path, positions, thumbnail_width, metadata)
+            
+        except Exception as e:
+            print(f"Error extracting thumbnails from {video_path}: {e}")
+            return []
+    
+    def _extract_thumbnails_cached(
+        self,
+        video_path: str,
+        positions: List[str],
+        thumbnail_width: int,
+        metadata: VideoMetadata
+    ) -> List[ThumbnailData]:
+        """
+        Extract thumbnails, serving them from the thumbnail cache where possible.
+        
+        Positions are resolved from the metadata alone, so the video is only
+        opened if at least one thumbnail is missing from the cache.
+        
+        Args:
+            video_path: Path to the video file.
+            positions: List of position strings.
+            thumbnail_width: Target width for thumbnails.
+            metadata: Metadata of the video file.
+            
+        Returns:
+            List of ThumbnailData objects in the requested position order.
+        """
+        cache_mode = self._get_cache_mode()
+        resolved_keys = []
+        thumbnails_by_key: Dict[str, ThumbnailData] = {}
+        missing_positions = []
+        missing_keys = set()
+        
+        for position_str in positions:
+            position_seconds = self.parse_time_position(position_str, metadata.duration)
+            if position_seconds is None:
+                continue
+            
+            key = self.thumbnail_cache.make_key(video_path, position_seconds, thumbnail_width, cache_mode)
+            if key is None:
+                # File identity unavailable - nothing can be cached
+                return self._decode_thumbnails(video_path, positions, thumbnail_width, metadata)
+            
+            resolved_keys.append(key)
+            if key in thumbnails_by_key or key in missing_keys:
+                continue
+            
+            cached = self.thumbnail_cache.get(key)
+            if cached is not None:
+                image, frame_number = cached
+                thumbnails_by_key[key] = ThumbnailData(
+                    image=image,
+                    position=position_seconds,
+                    timestamp=self._format_timestamp(position_seconds),
+                    frame_number=frame_number
+                )
+            else:
+                missing_positions.append(position_str)
+                missing_keys.add(key)
+        
+        if missing_positions:
+            for thumbnail in self._decode_thumbnails(video_path, missing_positions, thumbnail_width, metadata):
+                key = self.thumbnail_cache.make_key(video_path, thumbnail.position, thumbnail_width, cache_mode)
+                self.thumbnail_cache.put(key, thumbnail.image, thumbnail.frame_number)
+                thumbnails_by_key[key] = thumbnail
+        
+        return [thumbnails_by_key[key] for key in resolved_keys if key in thumbnails_by_key]
+    
+    def _get_cache_mode(self) -> str:
+        """
+        Get the identifier of the extraction settings that affect thumbnail pixels.
+        
+        Returns:
+            Extraction mode string used in thumbnail cache keys.
+        """
+        cache_mode = f"{self.frame_backend}/{self.extraction_mode}"
+        return f"{cache_mode}/cells" if self.uniform_cells else cache_mode
+    
+    def get_cache_summary(self) -> Optional[str]:
+        """
+        Describe the thumbnail cache hit/miss counters of this run.
+        
+        Returns:
+            Summary string, or None if the thumbnail cache is disabled.
+        """
+        if self.thumbnail_cache is None:
+            return None
+        
+        hits = self.thumbnail_cache.hits
+        misses = self.thumbnail_cache.misses
+        total = hits + misses
+        hit_rate = (hits / total * 100) if total else 0.0
+        return f"Thumbnail cache: {hits} hits, {misses} misses ({hit_rate:.1f}% hit rate)"
+    
+    def flush_cache(self) -> None:
+        """Write buffered thumbnail cache updates (access times of cache hits)."""
+        if self.thumbnail_cache is not None:
+            self.thumbnail_cache.flush()
+    
+    def _decode_thumbnails(
+        self,
+        video_path: str,
+        positions: List[str],
+        thumbnail_width: int,
+        metadata: VideoMetadata
+    ) -> List[ThumbnailData]:
+        """
+        Decode thumbnails from the video file with the configured backend.
+        
+        Args:
+            video_path: Path to the video file.
+            positions: List of position strings.
+            thumbnail_width: Target width for thumbnails.
+            metadata: Metadata of the video file.
+            
+        Returns:
+            List of ThumbnailData objects in the requested position order.
+        """
+        thumbnails = []
+        
+        try:
+            if self.frame_backend == "ffmpeg":
+                return self._extract_thumbnails_ffmpeg(video_path, positions, thumbnail_width, metadata)
             
             # Open video file with OpenCV
             cap = cv2.VideoCapture(video_path)
@@ -115,75 +327,328 @@ class ThumbnailExtractor:
                 print(f"Error: Could not open video file {video_path}")
                 return thumbnails
             
-            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            
-            if fps <= 0:
-                fps = metadata.fps
-            
-            # Extract thumbnails at each position
-            for i, position_str in enumerate(positions):
-                try:
-                    # Parse the position
-                    position_seconds = self.parse_time_position(position_str, metadata.duration)
-                    
-                    if position_seconds is None:
-                        continue
-                    
-                    # Calculate frame number
-                    frame_number = int(position_seconds * fps)
-                    frame_number = max(0, min(frame_number, total_frames - 1))
-                    
-                    # Seek to the frame
-                    cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-                    
-                    # Read the frame
-                    ret, frame = cap.read()
-                    if not ret:
-                        print(f"Warning: Could not read frame at position {position_str} for {video_path}")
+            try:
+                total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+                fps = cap.get(cv2.CAP_PROP_FPS)
+                
+                if fps <= 0:
+                    fps = metadata.fps
+                
+                targets = self._resolve_frame_targets(positions, metadata.duration, fps, total_frames)
+                
+                if self.extraction_mode == "single_pass":
+                    frames = self._read_frames_single_pass(cap, [frame for _, _, frame in targets], fps)
+                else:
+                    frames = None
+                
+                # Build thumbnails in the requested position order
+                for position_str, position_seconds, frame_number in targets:
+                    try:
+                        if frames is not None:
+                            frame = frames.get(frame_number)
+                        else:
+                            frame = self._read_frame_at(cap, frame_number)
+                        
+                        if frame is None:
+                            print(f"Warning: Could not read frame at position {position_str} for {video_path}")
+                            continue
+                        
+                        thumbnails.append(self._create_thumbnail_data(
+                            frame, position_seconds, frame_number, thumbnail_width
+                        ))
+                        
+                    except Exception as e:
+                        print(f"Error extracting thumbnail at position {position_str} for {video_path}: {e}")
                         continue
-                    
-                    # Convert BGR to RGB
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    
-                    # Convert to PIL Image
-                    pil_image = Image.fromarray(frame_rgb)
-                    
-                    # Resize proportionally
-                    original_width, original_height = pil_image.size
-                    aspect_ratio = original_height / original_width
-                    target_height = int(thumbnail_width * aspect_ratio)
-                    
-                    resized_image = pil_image.resize(
-                        (thumbnail_width, target_height), 
-                        Image.Resampling.LANCZOS
-                    )
-                    
-                    # Create timestamp string
-                    timestamp = self._format_timestamp(position_seconds)
-                    
-                    # Create thumbnail data
-                    thumbnail = ThumbnailData(
-                        image=resized_image,
-                        position=position_seconds,
-                        timestamp=timestamp,
-                        frame_number=frame_number
-                    )
-                    
-                    thumbnails.append(thumbnail)
-                    
-                except Exception as e:
-                    print(f"Error extracting thumbnail at position {position_str} for {video_path}: {e}")
-                    continue
-            
-            cap.release()
+            finally:
+                cap.release()
             
         except Exception as e:
             print(f"Error extracting thumbnails from {video_path}: {e}")
         
         return thumbnails
     
-    def get_video_metadata(self, video_path: str) -> Optional[VideoMetadata]:
+    def _extract_thumbnails_ffmpeg(
+        self,
+        video_path: str,
+        positions: List[str],
+        thumbnail_width: int,
+        metadata: VideoMetadata
+    ) -> List[ThumbnailData]:
+        """
+        Extract thumbnails through ffmpeg with decode-time downscaling.
+        
+        Each frame is scaled to the thumbnail size inside ffmpeg, so no
+        full-resolution frame is ever transferred to or held by Python.
+        
+        Args:
+            video_path: Path to the video file.
+            positions: List of position strings.
+            thumbnail_width: Target width for thumbnails.
+            metadata: Metadata of the video file.
+            
+        Returns:
+            List of ThumbnailData objects in the requested position order.
+        """
+        thumbnails = []
+        fps = metadata.fps if metadata.fps > 0 else 30.0
+        total_frames = max(1, int(metadata.duration * fps))
+        
+        for position_str, position_seconds, frame_number in self._resolve_frame_targets(
+            positions, metadata.duration, fps, total_frames
+        ):
+            try:
+                # Seek to the clamped frame - positions near the end may lie past the last frame
+                image = self._read_scaled_frame_ffmpeg(video_path, frame_number / fps, thumbnail_width)
+                if image is None:
+                    print(f"Warning: Could not read frame at position {position_str} for {video_path}")
+                    continue
+                
+                thumbnails.append(ThumbnailData(
+                    image=image,
+                    position=position_seconds,
+                    timestamp=self._format_timestamp(position_seconds),
+                    frame_number=frame_number
+                ))
+                
+            except Exception as e:
+                print(f"Error extracting thumbnail at position {position_str} for {video_path}: {e}")
+                continue
+        
+        return thumbnails
+    
+    def _read_scaled_frame_ffmpeg(
+        self,
+        video_path: str,
+        position_seconds: float,
+        thumbnail_width: int
+    ) -> Optional[Image.Image]:
+        """
+        Decode a single frame with ffmpeg, already scaled to the thumbnail width.
+        
+        Args:
+            video_path: Path to the video file.
+            position_seconds: Timestamp of the frame in seconds.
+            thumbnail_width: Target width for the thumbnail.
+            
+        Returns:
+            RGB PIL Image of the scaled frame, or None if no frame was decoded.
+        """
+        try:
+            stream = ffmpeg.input(video_path, ss=position_seconds)
+            if self.uniform_cells:
+                cell_width, cell_height = get_uniform_cell_size(thumbnail_width)
+                stream = (
+                    stream
+                    .filter('scale', cell_width, cell_height, force_original_aspect_ratio='decrease', flags='lanczos')
+                    .filter('pad', cell_width, cell_height, '(ow-iw)/2', '(oh-ih)/2', color='black')
+                )
+            else:
+                # Height follows the same proportional rounding as the OpenCV path
+                stream = stream.filter('scale', thumbnail_width, 'trunc(ow*ih/iw)', flags='lanczos')
+            out, _ = (
+                stream
+                .output('pipe:', vframes=1, format='image2pipe', vcodec='bmp')
+                .run(capture_stdout=True, capture_stderr=True)
+            )
+        except ffmpeg.Error as e:
+            stderr = e.stderr.decode('utf-8', errors='replace').strip() if e.stderr else str(e)
+            print(f"ffmpeg error reading {video_path} at {position_seconds:.3f}s: {stderr.splitlines()[-1] if stderr else e}")
+            return None
+        
+        if not out:
+            return None
+        
+        image = Image.open(io.BytesIO(out))
+        return image.convert('RGB')
+    
+    def _resolve_frame_targets(
+        self,
+        positions: List[str],
+        duration: float,
+        fps: float,
+        total_frames: int
+    ) -> List[Tuple[str, float, int]]:
+        """
+        Resolve position strings to timestamps and frame numbers.
+        
+        Args:
+            positions: List of position strings.
+            duration: Video duration in seconds.
+            fps: Frames per second used to convert timestamps to frames.
+            total_frames: Total number of frames in the video.
+            
+        Returns:
+            List of (position_string, position_seconds, frame_number) tuples in
+            the original position order. Unparseable positions are skipped.
+        """
+        targets = []
+        
+        for position_str in positions:
+            position_seconds = self.parse_time_position(position_str, duration)
+            if position_seconds is None:
+                continue
+            
+            frame_number = int(position_seconds * fps)
+            frame_number = max(0, min(frame_number, total_frames - 1))
+            targets.append((position_str, position_seconds, frame_number))
+        
+        return targets
+    
+    def _read_frame_at(self, cap: cv2.VideoCapture, frame_number: int) -> Optional[np.ndarray]:
+        """
+        Seek to a frame and decode it.
+        
+        Args:
+            cap: Open OpenCV video capture.
+            frame_number: Frame index to read.
+            
+        Returns:
+            Decoded BGR frame, or None if it could not be read.
+        """
+        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+        ret, frame = cap.read()
+        return frame if ret else None
+    
+    def _read_frames_single_pass(
+        self,
+        cap: cv2.VideoCapture,
+        frame_numbers: List[int],
+        fps: float
+    ) -> Dict[int, np.ndarray]:
+        """
+        Decode the requested frames in one forward pass over the video.
+        
+        Targets are visited in ascending frame order. Nearby targets are reached
+        by grabbing frames forward so the decoder state is reused; distant
+        targets fall back to a seek.
+        
+        Args:
+            cap: Open OpenCV video capture, positioned at the first frame.
+            frame_numbers: Frame indices to read (any order, duplicates allowed).
+            fps: Frames per second, used to size the forward-grab window.
+            
+        Returns:
+            Dictionary mapping frame number to decoded BGR frame. Frames that
+            could not be read are omitted.
+        """
+        frames = {}
+        max_gap = int(max(fps, 1.0) * SINGLE_PASS_MAX_GAP_SECONDS)
+        next_frame = 0  # Frame the decoder will return on the next read
+        
+        for frame_number in sorted(set(frame_numbers)):
+            gap = frame_number - next_frame if next_frame is not None else -1
+            
+            if 0 <= gap <= max_gap:
+                # Advance without converting the skipped frames
+                grabbed = all(cap.grab() for _ in range(gap))
+                ret, frame = cap.read() if grabbed else (False, None)
+            else:
+                ret, frame = False, None
+            
+            if not ret:
+                # Distant target or forward read failed - seek explicitly
+                frame = self._read_frame_at(cap, frame_number)
+                ret = frame is not None
+            
+            if ret:
+                frames[frame_number] = frame
+                next_frame = frame_number + 1
+            else:
+                next_frame = None
+        
+        return frames
+    
+    def _create_thumbnail_data(
+        self,
+        frame: np.ndarray,
+        position_seconds: float,
+        frame_number: int,
+        thumbnail_width: int
+    ) -> ThumbnailData:
+        """
+        Convert a decoded frame into a resized thumbnail.
+        
+        Args:
+            frame: Decoded BGR frame.
+            position_seconds: Timestamp of the frame in seconds.
+            frame_number: Frame index of the frame.
+            thumbnail_width: Target width for the thumbnail.
+            
+        Returns:
+            ThumbnailData object for the frame.
+        """
+        # Convert BGR to RGB
+        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        
+        # Convert to PIL Image
+        pil_image = Image.fromarray(frame_rgb)
+        
+        if self.uniform_cells:
+            # Resample once, straight into the fixed cell
+            resized_image = fit_image_to_cell(pil_image, get_uniform_cell_size(thumbnail_width))
+        else:
+            # Resize proportionally
+            original_width, original_height = pil_image.size
+            aspect_ratio = original_height / original_width
+            target_height = int(thumbnail_width * aspect_ratio)
+            
+            resized_image = pil_image.resize(
+                (thumbnail_width, target_height), 
+                Image.Resampling.LANCZOS
+            )
+        
+        return ThumbnailData(
+            image=resized_image,
+            position=position_seconds,
+            timestamp=self._format_timestamp(position_seconds),
+            frame_number=frame_number
+        )
+    
+    def get_video_metadata(
+        self,
+        video_path: str,
+        known_metadata: Optional[VideoMetadata] = None
+    ) -> Optional[VideoMetadata]:
+        """
+        Get metadata for a video file, using the caches before probing.
+        
+        Args:
+            video_path: Path to the video file.
+            known_metadata: Metadata from another source (e.g. a timeline
+                file), used instead of probing if neither cache has the file.
+            
+        Returns:
+            VideoMetadata object or None if extraction fails.
+        """
+        memo_key = os.path.normcase(os.path.abspath(video_path))
+        metadata = self._metadata_memo.get(memo_key)
+        if metadata is not None:
+            return metadata
+        
+        if self.metadata_cache is not None:
+            cached = self.metadata_cache.get(video_path)
+            if cached is not None:
+                try:
+                    metadata = VideoMetadata.from_dict(cached)
+                except (KeyError, TypeError, ValueError):
+                    metadata = None
+        
+        if metadata is None and known_metadata is not None:
+            # Not stored in the persistent cache, which only holds probe results
+            metadata = known_metadata
+        
+        if metadata is None:
+            metadata = self._probe_video_metadata(video_path)
+            if metadata is not None and self.metadata_cache is not None:
+                self.metadata_cache.put(video_path, metadata.to_dict())
+        
+        if metadata is not None:
+            self._metadata_memo[memo_key] = metadata
+        
+        return metadata
+    
+    def _probe_video_metadata(self, video_path: str) -> Optional[VideoMetadata]:
         """
         Extract metadata from a video file using FFmpeg.
         
@@ -423,7 +888,8 @@ class ThumbnailExtractor:
             thumbnails = self.extract_thumbnails(
                 video_file.path,
                 positions,
-                thumbnail_width
+                thumbnail_width,
+                metadata
             )
             
             return VideoData(
@@ -442,12 +908,125 @@ class ThumbnailExtractor:
                 error_message=str(e)
             )
     
+    def process_video_clips(
+        self,
+        video_file: VideoFile,
+        clip_positions: List[List[str]],
+        thumbnail_width: int = 320,
+        known_metadata: Optional[VideoMetadata] = None
+    ) -> List[VideoData]:
+        """
+        Process several clips of one video file in a single extraction.
+        
+        The file is probed and opened once. The positions of all clips are
+        decoded together in ascending time order, then handed back out to the
+        clips. Positions shared by several clips are decoded only once.
+        
+        Args:
+            video_file: VideoFile object to process.
+            clip_positions: Position strings of each clip.
+            thumbnail_width: Target width for thumbnails.
+            known_metadata: Metadata from another source, used instead of
+                probing (see get_video_metadata()).
+            
+        Returns:
+            One VideoData object per clip, in the order of clip_positions.
+        """
+        try:
+            metadata = self.get_video_metadata(video_file.path, known_metadata)
+            if metadata is None:
+                return [
+                    self._create_error_video_data(video_file, "Failed to extract video metadata")
+                    for _ in clip_positions
+                ]
+            
+            # Distinct positions of all clips, earliest first
+            resolved = {}
+            for positions in clip_positions:
+                for position_str in positions:
+                    if position_str not in resolved:
+                        resolved[position_str] = self.parse_time_position(position_str, metadata.duration)
+            all_positions = sorted(
+                (position_str for position_str, seconds in resolved.items() if seconds is not None),
+                key=lambda position_str: resolved[position_str]
+            )
+            
+            thumbnails_by_time = {
+                thumbnail.position: thumbnail
+                for thumbnail in self.extract_thumbnails(video_file.path, all_positions, thumbnail_width, metadata)
+            }
+            
+            results = []
+            for positions in clip_positions:
+                thumbnails = [
+                    thumbnails_by_time[resolved[position_str]]
+                    for position_str in positions
+                    if resolved[position_str] in thumbnails_by_time
+                ]
+                results.append(VideoData(
+                    file=video_file,
+                    metadata=metadata,
+                    thumbnails=thumbnails,
+                    processing_status="success" if thumbnails else "no_thumbnails"
+                ))
+            return results
+            
+        except Exception as e:
+            return [self._create_error_video_data(video_file, str(e)) for _ in clip_positions]
+    
+    def get_worker_options(self) -> Dict[str, Any]:
+        """
+        Get the constructor options needed to recreate this extractor in a worker process.
+        
+        Returns:
+            Dictionary of keyword arguments for ThumbnailExtractor.
+        """
+        return {
+            "extraction_mode": self.extraction_mode,
+            "frame_backend": self.frame_backend,
+            "metadata_cache_dir": self.metadata_cache_dir,
+            "thumbnail_cache_dir": self.thumbnail_cache_dir,
+            "thumbnail_cache_max_bytes": self.thumbnail_cache_max_bytes,
+            "uniform_cells": self.uniform_cells
+        }
+    
+    def _merge_cache_stats(self, cache_stats: Tuple[int, int]) -> None:
+        """
+        Add thumbnail cache counters reported by a worker process.
+        
+        Args:
+            cache_stats: Tuple of (hits, misses) from the worker.
+        """
+        if self.thumbnail_cache is not None:
+            self.thumbnail_cache.hits += cache_stats[0]
+            self.thumbnail_cache.misses += cache_stats[1]
+    
+    def _create_error_video_data(self, video_file: VideoFile, error_message: str) -> VideoData:
+        """
+        Create a VideoData entry for a file that could not be processed.
+        
+        Args:
+            video_file: VideoFile object that failed.
+            error_message: Description of the failure.
+            
+        Returns:
+            VideoData object with error status.
+        """
+        return VideoData(
+            file=video_file,
+            metadata=VideoMetadata(0, None, (0, 0), 0, "unknown", "unknown"),
+            thumbnails=[],
+            processing_status="error",
+            error_message=error_message
+        )
+    
     def batch_process_videos(
         self, 
         video_files: List[VideoFile], 
         positions: List[str],
         thumbnail_width: int = 320,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        max_workers: int = 1
     ) -> List[VideoData]:
         """
         Process multiple video files in batch.
@@ -457,35 +1036,151 @@ class ThumbnailExtractor:
             positions: List of position strings for thumbnail extraction.
             thumbnail_width: Target width for thumbnails.
             progress_callback: Optional callback function for progress updates.
+            max_workers: Number of worker processes (1 = sequential, 0 = one per CPU).
             
         Returns:
-            List of VideoData objects containing extracted information.
+            List of VideoData objects in the same order as video_files.
         """
-        processed_videos = []
         total_files = len(video_files)
+        processed_videos: List[Optional[VideoData]] = [None] * total_files
+        pending = []
         
         for i, video_file in enumerate(video_files):
             if not video_file.is_accessible:
                 # Create error entry for inaccessible files
-                processed_videos.append(VideoData(
-                    file=video_file,
-                    metadata=VideoMetadata(0, None, (0, 0), 0, "unknown", "unknown"),
-                    thumbnails=[],
-                    processing_status="error",
-                    error_message="File is not accessible"
-                ))
-                continue
-            
+                processed_videos[i] = self._create_error_video_data(video_file, "File is not accessible")
+            else:
+                pending.append(i)
+        
+        if max_workers <= 0:
+            max_workers = os.cpu_count() or 1
+        
+        if max_workers > 1 and len(pending) > 1:
+            try:
+                self._process_videos_in_pool(
+                    video_files, pending, positions, thumbnail_width,
+                    progress_callback, max_workers, processed_videos
+                )
+                return processed_videos
+            except (OSError, NotImplementedError) as e:
+                # Process pools are unavailable on some platforms/sandboxes
+                print(f"Warning: Parallel processing unavailable ({e}), processing sequentially")
+                pending = [i for i in pending if processed_videos[i] is None]
+        
+        for i in pending:
             # Process the video file
-            video_data = self.process_video_file(video_file, positions, thumbnail_width)
-            processed_videos.append(video_data)
+            video_data = self.process_video_file(video_files[i], positions, thumbnail_width)
+            processed_videos[i] = video_data
             
             # Call progress callback if provided
             if progress_callback:
-                progress_callback(i + 1, total_files, video_file.filename)
+                progress_callback(i + 1, total_files, video_files[i].filename)
         
         return processed_videos
     
+    def _process_videos_in_pool(
+        self,
+        video_files: List[VideoFile],
+        pending: List[int],
+        positions: List[str],
+        thumbnail_width: int,
+        progress_callback: Optional[callable],
+        max_workers: int,
+        processed_videos: List[Optional[VideoData]]
+    ) -> None:
+        """
+        Process video files on a process pool, filling processed_videos in place.
+        
+        Results are stored by index so the output keeps scan order regardless of
+        completion order. If a worker process dies, the pool is discarded and the
+        unfinished files are retried one process each, so only the file that
+        crashes the decoder ends up as an error.
+        
+        Args:
+            video_files: All VideoFile objects of the batch.
+            pending: Indices of files that still need processing.
+            positions: List of position strings for thumbnail extraction.
+            thumbnail_width: Target width for thumbnails.
+            progress_callback: Optional callback function for progress updates.
+            max_workers: Number of worker processes.
+            processed_videos: Result list indexed like video_files.
+        """
+        total_files = len(video_files)
+        completed = total_files - len(pending)
+        options = self.get_worker_options()
+        crashed = []
+        
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+            futures = {
+                pool.submit(_process_video_file_worker, options, video_files[i], positions, thumbnail_width): i
+                for i in pending
+            }
+            
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    processed_videos[i], cache_stats = future.result()
+                    self._merge_cache_stats(cache_stats)
+                except BrokenProcessPool:
+                    crashed.append(i)
+                    continue
+                except Exception as e:
+                    processed_videos[i] = self._create_error_video_data(video_files[i], f"Worker error: {e}")
+                
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, total_files, video_files[i].filename)
+        
+        if not crashed:
+            return
+        
+        print(f"Warning: A worker process crashed, retrying {len(crashed)} files in isolation")
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(crashed))) as threads:
+            futures = {
+                threads.submit(self._process_video_isolated, options, video_files[i], positions, thumbnail_width): i
+                for i in sorted(crashed)
+            }
+            
+            for future in as_completed(futures):
+                i = futures[future]
+                processed_videos[i] = future.result()
+                
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, total_files, video_files[i].filename)
+    
+    def _process_video_isolated(
+        self,
+        options: Dict[str, Any],
+        video_file: VideoFile,
+        positions: List[str],
+        thumbnail_width: int
+    ) -> VideoData:
+        """
+        Process a single video file in its own worker process.
+        
+        Args:
+            options: Extractor options from get_worker_options().
+            video_file: VideoFile object to process.
+            positions: List of position strings for thumbnail extraction.
+            thumbnail_width: Target width for thumbnails.
+            
+        Returns:
+            VideoData object, with error status if the worker crashed.
+        """
+        try:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                video_data, cache_stats = pool.submit(
+                    _process_video_file_worker, options, video_file, positions, thumbnail_width
+                ).result()
+            self._merge_cache_stats(cache_stats)
+            return video_data
+        except BrokenProcessPool:
+            return self._create_error_video_data(video_file, "Worker process crashed while processing file")
+        except Exception as e:
+            return self._create_error_video_data(video_file, f"Worker error: {e}")
+    
     def validate_video_file(self, video_path: str) -> bool:
         """
         Validate that a video file can be processed.
@@ -515,4 +1210,50 @@ class ThumbnailExtractor:
             return metadata is not None and metadata.duration > 0
             
         except Exception:
-            return False
\ No newline at end of file
+            return False
+
+
+# Extractor reused by all tasks that run in the same worker process
+_worker_extractor: Optional[ThumbnailExtractor] = None
+_worker_options: Optional[Dict[str, Any]] = None
+
+
+def _process_video_file_worker(
+    options: Dict[str, Any],
+    video_file: VideoFile,
+    positions: List[str],
+    thumbnail_width: int
+) -> Tuple[VideoData, Tuple[int, int]]:
+    """
+    Process a video file inside a worker process.
+    
+    Defined at module level so it can be pickled by the process pool.
+    The extractor (and its cache connections) is kept for the next task
+    of the same worker.
+    
+    Args:
+        options: Extractor options from ThumbnailExtractor.get_worker_options().
+        video_file: VideoFile object to process.
+        positions: List of position strings for thumbnail extraction.
+        thumbnail_width: Target width for thumbnails.
+        
+    Returns:
+        Tuple of the VideoData object and the (hits, misses) thumbnail cache
+        counters of this task.
+    """
+    global _worker_extractor, _worker_options
+    
+    if _worker_extractor is None or _worker_options != options:
+        _worker_extractor = ThumbnailExtractor(**options)
+        _worker_options = dict(options)
+    
+    cache = _worker_extractor.thumbnail_cache
+    hits_before = cache.hits if cache else 0
+    misses_before = cache.misses if cache else 0
+    
+    video_data = _worker_extractor.process_video_file(video_file, positions, thumbnail_width)
+    # Worker processes exit without cleanup, so cache hits are recorded per task
+    _worker_extractor.flush_cache()
+    
+    cache_stats = (cache.hits - hits_before, cache.misses - misses_before) if cache else (0, 0)
+    return video_data, cache_stats
@@ -10,6 +10,23 @@ from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 
 
+@dataclass
+class TimelineResource:
+    """Media asset from the resources section of a timeline file."""
+    resource_id: str
+    file_path: str
+    name: Optional[str] = None
+    # Timecode of the first frame and length of the media, in seconds
+    start: Optional[float] = None
+    duration: Optional[float] = None
+    # Video format of the media
+    format_id: Optional[str] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    fps: Optional[float] = None
+    has_video: Optional[bool] = None
+
+
 @dataclass
 class TimelineEntry:
     """Represents a single video entry from timeline file (FCPXML)."""
@@ -23,6 +40,8 @@ class TimelineEntry:
     clip_start_time: Optional[float] = None
     clip_end_time: Optional[float] = None
     track_info: Optional[Dict[str, Any]] = None
+    # Source media record, if the timeline file describes it
+    resource: Optional[TimelineResource] = None
     
     def __post_init__(self):
         """Post-initialization processing."""
@@ -6,6 +6,8 @@ folder-based thumbnail generation workflows seamlessly.
 """
 
 import os
+import queue
+import threading
 from typing import List, Dict, Any, Optional, Callable
 from pathlib import Path
 
@@ -14,7 +16,12 @@ from .video_scanner import VideoScanner, VideoFile
 from .thumbnail_extractor import ThumbnailExtractor, VideoData, VideoMetadata
 from .image_composer import ImageComposer, CompositionSettings
 from .fcpxml_parser import FCPXMLParser
+from .edl_parser import EDLParser
 from .timeline_data_models import TimelineEntry
+from .run_manifest import RunManifest
+from .page_writer import PageWriter
+from .extraction_bundle import ExtractionBundle, EXTRACTION_SETTINGS_KEYS
+from utils.file_utils import generate_multi_page_filenames, get_file_identity, get_quicktime_creation_date
 
 
 class UnifiedProcessor:
@@ -69,19 +76,57 @@ class UnifiedProcessor:
         if self.log_callback:
             self.log_callback(message)
     
-    def process_thumbnails(self) -> bool:
+    def _log_cache_summary(self) -> None:
+        """Log the thumbnail cache hit/miss counters if the cache is enabled."""
+        cache_summary = self.thumbnail_extractor.get_cache_summary()
+        if cache_summary:
+            self._log_message(cache_summary)
+    
+    def _create_thumbnail_extractor(self, config: Dict[str, Any]) -> ThumbnailExtractor:
+        """
+        Create a thumbnail extractor configured from settings.
+        
+        Args:
+            config: Configuration dictionary.
+            
+        Returns:
+            Configured ThumbnailExtractor instance.
+        """
+        metadata_cache_dir = None
+        if config.get('metadata_cache_enabled', True):
+            metadata_cache_dir = self.config_manager.get_cache_dir(config)
+        
+        thumbnail_cache_dir = None
+        if config.get('thumbnail_cache_enabled', True):
+            thumbnail_cache_dir = self.config_manager.get_cache_dir(config)
+        
+        return ThumbnailExtractor(
+            extraction_mode=config.get('extraction_mode', 'seek'),
+            frame_backend=config.get('frame_backend', 'opencv'),
+            metadata_cache_dir=metadata_cache_dir,
+            thumbnail_cache_dir=thumbnail_cache_dir,
+            thumbnail_cache_max_bytes=config.get('thumbnail_cache_max_mb', 1024) * 1024 * 1024,
+            uniform_cells=config.get('layout_mode', 'grid') == 'uniform_cells'
+        )
+    
+    def process_thumbnails(self, config: Optional[Dict[str, Any]] = None) -> bool:
         """
         Process thumbnails using unified workflow.
         
+        Args:
+            config: Configuration to use. If None, loads it from the config manager.
+            
         Returns:
             True if processing was successful, False otherwise.
         """
         try:
-            config = self.config_manager.load_config()
+            if config is None:
+                config = self.config_manager.load_config()
             
             # Determine processing mode based on timeline file presence
             if self._is_timeline_mode(config):
-                self._log_message("FCPXML mode detected - processing based on FCPXML file")
+                timeline_format = self.get_processing_mode(config).upper()
+                self._log_message(f"{timeline_format} mode detected - processing based on {timeline_format} file")
                 return self._process_fcpxml_mode(config)
             else:
                 self._log_message("Standard mode - processing based on source folders")
@@ -90,6 +135,10 @@ class UnifiedProcessor:
         except Exception as e:
             self._log_message(f"Error in unified processing: {e}")
             return False
+        finally:
+            # Record the cache hits of this run for least recently used eviction
+            if self.thumbnail_extractor is not None:
+                self.thumbnail_extractor.flush_cache()
     
     def _is_timeline_mode(self, config: Dict[str, Any]) -> bool:
         """
@@ -107,7 +156,7 @@ class UnifiedProcessor:
         
         # Check file extension to determine type
         file_extension = Path(timeline_path).suffix.lower()
-        return file_extension == '.fcpxml'
+        return file_extension in ('.fcpxml', '.edl')
     
     def _process_fcpxml_mode(self, config: Dict[str, Any]) -> bool:
         """
@@ -120,22 +169,24 @@ class UnifiedProcessor:
             True if processing was successful, False otherwise.
         """
         try:
-            self._report_progress(0.05, "Parsing FCPXML file...")
+            self._report_progress(0.05, "Parsing timeline file...")
             
-            # Initialize timeline components
-            self.timeline_parser = FCPXMLParser()
-            
-            # Parse FCPXML file
+            # Initialize timeline components and parse the timeline file
             fcpxml_path = config['fcpxml_file_path']
-            timeline_entries = self.timeline_parser.parse_fcpxml_file(fcpxml_path)
+            if Path(fcpxml_path).suffix.lower() == '.edl':
+                self.timeline_parser = EDLParser()
+                timeline_entries = self.timeline_parser.parse_edl_file(fcpxml_path)
+            else:
+                self.timeline_parser = FCPXMLParser()
+                timeline_entries = self.timeline_parser.parse_fcpxml_file(fcpxml_path)
             
             if not timeline_entries:
                 self._log_message("No video entries found in timeline file")
                 self._report_progress(1.0, "No video entries found")
                 return False
             
-            self._log_message(f"Found {len(timeline_entries)} video entries in FCPXML file")
-            self._report_progress(0.1, f"Found {len(timeline_entries)} FCPXML entries")
+            self._log_message(f"Found {len(timeline_entries)} video entries in timeline file")
+            self._report_progress(0.1, f"Found {len(timeline_entries)} timeline entries")
             
             # Check if we should use unique files (when fcpxml_use_interval_positions is False)
             use_interval_positions = config.get('fcpxml_use_interval_positions', True)
@@ -159,7 +210,8 @@ class UnifiedProcessor:
                         start_time=0.0,
                         end_time=None,  # Will be determined during processing
                         clip_start_time=None,  # Not applicable when processing entire file
-                        clip_end_time=None     # Not applicable when processing entire file
+                        clip_end_time=None,    # Not applicable when processing entire file
+                        resource=original_entry.resource if original_entry else None
                     )
                     unique_entries.append(simplified_entry)
                 
@@ -188,7 +240,7 @@ class UnifiedProcessor:
             self._report_progress(0.2, "Extracting thumbnails...")
             
             # Extract thumbnails using existing thumbnail extractor
-            self.thumbnail_extractor = ThumbnailExtractor()
+            self.thumbnail_extractor = self._create_thumbnail_extractor(config)
             
             # Extract thumbnails
             positions = config.get('positions', '0%,50%,99%').split(',')
@@ -214,7 +266,9 @@ class UnifiedProcessor:
                 f"{extraction_stats['placeholder_count']} placeholders, "
                 f"{extraction_stats['total_thumbnails']} total thumbnails"
             )
+            self._log_cache_summary()
             
+            self._save_extraction_bundle(timeline_video_data, config)
             self._report_progress(0.8, "Composing contact sheet...")
             
             # Create contact sheet
@@ -300,24 +354,22 @@ class UnifiedProcessor:
         Returns:
             List of video data objects.
         """
-        video_data_list = []
-        
         # Ensure thumbnail extractor is initialized
         if self.thumbnail_extractor is None:
-            self.thumbnail_extractor = ThumbnailExtractor()
-        
-        for match in video_matches:
-            if not match.get('is_found', False):
-                # Create placeholder if enabled
-                if self.config_manager.get('fcpxml_show_placeholders', True):
-                    placeholder_data = self._create_placeholder_video_data(match)
-                    video_data_list.append(placeholder_data)
-                continue
-            
+            self.thumbnail_extractor = self._create_thumbnail_extractor(self.config_manager.load_config())
+        
+        show_placeholders = self.config_manager.get('fcpxml_show_placeholders', True)
+        use_resource_metadata = self.config_manager.get('fcpxml_resource_metadata', True)
+        results = [None] * len(video_matches)
+        
+        # Group clips by source file, so each file is probed and opened once
+        clips_by_file: Dict[str, List[int]] = {}
+        for index, match in enumerate(video_matches):
+            if match.get('is_found', False):
+                clips_by_file.setdefault(match['matched_file_path'], []).append(index)
+        
+        for file_path, indices in clips_by_file.items():
             try:
-                file_path = match['matched_file_path']
-                entry = match['timeline_entry']
-                
                 # Create a proper VideoFile object
                 video_file = VideoFile(
                     path=file_path,
@@ -327,54 +379,107 @@ class UnifiedProcessor:
                     is_accessible=True  # Assume accessible since we found the file
                 )
                 
-                if use_interval_positions and entry.clip_start_time is not None and entry.clip_end_time is not None:
-                    # Use clip in/out points for positions (extract from specific segment of footage)
-                    clip_duration = entry.clip_end_time - entry.clip_start_time
-                    adjusted_positions = []
-                    for pos in positions:
-                        if pos.endswith('%'):
-                            percent = float(pos[:-1])
-                            # Calculate each position individually within the clip's time range
-                            actual_time = entry.clip_start_time + (clip_duration * percent / 100)
-                            adjusted_positions.append(f"{actual_time}s")
-                        else:
-                            # Handle absolute time positions - might need adjustment based on clip start
-                            adjusted_positions.append(pos)
-                    video_data = self.thumbnail_extractor.process_video_file(
-                        video_file, adjusted_positions, thumbnail_width
-                    )
-                else:
-                    # Use absolute positions (existing behavior)
-                    video_data = self.thumbnail_extractor.process_video_file(
-                        video_file, positions, thumbnail_width
-                    )
+                clip_positions = [
+                    self._get_clip_positions(video_matches[index]['timeline_entry'], positions, use_interval_positions)
+                    for index in indices
+                ]
+                known_metadata = None
+                if use_resource_metadata:
+                    known_metadata = self._get_resource_metadata(video_matches[indices[0]]['timeline_entry'])
+                clip_data = self.thumbnail_extractor.process_video_clips(
+                    video_file, clip_positions, thumbnail_width, known_metadata=known_metadata
+                )
                 
-                if video_data and video_data.processing_status == "success":
-                    # Add timeline-specific metadata using a dictionary approach since we can't directly assign attributes
-                    setattr(video_data, 'source_id', entry.source_id)
-                    setattr(video_data, 'start_time', entry.start_time)
-                    setattr(video_data, 'end_time', entry.end_time)
-                    setattr(video_data, 'clip_start_time', entry.clip_start_time)
-                    setattr(video_data, 'clip_end_time', entry.clip_end_time)
-                    setattr(video_data, 'is_placeholder', False)
-                    video_data_list.append(video_data)
-                else:
-                    # Handle extraction failure - create placeholder if enabled
-                    self._log_message(f"Failed to extract thumbnails from: {file_path}")
-                    if self.config_manager.get('fcpxml_show_placeholders', True):
-                        placeholder_data = self._create_placeholder_video_data(match)
-                        video_data_list.append(placeholder_data)
-                    
+                for index, video_data in zip(indices, clip_data):
+                    entry = video_matches[index]['timeline_entry']
+                    if video_data and video_data.processing_status == "success":
+                        # Add timeline-specific metadata using a dictionary approach since we can't directly assign attributes
+                        setattr(video_data, 'source_id', entry.source_id)
+                        setattr(video_data, 'start_time', entry.start_time)
+                        setattr(video_data, 'end_time', entry.end_time)
+                        setattr(video_data, 'clip_start_time', entry.clip_start_time)
+                        setattr(video_data, 'clip_end_time', entry.clip_end_time)
+                        setattr(video_data, 'is_placeholder', False)
+                        results[index] = video_data
+                    else:
+                        # Handle extraction failure
+                        self._log_message(f"Failed to extract thumbnails from: {file_path}")
+                        
             except Exception as e:
-                self._log_message(f"Error processing {match.get('matched_file_path', 'unknown')}: {e}")
-                # Create placeholder for error cases if enabled
-                if self.config_manager.get('fcpxml_show_placeholders', True):
-                    placeholder_data = self._create_placeholder_video_data(match)
-                    video_data_list.append(placeholder_data)
-                continue
+                self._log_message(f"Error processing {file_path}: {e}")
+        
+        # Back to timeline order, with placeholders for missing or failed clips if enabled
+        video_data_list = []
+        for match, video_data in zip(video_matches, results):
+            if video_data is not None:
+                video_data_list.append(video_data)
+            elif show_placeholders:
+                video_data_list.append(self._create_placeholder_video_data(match))
         
         return video_data_list
     
+    def _get_resource_metadata(self, entry: TimelineEntry) -> Optional[VideoMetadata]:
+        """
+        Build video metadata from the media resource of a timeline entry.
+        
+        Args:
+            entry: Timeline entry of a clip.
+            
+        Timeline files carry no recording date, so it is read from the movie
+        header of MP4/QuickTime media.
+        
+        Returns:
+            VideoMetadata object, or None if the timeline file lacks the
+            duration, resolution or frame rate of the media or its recording
+            date cannot be read without probing.
+        """
+        resource = getattr(entry, 'resource', None)
+        if resource is None or None in (resource.duration, resource.width, resource.height, resource.fps):
+            return None
+        
+        creation_date = get_quicktime_creation_date(entry.file_path)
+        if creation_date is None:
+            return None
+        
+        return VideoMetadata(
+            duration=resource.duration,
+            creation_date=creation_date,
+            resolution=(resource.width, resource.height),
+            fps=resource.fps,
+            codec="unknown",
+            format="unknown"
+        )
+    
+    def _get_clip_positions(self, entry: TimelineEntry, positions: List[str], use_interval_positions: bool) -> List[str]:
+        """
+        Get the thumbnail positions of a timeline clip within its source file.
+        
+        Args:
+            entry: Timeline entry of the clip.
+            positions: List of position strings.
+            use_interval_positions: Whether to use FCPXML in/out points.
+            
+        Returns:
+            List of position strings for the source file.
+        """
+        if not use_interval_positions or entry.clip_start_time is None or entry.clip_end_time is None:
+            # Use absolute positions (existing behavior)
+            return positions
+        
+        # Use clip in/out points for positions (extract from specific segment of footage)
+        clip_duration = entry.clip_end_time - entry.clip_start_time
+        adjusted_positions = []
+        for pos in positions:
+            if pos.endswith('%'):
+                percent = float(pos[:-1])
+                # Calculate each position individually within the clip's time range
+                actual_time = entry.clip_start_time + (clip_duration * percent / 100)
+                adjusted_positions.append(f"{actual_time}s")
+            else:
+                # Handle absolute time positions - might need adjustment based on clip start
+                adjusted_positions.append(pos)
+        return adjusted_positions
+    
     def _create_placeholder_video_data(self, match: Dict) -> object:
         """
         Create placeholder video data for missing files.
@@ -450,8 +555,12 @@ class UnifiedProcessor:
             
             # Initialize standard components
             supported_extensions = config.get('supported_extensions', [])
-            self.video_scanner = VideoScanner(supported_extensions)
-            self.thumbnail_extractor = ThumbnailExtractor()
+            self.video_scanner = VideoScanner(
+                supported_extensions,
+                config.get('scan_workers', 8),
+                self.config_manager.get_cache_dir(config) if config.get('scan_index_enabled', True) else None
+            )
+            self.thumbnail_extractor = self._create_thumbnail_extractor(config)
             
             # Scan for videos
             source_folders = config.get('source_folders', [])
@@ -460,6 +569,12 @@ class UnifiedProcessor:
                 self._report_progress(1.0, "No source folders")
                 return False
             
+            if config.get('streaming_pipeline', False):
+                if config.get('incremental_mode', False):
+                    self._log_message("Streaming pipeline is not used in incremental mode")
+                else:
+                    return self._process_folder_streaming(source_folders, config)
+            
             video_files = self.video_scanner.scan_folders(source_folders)
             
             if not video_files:
@@ -476,39 +591,19 @@ class UnifiedProcessor:
             self._log_message(f"Found {len(accessible_files)} accessible video files")
             self._report_progress(0.1, f"Found {len(accessible_files)} videos")
             
-            # Extract thumbnails
-            video_data_list = []
-            total_videos = len(accessible_files)
+            if config.get('incremental_mode', False):
+                return self._process_folder_incremental(accessible_files, config)
             
-            for i, video_file in enumerate(accessible_files):
-                try:
-                    progress = 0.1 + (i / total_videos) * 0.7  # 10% to 80% for extraction
-                    self._report_progress(progress, f"Processing {video_file.filename}")
-                    self._log_message(f"Processing: {video_file.filename}")
-                    
-                    # Extract video data
-                    positions = config.get('positions', '0%,50%,99%').split(',')
-                    video_data = self.thumbnail_extractor.process_video_file(
-                        video_file,
-                        positions,
-                        config.get('thumbnail_width', 320)
-                    )
-                    
-                    if video_data and video_data.processing_status == "success":
-                        video_data_list.append(video_data)
-                        self._log_message(f"Extracted {len(video_data.thumbnails)} thumbnails from {video_file.filename}")
-                    else:
-                        self._log_message(f"Failed to process: {video_file.filename}")
-                        
-                except Exception as e:
-                    self._log_message(f"Error processing {video_file.filename}: {e}")
-                    continue
+            # Extract thumbnails
+            video_data_list = self._extract_video_files(accessible_files, config)
             
             if not video_data_list:
                 self._log_message("No thumbnails could be extracted")
                 self._report_progress(1.0, "No thumbnails extracted")
                 return False
             
+            self._log_cache_summary()
+            self._save_extraction_bundle(video_data_list, config)
             self._report_progress(0.8, "Composing contact sheet...")
             
             # Create contact sheet
@@ -525,68 +620,430 @@ class UnifiedProcessor:
             self._report_progress(1.0, "Folder processing failed")
             return False
     
-    def _create_contact_sheet(self, video_data_list: List, config: Dict[str, Any]) -> bool:
+    def _extract_video_files(self, video_files: List[VideoFile], config: Dict[str, Any]) -> List[VideoData]:
         """
-        Create and save contact sheet from video data.
+        Extract thumbnails from video files, in parallel if configured.
         
         Args:
-            video_data_list: List of video data objects.
+            video_files: Accessible video files to process.
+            config: Configuration dictionary.
+            
+        Returns:
+            List of successfully processed video data objects, in input order.
+        """
+        positions = config.get('positions', '0%,50%,99%').split(',')
+        thumbnail_width = config.get('thumbnail_width', 320)
+        max_workers = config.get('max_workers', 1)
+        
+        if max_workers != 1:
+            return self._extract_folder_thumbnails_parallel(
+                video_files, positions, thumbnail_width, max_workers
+            )
+        return self._extract_folder_thumbnails(video_files, positions, thumbnail_width)
+    
+    def _process_folder_incremental(self, video_files: List[VideoFile], config: Dict[str, Any]) -> bool:
+        """
+        Update the contact sheet pages of a previous run for new or changed files.
+        
+        Only files that are new or changed since the run manifest was written,
+        or that failed in the previous run, are extracted. Pages whose files
+        and settings are unchanged are kept as they are; other pages are
+        re-rendered, with the thumbnails of unchanged files served by the
+        thumbnail cache. Pages left over from a longer previous run are
+        deleted.
+        
+        Args:
+            video_files: Accessible video files in scan order.
             config: Configuration dictionary.
             
         Returns:
             True if successful, False otherwise.
         """
-        try:
-            # Configure image composer settings
-            composition_settings = CompositionSettings(
-                clips_per_row=config.get('clips_per_row', 5),
-                padding=config.get('padding', 5),
-                background_color=config.get('background_color', 'white'),
-                font_size=config.get('font_size', 12),
-                text_color=config.get('text_color', 'black'),
-                overlay_background_color=config.get('overlay_background_color', 'black'),
-                overlay_background_opacity=config.get('overlay_background_opacity', 0.7),
-                overlay_position=config.get('overlay_position', 'above_thumbnails'),
-                show_frame=config.get('show_frame', True),
-                frame_color=config.get('frame_color', '#CCCCCC'),
-                frame_thickness=config.get('frame_thickness', 2),
-                frame_padding=config.get('frame_padding', 10),
-                max_rows_per_image=config.get('max_rows_per_image', 0)
+        output_path = config.get('output_path', 'output/overview.jpg')
+        manifest = RunManifest(RunManifest.get_manifest_path(output_path))
+        settings_hash = RunManifest.compute_settings_hash(config)
+        
+        if not manifest.load():
+            self._log_message("No run manifest found - rendering all pages")
+        elif manifest.settings_hash != settings_hash:
+            self._log_message("Settings changed since the last run - rendering all pages")
+            manifest.files = {}
+        manifest.settings_hash = settings_hash
+        
+        # Diff the scan result against the manifest
+        identities = {}
+        changed_files = []
+        changed_paths = set()
+        for video_file in video_files:
+            identity = get_file_identity(video_file.path)
+            if identity is None:
+                continue
+            identities[video_file.path] = identity
+            if manifest.get_file_status(identity) != "success":
+                changed_files.append(video_file)
+                changed_paths.add(video_file.path)
+        
+        self._log_message(
+            f"Incremental mode: {len(changed_files)} new, changed or failed files, "
+            f"{len(identities) - len(changed_files)} unchanged"
+        )
+        
+        video_data_by_path = {}
+        if changed_files:
+            for video_data in self._extract_video_files(changed_files, config):
+                video_data_by_path[video_data.file.path] = video_data
+        
+        previous_files = manifest.files
+        manifest.files = {}
+        successful_files = []
+        for video_file in video_files:
+            identity = identities.get(video_file.path)
+            if identity is None:
+                continue
+            if video_file.path in video_data_by_path:
+                status = "success"
+            elif video_file.path in changed_paths:
+                status = "failed"
+            else:
+                status = previous_files[identity[0]]["status"]
+            manifest.set_file(identity, status)
+            if status == "success":
+                successful_files.append(video_file)
+        
+        if not successful_files:
+            self._log_message("No thumbnails could be extracted")
+            self._report_progress(1.0, "No thumbnails extracted")
+            return False
+        
+        self._report_progress(0.8, "Composing changed pages...")
+        
+        self.image_composer = self._create_image_composer(config)
+        videos_per_page = self.image_composer.get_videos_per_page() or len(successful_files)
+        page_files = [
+            successful_files[i:i + videos_per_page]
+            for i in range(0, len(successful_files), videos_per_page)
+        ]
+        page_paths = generate_multi_page_filenames(output_path, len(page_files))
+        page_writer = PageWriter(output_path, self._get_image_format(output_path), quality=95)
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        previous_pages = manifest.pages
+        manifest.pages = []
+        rendered_pages = 0
+        
+        for page_index, files in enumerate(page_files):
+            page_path = page_paths[page_index]
+            signature = RunManifest.compute_page_signature(
+                settings_hash, [identities[video_file.path] for video_file in files]
             )
             
-            self.image_composer = ImageComposer(composition_settings)
-            contact_sheet = self.image_composer.create_contact_sheet(video_data_list)
+            previous = previous_pages[page_index] if page_index < len(previous_pages) else None
+            if (previous and previous.get("signature") == signature
+                    and previous.get("path") == page_path and os.path.exists(page_path)):
+                manifest.pages.append(previous)
+                continue
+            
+            # Unchanged files on a changed page still need their thumbnails
+            missing_files = [video_file for video_file in files if video_file.path not in video_data_by_path]
+            if missing_files:
+                for video_data in self._extract_video_files(missing_files, config):
+                    video_data_by_path[video_data.file.path] = video_data
             
-            # Save image
-            self._report_progress(0.9, "Saving image...")
-            output_path = config.get('output_path', 'output/overview.jpg')
+            page_data = [video_data_by_path[vf.path] for vf in files if vf.path in video_data_by_path]
+            if len(page_data) != len(files):
+                # Files that failed now are retried on the next run
+                for video_file in files:
+                    if video_file.path not in video_data_by_path:
+                        manifest.set_file(identities[video_file.path], "failed")
+                signature = RunManifest.compute_page_signature(
+                    settings_hash, [identities[video_data.file.path] for video_data in page_data]
+                )
             
-            # Ensure output directory exists
-            output_dir = Path(output_path).parent
-            output_dir.mkdir(parents=True, exist_ok=True)
+            progress = 0.8 + (page_index / len(page_files)) * 0.2
+            self._report_progress(progress, f"Rendering page {page_index + 1} of {len(page_files)}")
             
-            # Determine format
-            if output_path.lower().endswith('.png'):
-                image_format = 'PNG'
-            else:
-                image_format = 'JPEG'
+            page_image = self.image_composer.create_single_contact_sheet(page_data)
+            page_writer.save_image(page_image, page_path)
+            self._log_message(f"Saved page {page_index + 1} to: {page_path}")
+            
+            manifest.pages.append({"path": page_path, "signature": signature})
+            rendered_pages += 1
+        
+        # Remove pages that no longer exist in this run
+        for previous in previous_pages[len(page_files):]:
+            stale_path = previous.get("path")
+            if stale_path and stale_path not in page_paths and os.path.exists(stale_path):
+                try:
+                    os.remove(stale_path)
+                    self._log_message(f"Removed stale page: {stale_path}")
+                except OSError as e:
+                    self._log_message(f"Could not remove stale page {stale_path}: {e}")
+        
+        manifest.save()
+        
+        self._log_cache_summary()
+        self._log_message(
+            f"Incremental update complete: {rendered_pages} of {len(page_files)} pages rendered"
+        )
+        self._report_progress(1.0, "Processing complete!")
+        return True
+    
+    def _process_folder_streaming(self, source_folders: List[str], config: Dict[str, Any]) -> bool:
+        """
+        Scan, extract and compose in one streaming pipeline.
+        
+        A scanner thread yields files as they are found into a bounded queue,
+        extraction threads consume them, and the calling thread turns results
+        into strips in scan order and writes each page as soon as it is full.
+        At most pipeline_queue_size files are between scanning and composing,
+        so memory use does not grow with the number of files as long as
+        max_rows_per_image limits the page size.
+        
+        Args:
+            source_folders: Source folders to scan.
+            config: Configuration dictionary.
+            
+        Returns:
+            True if successful, False otherwise.
+        """
+        positions = config.get('positions', '0%,50%,99%').split(',')
+        thumbnail_width = config.get('thumbnail_width', 320)
+        output_path = config.get('output_path', 'output/overview.jpg')
+        queue_size = max(1, config.get('pipeline_queue_size', 32))
+        worker_count = config.get('max_workers', 1)
+        if worker_count <= 0:
+            worker_count = os.cpu_count() or 1
+        
+        self.image_composer = self._create_image_composer(config)
+        videos_per_page = self.image_composer.get_videos_per_page()
+        if not videos_per_page:
+            self._log_message("Streaming pipeline: max_rows_per_image is 0, so the single page is kept in memory")
+        
+        self._log_message(f"Streaming pipeline: {worker_count} extraction threads, queue size {queue_size}")
+        
+        # Limits files between the scanner and the composer (queued, extracting or reordering)
+        in_flight = threading.BoundedSemaphore(queue_size)
+        file_queue: queue.Queue = queue.Queue()
+        result_queue: queue.Queue = queue.Queue()
+        stop_event = threading.Event()
+        
+        def scan_files() -> None:
+            count = 0
+            try:
+                for video_file in self.video_scanner.iter_video_files(source_folders):
+                    while not in_flight.acquire(timeout=0.1):
+                        if stop_event.is_set():
+                            return
+                    file_queue.put((count, video_file))
+                    count += 1
+            except Exception as e:
+                self._log_message(f"Error scanning folders: {e}")
+            finally:
+                for _ in range(worker_count):
+                    file_queue.put(None)
+                result_queue.put(("scanned", count))
+        
+        def extract_files() -> None:
+            while True:
+                item = file_queue.get()
+                if item is None:
+                    return
+                index, video_file = item
+                video_data = None
+                if not stop_event.is_set():
+                    try:
+                        video_data = self.thumbnail_extractor.process_video_file(
+                            video_file, positions, thumbnail_width
+                        )
+                    except Exception as e:
+                        self._log_message(f"Error processing {video_file.filename}: {e}")
+                result_queue.put(("extracted", index, video_file, video_data))
+        
+        threads = [threading.Thread(target=scan_files, name="scan", daemon=True)]
+        threads.extend(
+            threading.Thread(target=extract_files, name=f"extract-{i}", daemon=True)
+            for i in range(worker_count)
+        )
+        for thread in threads:
+            thread.start()
+        
+        writer = PageWriter(output_path, self._get_image_format(output_path),
+                            workers=config.get('page_workers', 4), quality=95)
+        banded_output = config.get('banded_output', False)
+        page_strips = []
+        processed_count = 0
+        successful_count = 0
+        total_files = None
+        next_index = 0
+        reorder_buffer = {}
+        
+        def flush_page() -> None:
+            nonlocal page_strips
+            first_page = len(writer.saved_paths) + 1
+            for page_number, page_path in enumerate(
+                writer.write_strips(self.image_composer, page_strips, banded_output), first_page
+            ):
+                self._log_message(f"Writing page {page_number} to: {page_path}")
+            page_strips = []
+        
+        try:
+            while total_files is None or next_index < total_files:
+                message = result_queue.get()
+                if message[0] == "scanned":
+                    total_files = message[1]
+                    continue
+                
+                _, index, video_file, video_data = message
+                reorder_buffer[index] = (video_file, video_data)
+                
+                # Compose strictly in scan order
+                while next_index in reorder_buffer:
+                    video_file, video_data = reorder_buffer.pop(next_index)
+                    next_index += 1
+                    processed_count += 1
+                    in_flight.release()
+                    
+                    if video_data and video_data.processing_status == "success" and video_data.thumbnails:
+                        strip = self.image_composer.create_strip(video_data)
+                        if strip:
+                            page_strips.append(strip)
+                            successful_count += 1
+                            self._log_message(f"Extracted {len(video_data.thumbnails)} thumbnails from {video_file.filename}")
+                    else:
+                        self._log_message(f"Failed to process: {video_file.filename}")
+                    
+                    progress = 0.1 + 0.85 * (processed_count / total_files) if total_files else 0.5
+                    self._report_progress(progress, f"Processed {processed_count} files, {len(writer.saved_paths)} pages written")
+                    
+                    if videos_per_page and len(page_strips) >= videos_per_page:
+                        flush_page()
             
-            contact_sheet.save(output_path, format=image_format, quality=95)
-            self._log_message(f"Saved contact sheet to: {output_path}")
+            if page_strips:
+                flush_page()
+        finally:
+            stop_event.set()
+            for thread in threads:
+                thread.join()
+            # Pages may still be rendering on the writer's worker threads
+            writer.close()
+        
+        if not successful_count:
+            self._log_message("No thumbnails could be extracted")
+            self._report_progress(1.0, "No thumbnails extracted")
+            return False
+        
+        self._log_cache_summary()
+        self._report_progress(1.0, "Processing complete!")
+        self._log_message(f"Successfully processed {successful_count} videos into {len(writer.saved_paths)} pages")
+        return True
+    
+    def _extract_folder_thumbnails(self, video_files: List[VideoFile], positions: List[str],
+                                   thumbnail_width: int) -> List[VideoData]:
+        """
+        Extract thumbnails from video files one after another.
+        
+        Args:
+            video_files: Accessible video files to process.
+            positions: List of position strings.
+            thumbnail_width: Width for thumbnails.
             
-            # Handle additional pages if any
-            additional_pages = self.image_composer.get_additional_pages()
-            if additional_pages:
-                self._log_message(f"Saving {len(additional_pages)} additional pages...")
+        Returns:
+            List of successfully processed video data objects.
+        """
+        video_data_list = []
+        total_videos = len(video_files)
+        
+        for i, video_file in enumerate(video_files):
+            try:
+                progress = 0.1 + (i / total_videos) * 0.7  # 10% to 80% for extraction
+                self._report_progress(progress, f"Processing {video_file.filename}")
+                self._log_message(f"Processing: {video_file.filename}")
                 
-                base_path = Path(output_path)
-                base_name = base_path.stem
-                extension = base_path.suffix
+                # Extract video data
+                video_data = self.thumbnail_extractor.process_video_file(
+                    video_file,
+                    positions,
+                    thumbnail_width
+                )
                 
-                for i, page in enumerate(additional_pages, 2):
-                    page_path = base_path.parent / f"{base_name}_page{i:02d}{extension}"
-                    page.save(str(page_path), format=image_format, quality=95)
-                    self._log_message(f"Saved page {i} to: {page_path}")
+                if video_data and video_data.processing_status == "success":
+                    video_data_list.append(video_data)
+                    self._log_message(f"Extracted {len(video_data.thumbnails)} thumbnails from {video_file.filename}")
+                else:
+                    self._log_message(f"Failed to process: {video_file.filename}")
+                    
+            except Exception as e:
+                self._log_message(f"Error processing {video_file.filename}: {e}")
+                continue
+        
+        return video_data_list
+    
+    def _extract_folder_thumbnails_parallel(self, video_files: List[VideoFile], positions: List[str],
+                                            thumbnail_width: int, max_workers: int) -> List[VideoData]:
+        """
+        Extract thumbnails from video files on a pool of worker processes.
+        
+        Args:
+            video_files: Accessible video files to process.
+            positions: List of position strings.
+            thumbnail_width: Width for thumbnails.
+            max_workers: Number of worker processes (0 = one per CPU).
+            
+        Returns:
+            List of successfully processed video data objects, in scan order.
+        """
+        self._log_message(f"Processing {len(video_files)} videos in parallel "
+                          f"({max_workers if max_workers > 0 else os.cpu_count()} workers)")
+        
+        def on_progress(current: int, total: int, filename: str) -> None:
+            progress = 0.1 + (current / total) * 0.7  # 10% to 80% for extraction
+            self._report_progress(progress, f"Processed {filename} ({current}/{total})")
+        
+        results = self.thumbnail_extractor.batch_process_videos(
+            video_files, positions, thumbnail_width, on_progress, max_workers
+        )
+        
+        video_data_list = []
+        for video_data in results:
+            if video_data and video_data.processing_status == "success":
+                video_data_list.append(video_data)
+                self._log_message(f"Extracted {len(video_data.thumbnails)} thumbnails from {video_data.file.filename}")
+            else:
+                error = f" ({video_data.error_message})" if video_data and video_data.error_message else ""
+                self._log_message(f"Failed to process: {video_data.file.filename}{error}")
+        
+        return video_data_list
+    
+    def _create_contact_sheet(self, video_data_list: List, config: Dict[str, Any]) -> bool:
+        """
+        Create and save contact sheet from video data.
+        
+        Args:
+            video_data_list: List of video data objects.
+            config: Configuration dictionary.
+            
+        Returns:
+            True if successful, False otherwise.
+        """
+        try:
+            self.image_composer = self._create_image_composer(config)
+            
+            # Save pages as they are composed
+            self._report_progress(0.9, "Saving image...")
+            output_path = config.get('output_path', 'output/overview.jpg')
+            writer = PageWriter(output_path, self._get_image_format(output_path),
+                                workers=config.get('page_workers', 4), quality=95)
+            
+            writer.write_contact_sheets(self.image_composer, video_data_list, config.get('banded_output', False))
+            for page_number, page_path in enumerate(writer.saved_paths, 1):
+                if page_number == 1:
+                    self._log_message(f"Saved contact sheet to: {page_path}")
+                else:
+                    self._log_message(f"Saved page {page_number} to: {page_path}")
+            
+            coverage = writer.get_average_coverage() if config.get('layout_mode', 'grid') == 'packed' else None
+            if coverage is not None:
+                self._log_message(f"Packing efficiency: {coverage:.1%} of page area covered by strips")
             
             return True
             
@@ -594,20 +1051,129 @@ class UnifiedProcessor:
             self._log_message(f"Error creating contact sheet: {e}")
             return False
     
-    def get_processing_mode(self) -> str:
+    def _save_extraction_bundle(self, video_data_list: List, config: Dict[str, Any]) -> None:
+        """
+        Save extraction results next to the output for later re-composing.
+        
+        Args:
+            video_data_list: List of video data objects.
+            config: Configuration dictionary.
+        """
+        if not config.get('save_extraction_bundle', True):
+            return
+        
+        output_path = config.get('output_path', 'output/overview.jpg')
+        bundle = ExtractionBundle(ExtractionBundle.get_bundle_path(output_path))
+        if bundle.save(video_data_list, config):
+            self._log_message(f"Saved extraction bundle to: {bundle.bundle_path}")
+    
+    def recompose_from_bundle(self, config: Optional[Dict[str, Any]] = None,
+                              bundle_path: Optional[str] = None) -> bool:
+        """
+        Rebuild the contact sheet from a saved extraction bundle.
+        
+        Only the layout is redone; source videos are never opened, so
+        composition settings can be changed without re-extracting thumbnails.
+        
+        Args:
+            config: Configuration to use. If None, loads it from the config manager.
+            bundle_path: Bundle to read. If None, the bundle next to the output is used.
+            
+        Returns:
+            True if successful, False otherwise.
+        """
+        try:
+            if config is None:
+                config = self.config_manager.load_config()
+            
+            if not bundle_path:
+                bundle_path = ExtractionBundle.get_bundle_path(config.get('output_path', 'output/overview.jpg'))
+            
+            self._report_progress(0.05, "Loading extraction bundle...")
+            bundle = ExtractionBundle(bundle_path)
+            video_data_list = bundle.load()
+            if video_data_list is None:
+                self._log_message(f"Could not load extraction bundle: {bundle_path}")
+                self._report_progress(1.0, "No extraction bundle")
+                return False
+            
+            self._log_message(f"Loaded {len(video_data_list)} videos from extraction bundle {bundle_path}")
+            changed = [key for key in EXTRACTION_SETTINGS_KEYS
+                       if key in bundle.settings and bundle.settings[key] != config.get(key)]
+            if changed:
+                self._log_message(
+                    f"Note: {', '.join(changed)} changed since extraction; "
+                    "regenerate the overview to apply them"
+                )
+            
+            self._report_progress(0.5, "Composing contact sheet...")
+            success = self._create_contact_sheet(video_data_list, config)
+            
+            if success:
+                self._report_progress(1.0, "Re-compose complete!")
+            return success
+        
+        except Exception as e:
+            self._log_message(f"Error re-composing from bundle: {e}")
+            self._report_progress(1.0, "Re-compose failed")
+            return False
+    
+    def _get_image_format(self, output_path: str) -> str:
+        """
+        Determine the image format from the output file extension.
+        
+        Args:
+            output_path: Output file path.
+            
+        Returns:
+            "PNG" for .png files, "DZI" for Deep Zoom outputs, "JPEG" otherwise.
+        """
+        return PageWriter.get_image_format(output_path)
+    
+    def _create_image_composer(self, config: Dict[str, Any]) -> ImageComposer:
+        """
+        Create an image composer configured from settings.
+        
+        Args:
+            config: Configuration dictionary.
+            
+        Returns:
+            Configured ImageComposer instance.
+        """
+        composition_settings = CompositionSettings(
+            clips_per_row=config.get('clips_per_row', 5),
+            padding=config.get('padding', 5),
+            background_color=config.get('background_color', 'white'),
+            font_size=config.get('font_size', 12),
+            text_color=config.get('text_color', 'black'),
+            overlay_background_color=config.get('overlay_background_color', 'black'),
+            overlay_background_opacity=config.get('overlay_background_opacity', 0.7),
+            overlay_position=config.get('overlay_position', 'above_thumbnails'),
+            show_frame=config.get('show_frame', True),
+            frame_color=config.get('frame_color', '#CCCCCC'),
+            frame_thickness=config.get('frame_thickness', 2),
+            frame_padding=config.get('frame_padding', 10),
+            max_rows_per_image=config.get('max_rows_per_image', 0),
+            layout_mode=config.get('layout_mode', 'grid')
+        )
+        
+        return ImageComposer(composition_settings)
+    
+    def get_processing_mode(self, config: Optional[Dict[str, Any]] = None) -> str:
         """
         Get the current processing mode.
         
+        Args:
+            config: Configuration dictionary. If None, loads from config manager.
+            
         Returns:
-            "fcpxml" or "folder" based on the current configuration.
+            "fcpxml", "edl" or "folder" based on the timeline file in the configuration.
         """
-        config = self.config_manager.load_config()
-        fcpxml_path = config.get('fcpxml_file_path', '')
+        if config is None:
+            config = self.config_manager.load_config()
         
-        if fcpxml_path and os.path.exists(fcpxml_path) and os.path.isfile(fcpxml_path):
-            file_extension = Path(fcpxml_path).suffix.lower()
-            if file_extension == '.fcpxml':
-                return "fcpxml"
+        if self._is_timeline_mode(config):
+            return Path(config['fcpxml_file_path']).suffix.lower().lstrip('.')
         
         return "folder"
     
@@ -6,7 +6,7 @@ validate their accessibility, and return structured file information.
 """
 
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -16,9 +16,12 @@ from utils.file_utils import (
     is_file_accessible,
     get_file_size,
     get_file_modification_time,
-    scan_directory_for_files,
-    has_supported_extension
+    scan_directories_parallel,
+    iter_directory_files_sorted,
+    has_supported_extension,
+    FileEntry
 )
+from core.scan_index import ScanIndex
 
 
 @dataclass
@@ -39,19 +42,44 @@ class VideoFile:
             "modified_date": self.modified_date.isoformat() if self.modified_date else None,
             "is_accessible": self.is_accessible
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "VideoFile":
+        """Create from a dictionary produced by to_dict()."""
+        modified_date = data.get("modified_date")
+        return cls(
+            path=data["path"],
+            filename=data["filename"],
+            size=int(data["size"]),
+            modified_date=datetime.fromisoformat(modified_date) if modified_date else None,
+            is_accessible=bool(data["is_accessible"])
+        )
 
 
 class VideoScanner:
     """Scans directories for video files and provides file information."""
     
-    def __init__(self, supported_extensions: Optional[List[str]] = None):
+    def __init__(
+        self,
+        supported_extensions: Optional[List[str]] = None,
+        max_workers: int = 8,
+        scan_index_dir: Optional[str] = None
+    ):
         """
         Initialize the video scanner.
         
         Args:
             supported_extensions: List of supported video file extensions.
                                 If None, uses default extensions.
+            max_workers: Number of threads listing directories concurrently
+                                (1 = sequential walk).
+            scan_index_dir: Directory of the persistent scan index. If None,
+                                every scan lists all directories.
         """
+        self.max_workers = max(1, max_workers)
+        self.scan_index = ScanIndex(scan_index_dir) if scan_index_dir else None
+        # Result of the most recent scan, reused by the summary methods
+        self._last_scan: Optional[Tuple[Tuple, List[VideoFile]]] = None
         if supported_extensions is None:
             self.supported_extensions = [".mp4", ".mov", ".avi", ".mkv", ".mts"]
         else:
@@ -61,6 +89,10 @@ class VideoScanner:
         """
         Scan multiple folders for video files.
         
+        Roots and their subdirectories are listed concurrently on a thread
+        pool of max_workers threads. With a scan index, directories whose
+        mtime is unchanged are served from the index instead of being listed.
+        
         Args:
             folder_paths: List of directory paths to scan.
             recursive: Whether to scan subdirectories recursively.
@@ -70,6 +102,7 @@ class VideoScanner:
         """
         all_video_files = []
         processed_paths = set()  # Avoid duplicate files from overlapping paths
+        root_folders = []
         
         for folder_path in folder_paths:
             if not folder_path or not folder_path.strip():
@@ -81,56 +114,124 @@ class VideoScanner:
                 print(f"Warning: Cannot access directory: {folder_path}")
                 continue
             
-            try:
-                video_files = self._scan_single_folder(folder_path, recursive)
-                
-                # Filter out duplicates based on normalized path
-                for video_file in video_files:
-                    normalized_path = os.path.normpath(os.path.abspath(video_file.path))
-                    if normalized_path not in processed_paths:
-                        processed_paths.add(normalized_path)
-                        all_video_files.append(video_file)
-                        
-            except Exception as e:
-                print(f"Error scanning folder {folder_path}: {e}")
-                continue
+            root_folders.append(folder_path)
+        
+        try:
+            scanned_roots = scan_directories_parallel(
+                root_folders,
+                self.supported_extensions,
+                recursive,
+                self.max_workers,
+                self.scan_index
+            )
+        except Exception as e:
+            print(f"Error scanning folders: {e}")
+            return all_video_files
+        
+        if self.scan_index is not None:
+            self.scan_index.save()
+        
+        # Filter out duplicates based on normalized path, earlier roots first
+        for root_files in scanned_roots:
+            for file_entry in root_files:
+                normalized_path = os.path.normpath(os.path.abspath(file_entry.path))
+                if normalized_path not in processed_paths:
+                    processed_paths.add(normalized_path)
+                    all_video_files.append(self._create_video_file_from_entry(file_entry))
         
         # Sort by path for consistent ordering
         all_video_files.sort(key=lambda x: x.path.lower())
         
+        self._last_scan = (self._get_scan_key(folder_paths, recursive), list(all_video_files))
+        
         return all_video_files
     
-    def _scan_single_folder(self, folder_path: str, recursive: bool = True) -> List[VideoFile]:
+    def iter_video_files(self, folder_paths: List[str], recursive: bool = True) -> Iterator[VideoFile]:
         """
-        Scan a single folder for video files.
+        Yield video files as they are found, for streaming pipelines.
+        
+        Roots are walked one after another in sorted order, each depth-first
+        with sorted directory entries, so for non-overlapping roots the files
+        come out in the same order as scan_folders() returns them.
         
         Args:
-            folder_path: Path to the directory to scan.
+            folder_paths: List of directory paths to scan.
             recursive: Whether to scan subdirectories recursively.
             
-        Returns:
-            List of VideoFile objects found in the directory.
+        Yields:
+            VideoFile objects, without duplicates from overlapping paths.
         """
-        video_files = []
+        processed_paths = set()
+        root_folders = []
+        
+        for folder_path in folder_paths:
+            if not folder_path or not folder_path.strip():
+                continue
+            
+            folder_path = folder_path.strip()
+            
+            if not is_directory_accessible(folder_path):
+                print(f"Warning: Cannot access directory: {folder_path}")
+                continue
+            
+            root_folders.append(folder_path)
         
         try:
-            # Get list of video file paths
-            file_paths = scan_directory_for_files(
-                folder_path, 
-                self.supported_extensions, 
-                recursive
-            )
+            for folder_path in sorted(root_folders, key=lambda path: path.lower()):
+                for file_entry in iter_directory_files_sorted(
+                    folder_path,
+                    self.supported_extensions,
+                    recursive,
+                    self.scan_index
+                ):
+                    normalized_path = os.path.normpath(os.path.abspath(file_entry.path))
+                    if normalized_path not in processed_paths:
+                        processed_paths.add(normalized_path)
+                        yield self._create_video_file_from_entry(file_entry)
+        finally:
+            if self.scan_index is not None:
+                self.scan_index.save()
+    
+    def _get_scan_key(self, folder_paths: List[str], recursive: bool) -> Tuple:
+        """Build the key identifying the inputs of a scan."""
+        return (tuple(folder_paths), recursive, tuple(self.supported_extensions))
+    
+    def get_scan_result(self, folder_paths: List[str], recursive: bool = True) -> List[VideoFile]:
+        """
+        Get the video files of the folders, reusing the most recent scan if it matches.
+        
+        Args:
+            folder_paths: List of directory paths to scan.
+            recursive: Whether to scan subdirectories recursively.
             
-            # Create VideoFile objects for each found file
-            for file_path in file_paths:
-                video_file = self._create_video_file_object(file_path)
-                if video_file:
-                    video_files.append(video_file)
-                    
-        except Exception as e:
-            print(f"Error scanning folder {folder_path}: {e}")
+        Returns:
+            List of VideoFile objects, as returned by scan_folders().
+        """
+        if self._last_scan is not None and self._last_scan[0] == self._get_scan_key(folder_paths, recursive):
+            return list(self._last_scan[1])
+        return self.scan_folders(folder_paths, recursive)
+    
+    def clear_scan_cache(self) -> None:
+        """Forget the most recent scan so the next summary call rescans."""
+        self._last_scan = None
+    
+    def _create_video_file_from_entry(self, file_entry: FileEntry) -> VideoFile:
+        """
+        Create a VideoFile object from a file found by the directory scan.
         
-        return video_files
+        Args:
+            file_entry: Scanned file (already checked to be readable).
+            
+        Returns:
+            VideoFile object for the file.
+        """
+        return VideoFile(
+            path=file_entry.path,
+            filename=os.path.basename(file_entry.path),
+            size=file_entry.size,
+            modified_date=datetime.fromtimestamp(file_entry.mtime_ns / 1e9),
+            is_accessible=True
+        )
     
     def _create_video_file_object(self, file_path: str) -> Optional[VideoFile]:
         """
@@ -183,7 +284,7 @@ class VideoScanner:
         Returns:
             Total number of video files found.
         """
-        video_files = self.scan_folders(folder_paths, recursive)
+        video_files = self.get_scan_result(folder_paths, recursive)
         return len([vf for vf in video_files if vf.is_accessible])
     
     def get_total_size(self, folder_paths: List[str], recursive: bool = True) -> int:
@@ -197,7 +298,7 @@ class VideoScanner:
         Returns:
             Total size of video files in bytes.
         """
-        video_files = self.scan_folders(folder_paths, recursive)
+        video_files = self.get_scan_result(folder_paths, recursive)
         return sum(vf.size for vf in video_files if vf.is_accessible)
     
     def filter_accessible_files(self, video_files: List[VideoFile]) -> List[VideoFile]:
@@ -243,7 +344,7 @@ class VideoScanner:
         Returns:
             Dictionary containing scan summary information.
         """
-        video_files = self.scan_folders(folder_paths, recursive)
+        video_files = self.get_scan_result(folder_paths, recursive)
         accessible_files = self.filter_accessible_files(video_files)
         
         total_size = sum(vf.size for vf in accessible_files)
@@ -304,7 +405,7 @@ class VideoScanner:
         Returns:
             Dictionary mapping file extensions to their counts.
         """
-        video_files = self.scan_folders(folder_paths, recursive)
+        video_files = self.get_scan_result(folder_paths, recursive)
         extension_counts = {}
         
         for video_file in video_files:
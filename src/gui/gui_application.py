@@ -143,7 +143,7 @@ class GUIApplication:
         fcpxml_frame.grid_columnconfigure(0, weight=1)
         
         # FCPXML file label
-        fcpxml_label = ctk.CTkLabel(fcpxml_frame, text="📄 FCPXML File (Optional)", 
+        fcpxml_label = ctk.CTkLabel(fcpxml_frame, text="📄 FCPXML or EDL File (Optional)", 
                                 font=ctk.CTkFont(size=14, weight="bold"))
         fcpxml_label.grid(row=0, column=0, sticky="w", pady=(0, 5))
         
@@ -493,11 +493,20 @@ class GUIApplication:
         section_frame.grid(row=row, column=0, sticky="ew", padx=5, pady=5)
         section_frame.grid_columnconfigure(0, weight=1)
         
+        # Action buttons
+        buttons_frame = ctk.CTkFrame(section_frame, fg_color="transparent")
+        buttons_frame.grid(row=0, column=0, padx=20, pady=20)
+        
         # Generate button
-        self.generate_btn = ctk.CTkButton(section_frame, text="Generate Overview", 
+        self.generate_btn = ctk.CTkButton(buttons_frame, text="Generate Overview", 
                                          font=ctk.CTkFont(size=16, weight="bold"),
                                          height=40, command=self.start_processing)
-        self.generate_btn.grid(row=0, column=0, padx=20, pady=20)
+        self.generate_btn.grid(row=0, column=0, padx=(0, 10))
+        
+        # Re-compose button (layout changes only, no video decoding)
+        self.recompose_btn = ctk.CTkButton(buttons_frame, text="Re-compose",
+                                          height=40, command=self.start_recompose)
+        self.recompose_btn.grid(row=0, column=1)
         
         # Progress frame
         progress_frame = ctk.CTkFrame(section_frame, fg_color="transparent")
@@ -797,7 +806,9 @@ class GUIApplication:
         try:
             # File types for FCPXML files
             filetypes = [
+                ("Timeline files", "*.fcpxml *.edl"),
                 ("FCPXML files", "*.fcpxml"),
+                ("Samplitude EDL files", "*.edl"),
                 ("XML files", "*.xml"),
                 ("All files", "*.*")
             ]
@@ -810,7 +821,7 @@ class GUIApplication:
                 initial_dir = last_fcpxml_folder
             
             filename = filedialog.askopenfilename(
-                title="Select FCPXML File",
+                title="Select Timeline File",
                 filetypes=filetypes,
                 initialdir=initial_dir
             )
@@ -1180,8 +1191,8 @@ class GUIApplication:
         
         # Validate FCPXML file when in FCPXML mode
         if is_fcpxml_mode:
-            if not fcpxml_file.lower().endswith('.fcpxml'):
-                self.log_message("Error: FCPXML file must have .fcpxml extension")
+            if not fcpxml_file.lower().endswith(('.fcpxml', '.edl')):
+                self.log_message("Error: Timeline file must have .fcpxml or .edl extension")
                 all_valid = False
             # Additional FCPXML validation can be added here if needed
         
@@ -1208,8 +1219,18 @@ class GUIApplication:
             pass
     
     # Processing Methods
-    def start_processing(self):
-        """Start the thumbnail generation process."""
+    def start_recompose(self):
+        """Rebuild the overview from the saved extraction bundle."""
+        self.start_processing(recompose=True)
+    
+    def start_processing(self, recompose: bool = False):
+        """
+        Start the thumbnail generation process.
+        
+        Args:
+            recompose: Rebuild the overview from the saved extraction bundle
+                instead of extracting thumbnails from the videos.
+        """
         if self.processing:
             self.log_message("Processing already in progress")
             return
@@ -1229,6 +1250,7 @@ class GUIApplication:
         # Set processing state
         self.processing = True
         self.generate_btn.configure(state="disabled", text="Processing...")
+        self.recompose_btn.configure(state="disabled")
         self.progress_var.set(0.0)
         self.status_var.set("Starting...")
         
@@ -1241,14 +1263,23 @@ class GUIApplication:
         # Start processing thread
         self.processing_thread = threading.Thread(
             target=self._processing_worker,
+            args=(recompose,),
             daemon=True
         )
         self.processing_thread.start()
         
-        self.log_message("Started thumbnail generation process")
+        if recompose:
+            self.log_message("Started re-composing from extraction bundle")
+        else:
+            self.log_message("Started thumbnail generation process")
     
-    def _processing_worker(self):
-        """Worker method for background processing using unified processor."""
+    def _processing_worker(self, recompose: bool = False):
+        """
+        Worker method for background processing using unified processor.
+        
+        Args:
+            recompose: Rebuild the overview from the saved extraction bundle.
+        """
         try:
             # Create unified processor
             unified_processor = UnifiedProcessor(self.config_manager)
@@ -1257,6 +1288,11 @@ class GUIApplication:
             unified_processor.set_progress_callback(lambda progress, message: self.progress_queue.put((progress, message)))
             unified_processor.set_log_callback(lambda message: self.log_queue.put(message))
             
+            if recompose:
+                if not unified_processor.recompose_from_bundle():
+                    self.progress_queue.put((1.0, "Re-compose failed"))
+                return
+            
             # Validate configuration
             is_valid, errors = unified_processor.validate_configuration()
             if not is_valid:
@@ -1480,6 +1516,7 @@ class GUIApplication:
                     if progress is None:  # Completion signal
                         self.processing = False
                         self.generate_btn.configure(state="normal", text="Generate Overview")
+                        self.recompose_btn.configure(state="normal")
                         # Refresh preview when processing is complete
                         self.refresh_preview()
                         break
@@ -6,10 +6,20 @@ and video file validation.
 """
 
 import os
+import struct
+import sys
 import time
 from pathlib import Path
-from typing import List, Optional, Tuple
-from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Iterator, List, NamedTuple, Optional, Set, Tuple
+from datetime import datetime, timedelta
+
+
+class FileEntry(NamedTuple):
+    """File found by a directory scan, with the stat fields the scanner needs."""
+    path: str
+    size: int
+    mtime_ns: int
 
 
 def ensure_directory_exists(directory_path: str) -> bool:
@@ -95,6 +105,61 @@ def get_file_modification_time(file_path: str) -> Optional[datetime]:
         return None
 
 
+def get_quicktime_creation_date(file_path: str) -> Optional[datetime]:
+    """
+    Read the recording date from the movie header of an MP4/QuickTime file.
+    
+    Only box headers are read on the way to the 'mvhd' box, so this is far
+    cheaper than probing. The value matches the creation_time tag ffprobe
+    reports for the file (UTC, without time zone).
+    
+    Args:
+        file_path: Path to the video file.
+        
+    Returns:
+        Creation date, or None if the file is not MP4/QuickTime or its
+        header records no creation time.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            end = os.fstat(f.fileno()).st_size
+            # 'mvhd' is a child of the top-level 'moov' box
+            for box_type in (b'moov', b'mvhd'):
+                while True:
+                    box_start = f.tell()
+                    size, kind = struct.unpack('>I4s', f.read(8))
+                    header_size = 8
+                    if size == 1:
+                        size = struct.unpack('>Q', f.read(8))[0]
+                        header_size = 16
+                    elif size == 0:
+                        size = end - box_start
+                    if size < header_size or box_start + size > end:
+                        return None
+                    if kind == box_type:
+                        end = box_start + size
+                        break
+                    f.seek(box_start + size)
+            
+            version = f.read(4)[0]
+            if version == 1:
+                creation_time = struct.unpack('>Q', f.read(8))[0]
+            else:
+                creation_time = struct.unpack('>I', f.read(4))[0]
+    except (OSError, IndexError, struct.error):
+        return None
+    
+    if not creation_time:
+        return None
+    # Seconds since 1904, as ffmpeg converts them (some writers use 1970)
+    if creation_time >= 2082844800:
+        creation_time -= 2082844800
+    try:
+        return datetime(1970, 1, 1) + timedelta(seconds=creation_time)
+    except OverflowError:
+        return None
+
+
 def generate_multi_page_filenames(base_path: str, page_count: int) -> List[str]:
     """
     Generate filenames for multiple pages based on a base path.
@@ -200,6 +265,245 @@ def has_supported_extension(file_path: str, supported_extensions: List[str]) ->
     return file_extension in [ext.lower() for ext in supported_extensions]
 
 
+def list_directory_files(
+    directory_path: str,
+    extensions: Set[str]
+) -> Tuple[List[FileEntry], List[str]]:
+    """
+    List one directory with os.scandir.
+    
+    Args:
+        directory_path: Path to the directory to list.
+        extensions: Set of lower-case supported file extensions (with dots).
+        
+    Returns:
+        Tuple of (files, subdirectories). files holds a FileEntry for each
+        readable file with a supported extension; subdirectories excludes
+        symlinked directories.
+        
+    Raises:
+        OSError: If the directory itself cannot be listed.
+    """
+    files = []
+    subdirectories = []
+    
+    with os.scandir(directory_path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirectories.append(entry.path)
+                    continue
+                
+                if os.path.splitext(entry.name)[1].lower() not in extensions or not entry.is_file():
+                    continue
+                
+                stat_result = entry.stat()
+                if os.access(entry.path, os.R_OK):
+                    files.append(FileEntry(entry.path, stat_result.st_size, stat_result.st_mtime_ns))
+            except OSError:
+                continue
+    
+    return files, subdirectories
+
+
+def iter_directory_files(
+    directory_path: str,
+    supported_extensions: List[str],
+    recursive: bool = True
+) -> Iterator[FileEntry]:
+    """
+    Walk a directory with os.scandir and yield accessible files with supported extensions.
+    
+    The stat result comes from the directory entry, so each matching file costs
+    one stat call plus one access check. Non-matching files are filtered by name
+    without touching the file system. Symlinked directories are not followed.
+    
+    Args:
+        directory_path: Path to the directory to scan.
+        supported_extensions: List of supported file extensions.
+        recursive: Whether to scan subdirectories recursively.
+        
+    Yields:
+        FileEntry for each matching readable file.
+    """
+    extensions = {ext.lower() for ext in supported_extensions}
+    pending = [directory_path]
+    
+    while pending:
+        current = pending.pop()
+        try:
+            files, subdirectories = list_directory_files(current, extensions)
+        except OSError as e:
+            if current == directory_path:
+                print(f"Error scanning directory {directory_path}: {e}")
+            continue
+        
+        yield from files
+        if recursive:
+            pending.extend(subdirectories)
+
+
+def _list_directory_indexed(
+    directory_path: str,
+    extensions: Set[str],
+    scan_index: Optional[Any]
+) -> Tuple[List[FileEntry], List[str]]:
+    """
+    List a directory, answering from the scan index if it is unchanged.
+    
+    Args:
+        directory_path: Path to the directory to list.
+        extensions: Set of lower-case supported file extensions (with dots).
+        scan_index: Optional index with lookup()/store() (see core.scan_index.ScanIndex).
+        
+    Returns:
+        Tuple of (files, subdirectories) as returned by list_directory_files().
+        
+    Raises:
+        OSError: If the directory cannot be accessed.
+    """
+    if scan_index is None:
+        return list_directory_files(directory_path, extensions)
+    
+    # Stat before listing so a concurrent change is picked up next time
+    mtime_ns = os.stat(directory_path).st_mtime_ns
+    signature = ",".join(sorted(extensions))
+    
+    cached = scan_index.lookup(directory_path, mtime_ns, signature)
+    if cached is not None:
+        return cached
+    
+    files, subdirectories = list_directory_files(directory_path, extensions)
+    scan_index.store(directory_path, mtime_ns, signature, files, subdirectories)
+    return files, subdirectories
+
+
+def scan_directories_parallel(
+    directory_paths: List[str],
+    supported_extensions: List[str],
+    recursive: bool = True,
+    max_workers: int = 8,
+    scan_index: Optional[Any] = None
+) -> List[List[FileEntry]]:
+    """
+    Walk several directory trees concurrently on a thread pool.
+    
+    Every directory listing is a separate task, so independent roots and
+    large subtrees within a root are listed in parallel. Listing is bound by
+    file system latency, which makes threads effective on network storage.
+    
+    With a scan index, directories whose mtime is unchanged are answered
+    from the index with a single stat instead of being listed. Directory
+    mtimes only change when entries are added, removed or renamed, so sizes
+    and mtimes of files modified in place may be stale.
+    
+    Args:
+        directory_paths: Root directories to scan.
+        supported_extensions: List of supported file extensions.
+        recursive: Whether to scan subdirectories recursively.
+        max_workers: Number of listing threads (1 = sequential walk).
+        scan_index: Optional index with lookup()/store() (see core.scan_index.ScanIndex).
+        
+    Returns:
+        One list of FileEntry objects per root, in root order. The order of
+        files within a root is unspecified.
+    """
+    extensions = {ext.lower() for ext in supported_extensions}
+    results: List[List[FileEntry]] = [[] for _ in directory_paths]
+    
+    if max_workers <= 1:
+        for root_index, directory_path in enumerate(directory_paths):
+            pending = [directory_path]
+            while pending:
+                current = pending.pop()
+                try:
+                    files, subdirectories = _list_directory_indexed(current, extensions, scan_index)
+                except OSError as e:
+                    if current == directory_path:
+                        print(f"Error scanning directory {directory_path}: {e}")
+                    continue
+                
+                results[root_index].extend(files)
+                if recursive:
+                    pending.extend(subdirectories)
+        return results
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = {
+            pool.submit(_list_directory_indexed, directory_path, extensions, scan_index): (
+                root_index, directory_path, True
+            )
+            for root_index, directory_path in enumerate(directory_paths)
+        }
+        
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                root_index, directory_path, is_root = pending.pop(future)
+                try:
+                    files, subdirectories = future.result()
+                except OSError as e:
+                    if is_root:
+                        print(f"Error scanning directory {directory_path}: {e}")
+                    continue
+                
+                results[root_index].extend(files)
+                if recursive:
+                    for subdirectory in subdirectories:
+                        pending[pool.submit(_list_directory_indexed, subdirectory, extensions, scan_index)] = (
+                            root_index, subdirectory, False
+                        )
+    
+    return results
+
+
+def iter_directory_files_sorted(
+    directory_path: str,
+    supported_extensions: List[str],
+    recursive: bool = True,
+    scan_index: Optional[Any] = None
+) -> Iterator[FileEntry]:
+    """
+    Walk a directory depth-first and yield files in case-insensitive path order.
+    
+    Entries of each directory are visited sorted by name, with subdirectories
+    keyed by their name plus a separator, so files come out in the same order
+    as sorting all paths with str.lower() - without listing the whole tree first.
+    
+    Args:
+        directory_path: Path to the directory to scan.
+        supported_extensions: List of supported file extensions.
+        recursive: Whether to scan subdirectories recursively.
+        scan_index: Optional index with lookup()/store() (see core.scan_index.ScanIndex).
+        
+    Yields:
+        FileEntry for each matching readable file.
+    """
+    extensions = {ext.lower() for ext in supported_extensions}
+    
+    def walk(current: str) -> Iterator[FileEntry]:
+        try:
+            files, subdirectories = _list_directory_indexed(current, extensions, scan_index)
+        except OSError as e:
+            if current == directory_path:
+                print(f"Error scanning directory {directory_path}: {e}")
+            return
+        
+        items = [(os.path.basename(entry.path).lower(), entry) for entry in files]
+        if recursive:
+            items.extend((os.path.basename(path).lower() + os.sep, path) for path in subdirectories)
+        items.sort(key=lambda item: item[0])
+        
+        for _, item in items:
+            if isinstance(item, FileEntry):
+                yield item
+            else:
+                yield from walk(item)
+    
+    yield from walk(directory_path)
+
+
 def scan_directory_for_files(
     directory_path: str, 
     supported_extensions: List[str], 
@@ -216,31 +520,10 @@ def scan_directory_for_files(
     Returns:
         List of file paths that match the supported extensions.
     """
-    found_files = []
-    
-    try:
-        if not is_directory_accessible(directory_path):
-            return found_files
-        
-        if recursive:
-            for root, dirs, files in os.walk(directory_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    if (has_supported_extension(file_path, supported_extensions) and
-                        is_file_accessible(file_path)):
-                        found_files.append(file_path)
-        else:
-            for item in os.listdir(directory_path):
-                item_path = os.path.join(directory_path, item)
-                if (os.path.isfile(item_path) and
-                    has_supported_extension(item_path, supported_extensions) and
-                    is_file_accessible(item_path)):
-                    found_files.append(item_path)
-    
-    except Exception as e:
-        print(f"Error scanning directory {directory_path}: {e}")
+    if not is_directory_accessible(directory_path):
+        return []
     
-    return found_files
+    return [entry.path for entry in iter_directory_files(directory_path, supported_extensions, recursive)]
 
 
 def get_available_disk_space(path: str) -> int:
@@ -291,6 +574,44 @@ def create_output_directory(output_path: str) -> bool:
         return False
 
 
+def get_user_cache_dir(app_name: str = "footage_thumbnailer") -> str:
+    """
+    Get the per-user cache directory for the application.
+    
+    Args:
+        app_name: Name of the application subdirectory.
+        
+    Returns:
+        Path to the cache directory (not created).
+    """
+    if os.name == 'nt':  # Windows
+        base_dir = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), 'AppData', 'Local')
+        return os.path.join(base_dir, app_name, 'Cache')
+    elif sys.platform == 'darwin':  # macOS
+        return os.path.join(os.path.expanduser('~'), 'Library', 'Caches', app_name)
+    else:  # Linux and other Unix-like systems
+        base_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        return os.path.join(base_dir, app_name)
+
+
+def get_file_identity(file_path: str) -> Optional[Tuple[str, int, int]]:
+    """
+    Get a cache identity for a file from a single stat call.
+    
+    Args:
+        file_path: Path to the file.
+        
+    Returns:
+        Tuple of (normalized_path, size_bytes, mtime_ns), or None if the file
+        cannot be accessed.
+    """
+    try:
+        stat_result = os.stat(file_path)
+        return (os.path.normcase(normalize_path(file_path)), stat_result.st_size, stat_result.st_mtime_ns)
+    except Exception:
+        return None
+
+
 def normalize_path(path: str) -> str:
     """
     Normalize a file path by resolving relative paths and converting separators.
@@ -7,8 +7,77 @@ and thumbnail processing using the Pillow library.
 
 from PIL import Image, ImageDraw, ImageFont
 from typing import Tuple, Optional, List
+from functools import lru_cache
 import os
 import math
+import threading
+
+
+# System fonts tried in order before falling back to Pillow's default font
+DEFAULT_FONT_FACES = ("arial.ttf", "calibri.ttf")
+
+# Aspect ratio (width, height) of the thumbnail cells of the "uniform_cells" layout
+UNIFORM_CELL_ASPECT = (16, 9)
+
+# Cached fonts are shared by page rendering threads, and a FreeType face must
+# not be used by two threads at once
+_FONT_LOCK = threading.RLock()
+
+
+@lru_cache(maxsize=64)
+def _load_font_face(face: str, font_size: int):
+    """
+    Load a TrueType font face, once per process.
+    
+    Args:
+        face: Font file name or path.
+        font_size: Font size in pixels.
+        
+    Returns:
+        PIL font object, or None if the face is not available.
+    """
+    try:
+        return ImageFont.truetype(face, font_size)
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=64)
+def get_font(font_size: int, faces: Tuple[str, ...] = DEFAULT_FONT_FACES):
+    """
+    Get the first available font of a list of faces from the process-wide registry.
+    
+    Args:
+        font_size: Font size in pixels.
+        faces: Font faces to try, in order of preference.
+        
+    Returns:
+        PIL font object, falling back to the default font.
+    """
+    try:
+        for face in faces:
+            font = _load_font_face(face, font_size)
+            if font is not None:
+                return font
+    except Exception:
+        pass
+    return ImageFont.load_default()
+
+
+def measure_text(text: str, font) -> Tuple[int, int]:
+    """
+    Measure the rendered size of a text.
+    
+    Args:
+        text: Text to measure.
+        font: PIL font object.
+        
+    Returns:
+        Tuple of (width, height) of the text bounding box.
+    """
+    with _FONT_LOCK:
+        bbox = font.getbbox(text)
+    return bbox[2] - bbox[0], bbox[3] - bbox[1]
 
 
 def resize_image_proportional(image: Image.Image, target_width: int) -> Image.Image:
@@ -29,6 +98,57 @@ def resize_image_proportional(image: Image.Image, target_width: int) -> Image.Im
     return image.resize((target_width, target_height), Image.Resampling.LANCZOS)
 
 
+def get_uniform_cell_size(thumbnail_width: int) -> Tuple[int, int]:
+    """
+    Get the thumbnail cell size of the "uniform_cells" layout.
+    
+    Args:
+        thumbnail_width: Thumbnail width in pixels.
+        
+    Returns:
+        Tuple of (width, height) of a cell.
+    """
+    aspect_width, aspect_height = UNIFORM_CELL_ASPECT
+    return thumbnail_width, max(1, thumbnail_width * aspect_height // aspect_width)
+
+
+def fit_image_to_cell(
+    image: Image.Image,
+    cell_size: Tuple[int, int],
+    fill_color: Tuple[int, int, int] = (0, 0, 0)
+) -> Image.Image:
+    """
+    Fit an image into a fixed-size cell with a single resize.
+    
+    The image keeps its aspect ratio and is centered; the rest of the cell
+    is filled (letterboxing wide frames, pillarboxing tall ones).
+    
+    Args:
+        image: PIL Image object to fit.
+        cell_size: Tuple of (width, height) of the cell.
+        fill_color: RGB color of the bars.
+        
+    Returns:
+        RGB PIL Image object of exactly cell_size.
+    """
+    image = ensure_image_rgb(image)
+    if image.size == cell_size:
+        return image
+    
+    cell_width, cell_height = cell_size
+    scale = min(cell_width / image.width, cell_height / image.height)
+    size = (
+        min(cell_width, max(1, round(image.width * scale))),
+        min(cell_height, max(1, round(image.height * scale)))
+    )
+    if size != image.size:
+        image = image.resize(size, Image.Resampling.LANCZOS)
+    
+    cell = Image.new('RGB', cell_size, fill_color)
+    cell.paste(image, ((cell_width - size[0]) // 2, (cell_height - size[1]) // 2))
+    return cell
+
+
 def create_text_overlay(
     text: str,
     font_size: int = 12,
@@ -51,27 +171,41 @@ def create_text_overlay(
     Returns:
         PIL Image object containing the text overlay.
     """
-    try:
-        # Try to load a system font
-        try:
-            font = ImageFont.truetype("arial.ttf", font_size)
-        except OSError:
-            try:
-                font = ImageFont.truetype("calibri.ttf", font_size)
-            except OSError:
-                # Fallback to default font
-                font = ImageFont.load_default()
-    except Exception:
-        font = ImageFont.load_default()
+    return get_text_overlay_tile(
+        text, font_size, text_color, background_color, background_opacity, padding
+    ).copy()
+
+
+@lru_cache(maxsize=2048)
+def get_text_overlay_tile(
+    text: str,
+    font_size: int = 12,
+    text_color: str = "white",
+    background_color: str = "black",
+    background_opacity: float = 0.7,
+    padding: int = 4
+) -> Image.Image:
+    """
+    Get a rendered text overlay from the process-wide tile cache.
     
-    # Create a temporary image to measure text size
-    temp_img = Image.new('RGBA', (1, 1))
-    temp_draw = ImageDraw.Draw(temp_img)
+    Repeated texts such as timestamps and durations are rendered only once.
+    The returned image is shared between callers and must not be modified.
+    
+    Args:
+        text: Text to render.
+        font_size: Font size in pixels.
+        text_color: Color of the text.
+        background_color: Color of the background.
+        background_opacity: Opacity of the background (0.0 to 1.0).
+        padding: Padding around text in pixels.
+        
+    Returns:
+        PIL Image object containing the text overlay.
+    """
+    font = get_font(font_size)
     
     # Get text bounding box
-    bbox = temp_draw.textbbox((0, 0), text, font=font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
+    text_width, text_height = measure_text(text, font)
     
     # Create the overlay image
     overlay_width = int(text_width + (padding * 2))
@@ -119,7 +253,8 @@ def create_text_overlay(
         except Exception:
             text_rgba = (255, 255, 255, 255)
     
-    draw.text((padding, padding), text, font=font, fill=text_rgba)
+    with _FONT_LOCK:
+        draw.text((padding, padding), text, font=font, fill=text_rgba)
     
     return overlay
 
@@ -150,41 +285,122 @@ def add_text_overlay_to_image(
     Returns:
         PIL Image object with text overlay added.
     """
-    if not text.strip():
-        return image.copy()
-    
-    # Create text overlay
-    text_overlay = create_text_overlay(
-        text, font_size, text_color, background_color, background_opacity
+    return add_text_overlays_to_image(
+        image, [(text, position)], font_size, text_color, background_color, background_opacity, margin
     )
+
+
+def add_text_overlays_to_image(
+    image: Image.Image,
+    overlays: List[Tuple[str, str]],
+    font_size: int = 12,
+    text_color: str = "white",
+    background_color: str = "black",
+    background_opacity: float = 0.7,
+    margin: int = 5
+) -> Image.Image:
+    """
+    Add several text overlays to an image with a single copy.
+    
+    RGB images stay RGB; the overlays are blended into the copy in place.
     
+    Args:
+        image: PIL Image object to add overlays to.
+        overlays: List of (text, position) tuples, drawn in order.
+        font_size: Font size in pixels.
+        text_color: Color of the text.
+        background_color: Color of the background.
+        background_opacity: Opacity of the background (0.0 to 1.0).
+        margin: Margin from image edges in pixels.
+        
+    Returns:
+        PIL Image object with the text overlays added.
+    """
     # Create a copy of the original image
-    result_image = image.copy()
-    if result_image.mode != 'RGBA':
-        result_image = result_image.convert('RGBA')
-    
-    # Calculate position
-    img_width, img_height = result_image.size
-    overlay_width, overlay_height = text_overlay.size
-    
-    if position == "top-left":
-        x, y = margin, margin
-    elif position == "top-right":
-        x, y = img_width - overlay_width - margin, margin
-    elif position == "bottom-left":
-        x, y = margin, img_height - overlay_height - margin
-    elif position == "bottom-right":
-        x, y = img_width - overlay_width - margin, img_height - overlay_height - margin
+    if image.mode == 'RGB':
+        result_image = image.copy()
     else:
-        # Default to top-left
-        x, y = margin, margin
+        result_image = image.convert('RGBA')
+    
+    tiles = []
+    for text, position in overlays:
+        if not text.strip():
+            continue
+        text_overlay = get_text_overlay_tile(
+            text, font_size, text_color, background_color, background_opacity
+        )
+        x, y = calculate_overlay_position(result_image.size, text_overlay.size, position, margin)
+        tiles.append((text_overlay, x, y))
     
-    # Composite the overlay onto the image
-    result_image.paste(text_overlay, (x, y), text_overlay)
+    blend_overlays(result_image, tiles)
     
     return result_image
 
 
+def blend_overlays(
+    image: Image.Image,
+    overlays: List[Tuple[Image.Image, int, int]],
+    box: Optional[Tuple[int, int, int, int]] = None
+) -> None:
+    """
+    Alpha-blend RGBA overlay tiles onto an image in place.
+    
+    Only the pixels under each overlay are touched, and overlays are clipped
+    to the target box so they never spill onto neighbouring content.
+    
+    Args:
+        image: PIL Image object to draw into (modified in place).
+        overlays: List of (tile, x, y) tuples, with x and y relative to the box.
+        box: (left, top, right, bottom) region of the image the overlays belong
+            to. Defaults to the whole image.
+    """
+    left, top, right, bottom = box if box is not None else (0, 0, image.width, image.height)
+    
+    for tile, x, y in overlays:
+        x += left
+        y += top
+        clip = (max(x, left), max(y, top), min(x + tile.width, right), min(y + tile.height, bottom))
+        if clip[0] >= clip[2] or clip[1] >= clip[3]:
+            continue
+        if clip != (x, y, x + tile.width, y + tile.height):
+            tile = tile.crop((clip[0] - x, clip[1] - y, clip[2] - x, clip[3] - y))
+        
+        # Pasting with the tile's own alpha blends it into the target buffer
+        image.paste(tile, clip[:2], tile)
+
+
+def calculate_overlay_position(
+    image_size: Tuple[int, int],
+    overlay_size: Tuple[int, int],
+    position: str = "top-left",
+    margin: int = 5
+) -> Tuple[int, int]:
+    """
+    Calculate where an overlay is placed on an image.
+    
+    Args:
+        image_size: (width, height) of the image.
+        overlay_size: (width, height) of the overlay.
+        position: Position for the overlay ("top-left", "top-right", "bottom-left", "bottom-right").
+        margin: Margin from image edges in pixels.
+        
+    Returns:
+        Tuple of (x, y) of the overlay's top-left corner, relative to the image.
+    """
+    img_width, img_height = image_size
+    overlay_width, overlay_height = overlay_size
+    
+    if position == "top-right":
+        return img_width - overlay_width - margin, margin
+    elif position == "bottom-left":
+        return margin, img_height - overlay_height - margin
+    elif position == "bottom-right":
+        return img_width - overlay_width - margin, img_height - overlay_height - margin
+    else:
+        # Default to top-left
+        return margin, margin
+
+
 def create_grid_layout(
     images: List[Image.Image],
     clips_per_row: int,
@@ -338,6 +554,25 @@ def ensure_image_rgb(image: Image.Image) -> Image.Image:
     return image
 
 
+def get_text_header_height(text: str, font_size: int = 12, padding: int = 5) -> int:
+    """
+    Get the height of the header create_text_header() renders, without rendering it.
+    
+    Args:
+        text: Text to render.
+        font_size: Font size in pixels.
+        padding: Vertical padding around text.
+        
+    Returns:
+        Header height in pixels.
+    """
+    if not text.strip():
+        return 1
+    
+    _, text_height = measure_text(text, get_font(font_size))
+    return int(text_height + (padding * 2))
+
+
 def create_text_header(text: str, width: int, font_size: int = 12, text_color: str = "black", background_color: str = "white", padding: int = 5) -> Image.Image:
     """
     Create a text header that spans the specified width.
@@ -356,26 +591,10 @@ def create_text_header(text: str, width: int, font_size: int = 12, text_color: s
     if not text.strip():
         return Image.new('RGB', (width, 1), background_color)
     
-    try:
-        # Try to load a system font
-        try:
-            font = ImageFont.truetype("arial.ttf", font_size)
-        except OSError:
-            try:
-                font = ImageFont.truetype("calibri.ttf", font_size)
-            except OSError:
-                font = ImageFont.load_default()
-    except Exception:
-        font = ImageFont.load_default()
-    
-    # Create a temporary image to measure text size
-    temp_img = Image.new('RGB', (1, 1))
-    temp_draw = ImageDraw.Draw(temp_img)
+    font = get_font(font_size)
     
     # Get text bounding box
-    bbox = temp_draw.textbbox((0, 0), text, font=font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
+    text_width, text_height = measure_text(text, font)
     
     # Calculate header height
     header_height = int(text_height + (padding * 2))
@@ -420,11 +639,36 @@ def create_text_header(text: str, width: int, font_size: int = 12, text_color: s
         except Exception:
             text_rgb = (0, 0, 0)
     
-    draw.text((x, y), text, font=font, fill=text_rgb)
+    with _FONT_LOCK:
+        draw.text((x, y), text, font=font, fill=text_rgb)
     
     return header
 
 
+def parse_frame_color(frame_color: str) -> Tuple[int, int, int]:
+    """
+    Parse a frame color setting into an RGB tuple.
+    
+    Args:
+        frame_color: Color name ("black", "white", "gray") or hex string.
+        
+    Returns:
+        RGB tuple, gray for unknown colors.
+    """
+    if frame_color.startswith('#'):
+        try:
+            hex_color = frame_color[1:]
+            return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        except Exception:
+            return (204, 204, 204)  # Default gray
+    elif frame_color.lower() == "black":
+        return (0, 0, 0)
+    elif frame_color.lower() == "white":
+        return (255, 255, 255)
+    else:
+        return (204, 204, 204)  # Default gray
+
+
 def add_frame_to_image(image: Image.Image, frame_color: str = "#CCCCCC", frame_thickness: int = 2, frame_padding: int = 10) -> Image.Image:
     """
     Add a frame/border around an image with padding.
@@ -444,20 +688,7 @@ def add_frame_to_image(image: Image.Image, frame_color: str = "#CCCCCC", frame_t
     new_height = image.height + (2 * total_padding)
     
     # Parse frame color
-    if frame_color.startswith('#'):
-        try:
-            hex_color = frame_color[1:]
-            frame_rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        except Exception:
-            frame_rgb = (204, 204, 204)  # Default gray
-    elif frame_color.lower() == "black":
-        frame_rgb = (0, 0, 0)
-    elif frame_color.lower() == "white":
-        frame_rgb = (255, 255, 255)
-    elif frame_color.lower() == "gray" or frame_color.lower() == "grey":
-        frame_rgb = (204, 204, 204)
-    else:
-        frame_rgb = (204, 204, 204)  # Default gray
+    frame_rgb = parse_frame_color(frame_color)
     
     # Create new image with frame
     framed_image = Image.new('RGB', (new_width, new_height), frame_rgb)
@@ -503,20 +734,15 @@ def create_placeholder_image(width: int, height: int, text: str = "No Preview")
     placeholder = Image.new('RGB', (width, height), (128, 128, 128))  # Gray background
     draw = ImageDraw.Draw(placeholder)
     
-    try:
-        font_size = min(width, height) // 10
-        font = ImageFont.truetype("arial.ttf", font_size)
-    except OSError:
-        font = ImageFont.load_default()
+    font = get_font(min(width, height) // 10, ("arial.ttf",))
     
     # Center the text
-    bbox = draw.textbbox((0, 0), text, font=font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
+    text_width, text_height = measure_text(text, font)
     
     x = (width - text_width) // 2
     y = (height - text_height) // 2
     
-    draw.text((x, y), text, font=font, fill=(255, 255, 255))
+    with _FONT_LOCK:
+        draw.text((x, y), text, font=font, fill=(255, 255, 255))
     
     return placeholder
\ No newline at end of file
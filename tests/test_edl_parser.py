@@ -0,0 +1,115 @@
+"""
+Unit tests for EDL Parser module.
+
+This module contains tests for parsing Samplitude EDL files into timeline
+entries.
+"""
+
+import unittest
+import tempfile
+import os
+import shutil
+import sys
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.edl_parser import EDLParser
+
+
+SAMPLE_EDL = '''Samplitude EDL File Format Version 1.7
+Title: "test.MVD"
+Sample Rate: 44100
+Output Channels: 2
+
+Source Table Entries: 3
+   1 "C:\\Videos\\a.mp4" VIDEO
+   2 "C:\\Videos\\a.mp4" AUDIO
+   3 "C:\\Videos\\b.mp4" VIDEO
+
+Track 1: "Track:" Solo: 0 Mute: 0
+#Source Track Play-In     Play-Out    Record-In   Record-Out  Vol(dB)  MT LK FadeIn       %     CurveType                          FadeOut      %     CurveType                          Name
+#------ ----- ----------- ----------- ----------- ----------- -------- -- -- ------------ ----- ---------------------------------- ------------ ----- ---------------------------------- -----
+      3     1      441000      882000       44100      485100     0.00  0  0            0     0 "*default"                                    0     0 "*default"                         "b.mp4"
+      1     1           0      441000      220500      661500     0.00  0  0            0     0 "*default"                                    0     0 "*default"                         "a.mp4"
+
+Track 2: "Track:" Solo: 0 Mute: 0
+#Source Track Play-In     Play-Out    Record-In   Record-Out  Vol(dB)  MT LK FadeIn       %     CurveType                          FadeOut      %     CurveType                          Name
+#------ ----- ----------- ----------- ----------- ----------- -------- -- -- ------------ ----- ---------------------------------- ------------ ----- ---------------------------------- -----
+      2     2           0      441000      220500      661500     0.00  0  0            0     0 "*default"                                    0     0 "*default"                         "a.mp4"
+      3     2      220500      264600           0       44100     0.00  0  0            0     0 "*default"                                    0     0 "*default"                         "b.mp4"
+
+Volume for Track 1:
+#Play-In       Vol(dB)
+#----------- ---------
+           0    -0.000
+
+Markerlist:
+#Play-In     Type-ID CP EM ISRC           Name
+#----------- ------- -- -- -------------- ----
+           0     101                      "S"
+'''
+
+
+class TestEDLParser(unittest.TestCase):
+    """Test cases for EDL parser functionality."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.parser = EDLParser()
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def create_temp_edl_file(self, content: str) -> str:
+        """Create a temporary EDL file with given content."""
+        temp_file = os.path.join(self.temp_dir, "test.edl")
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return temp_file
+
+    def test_edl_parsing_basic(self):
+        """Test that video clips of all tracks are returned in timeline order."""
+        entries = self.parser.parse_edl_file(self.create_temp_edl_file(SAMPLE_EDL))
+
+        clips = [
+            (entry.source_id, entry.file_path, entry.start_time, entry.end_time,
+             entry.clip_start_time, entry.clip_end_time, entry.track_info["track"])
+            for entry in entries
+        ]
+        self.assertEqual(clips, [
+            (1, "C:/Videos/a.mp4", 0.0, 10.0, 5.0, 15.0, 1),
+            (2, "C:/Videos/b.mp4", 5.0, 6.0, 0.0, 1.0, 2),
+            (3, "C:/Videos/b.mp4", 10.0, 20.0, 1.0, 11.0, 1),
+        ])
+        self.assertEqual(self.parser.sample_rate, 44100)
+        self.assertEqual(self.parser.get_unique_files(entries), ["C:/Videos/a.mp4", "C:/Videos/b.mp4"])
+
+    def test_invalid_edl_file(self):
+        """Test that files without the Samplitude header are rejected."""
+        with self.assertRaises(ValueError):
+            self.parser.parse_edl_file(self.create_temp_edl_file("TITLE: CMX3600 list\n"))
+        with self.assertRaises(FileNotFoundError):
+            self.parser.parse_edl_file(os.path.join(self.temp_dir, "missing.edl"))
+
+    def test_shipped_sample_edl(self):
+        """Test parsing the sample EDL shipped with the repository."""
+        edl_path = os.path.join(os.path.dirname(__file__), '..', 'bologna.edl')
+        entries = self.parser.parse_edl_file(edl_path)
+        statistics = self.parser.get_statistics()
+
+        self.assertEqual(statistics["source_table_entries"], 610)
+        self.assertEqual(statistics["video_sources"], 304)
+        self.assertEqual(len(entries), 375)
+        self.assertTrue(all(entry.file_path.endswith(".mp4") for entry in entries))
+        self.assertEqual([entry.start_time for entry in entries], sorted(entry.start_time for entry in entries))
+        first = entries[0]
+        self.assertTrue(first.file_path.endswith("D8_Bologna1/0508_105846_C.mp4"))
+        self.assertEqual((first.start_time, first.end_time), (0.0, 4.4))
+        self.assertEqual((first.clip_start_time, first.clip_end_time), (4.24, 8.64))
+
+
+if __name__ == '__main__':
+    unittest.main()
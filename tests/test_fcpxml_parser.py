@@ -77,6 +77,77 @@ class TestFCPXMLParser(unittest.TestCase):
         self.assertEqual(entries[1].start_time, 5.0)
         self.assertEqual(entries[1].end_time, 15.0)
     
+    def test_resource_records(self):
+        """Test that asset and format metadata are kept with the entries."""
+        content = '''<?xml version="1.0" encoding="UTF-8"?>
+<fcpxml version="1.10">
+    <resources>
+        <format id="r0" width="3840" height="2160" frameDuration="1001/30000s"/>
+        <asset id="r1" name="a.mov" start="3600s" duration="120s" format="r0" hasVideo="1">
+            <media-rep kind="original-media" src="file:///Volumes/Media/a.mov"/>
+        </asset>
+        <asset id="r2" name="music.wav" duration="300s" hasVideo="0" hasAudio="1" src="file:///Volumes/Media/music.wav"/>
+    </resources>
+    <library>
+        <event name="Test Event">
+            <project name="Test Project">
+                <sequence format="r0">
+                    <spine>
+                        <asset-clip ref="r1" offset="0s" start="3610s" duration="5s"/>
+                        <asset-clip ref="r2" offset="5s" start="0s" duration="5s"/>
+                    </spine>
+                </sequence>
+            </project>
+        </event>
+    </library>
+</fcpxml>'''
+        
+        entries = self.parser.parse_fcpxml_file(self.create_temp_fcpxml_file(content))
+        
+        self.assertEqual(len(entries), 1)
+        entry = entries[0]
+        self.assertEqual(self.normalize_path_for_comparison(entry.file_path), "/Volumes/Media/a.mov")
+        # Clip times are relative to the first frame of the media
+        self.assertEqual((entry.clip_start_time, entry.clip_end_time), (10.0, 15.0))
+        resource = entry.resource
+        self.assertEqual((resource.start, resource.duration), (3600.0, 120.0))
+        self.assertEqual((resource.width, resource.height), (3840, 2160))
+        self.assertAlmostEqual(resource.fps, 29.97, places=2)
+        self.assertTrue(resource.has_video)
+        self.assertFalse(self.parser.resources["r2"].has_video)
+    
+    def test_clip_without_start_on_timecode_asset(self):
+        """Test that clips without a start begin at the first frame of timecoded media."""
+        content = '''<?xml version="1.0" encoding="UTF-8"?>
+<fcpxml version="1.10">
+    <resources>
+        <format id="r0" width="1920" height="1080" frameDuration="1/25s"/>
+        <asset id="r1" start="3600s" duration="60s" format="r0" hasVideo="1" src="file:///Videos/a.mov"/>
+        <asset id="r2" duration="60s" format="r0" hasVideo="1" src="file:///Videos/b.mov"/>
+    </resources>
+    <library>
+        <event name="Edit">
+            <project name="Edit">
+                <sequence format="r0">
+                    <spine>
+                        <asset-clip ref="r1" offset="0s" duration="3s">
+                            <asset-clip ref="r2" lane="1" offset="3601s" start="2s" duration="1s"/>
+                        </asset-clip>
+                    </spine>
+                </sequence>
+            </project>
+        </event>
+    </library>
+</fcpxml>'''
+        
+        entries = self.parser.parse_fcpxml_file(self.create_temp_fcpxml_file(content))
+        
+        clips = [
+            (os.path.basename(entry.file_path), entry.start_time, entry.clip_start_time, entry.clip_end_time)
+            for entry in entries
+        ]
+        self.assertEqual(clips, [("a.mov", 0.0, 0.0, 3.0), ("b.mov", 1.0, 2.0, 3.0)])
+    
     def test_fcpxml_parsing_with_decimal_times(self):
         """Test parsing of FCPXML with decimal time formats."""
         content = '''<?xml version="1.0" encoding="UTF-8"?>
@@ -143,6 +214,160 @@ class TestFCPXMLParser(unittest.TestCase):
                 else:
                     self.assertAlmostEqual(result, expected, places=3)
     
+    def test_streaming_parse_of_large_library(self):
+        """Test that library content around the timeline is streamed, not held in memory."""
+        import tracemalloc
+        
+        parts = ['<?xml version="1.0" encoding="UTF-8"?>\n<fcpxml version="1.8"><library>']
+        for i in range(2000):
+            parts.append(f'<event name="Event {i}">')
+            parts.extend(
+                f'<keyword-collection name="Keyword {k}"/>'
+                f'<smart-collection name="Smart {k}" match="all"><match-text rule="includes" value="x"/></smart-collection>'
+                for k in range(5)
+            )
+            parts.append('</event>')
+        parts.append('<event name="Edit"><project name="Edit"><sequence format="r0"><spine>')
+        parts.extend(f'<asset-clip ref="r{i % 2 + 1}" offset="{i * 2}s" start="1s" duration="2s"/>' for i in range(50))
+        # Resources after the library must still resolve the clips
+        parts.append('</spine></sequence></project></event></library><resources>'
+                     '<format id="r0" width="1920" height="1080" frameDuration="1/25s"/>'
+                     '<asset id="r1" duration="60s" format="r0" src="file:///Videos/a.mp4"/>'
+                     '<asset id="r2" duration="60s" format="r0" src="file:///Videos/b.mp4"/>'
+                     '</resources></fcpxml>')
+        fcpxml_file = self.create_temp_fcpxml_file(''.join(parts))
+        
+        tracemalloc.start()
+        try:
+            entries = self.parser.parse_fcpxml_file(fcpxml_file)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        
+        self.assertEqual(len(entries), 50)
+        self.assertEqual(self.normalize_path_for_comparison(entries[1].file_path), "/Videos/b.mp4")
+        self.assertEqual((entries[1].start_time, entries[1].clip_start_time), (2.0, 1.0))
+        self.assertEqual(entries[1].resource.width, 1920)
+        self.assertLess(peak, os.path.getsize(fcpxml_file) // 2)
+    
+    def test_audio_assets_without_has_video(self):
+        """Test that audio-only assets on connected lanes are skipped when hasVideo is omitted."""
+        content = '''<?xml version="1.0" encoding="UTF-8"?>
+<fcpxml version="1.10">
+    <resources>
+        <format id="r0" width="1920" height="1080" frameDuration="1/25s"/>
+        <asset id="r1" duration="60s" format="r0" hasAudio="1" hasVideo="1" src="file:///Videos/a.mp4"/>
+        <asset id="r2" duration="60s" format="r0" src="file:///Videos/b.mp4"/>
+        <asset id="r3" duration="300s" hasAudio="1" audioSources="1" src="file:///Videos/music.wav"/>
+    </resources>
+    <library>
+        <event name="Edit">
+            <project name="Edit">
+                <sequence format="r0">
+                    <spine>
+                        <asset-clip ref="r1" offset="0s" duration="5s">
+                            <asset-clip ref="r3" lane="-1" offset="0s" duration="10s"/>
+                        </asset-clip>
+                        <asset-clip ref="r2" offset="5s" duration="5s"/>
+                    </spine>
+                </sequence>
+            </project>
+        </event>
+    </library>
+</fcpxml>'''
+        
+        entries = self.parser.parse_fcpxml_file(self.create_temp_fcpxml_file(content))
+        
+        self.assertEqual([os.path.basename(entry.file_path) for entry in entries], ["a.mp4", "b.mp4"])
+        self.assertFalse(self.parser.resources["r3"].has_video)
+        # Assets that state neither attribute are still treated as video
+        self.assertIsNone(self.parser.resources["r2"].has_video)
+    
+    def test_full_timeline_traversal(self):
+        """Test that compound, multicam, sync, connected and nested clips are all found."""
+        from unittest.mock import patch
+        
+        content = '''<?xml version="1.0" encoding="UTF-8"?>
+<fcpxml version="1.9">
+    <resources>
+        <format id="r0" width="1920" height="1080" frameDuration="1/25s"/>
+        <asset id="a1" duration="60s" format="r0" hasVideo="1" src="file:///Videos/a1.mp4"/>
+        <asset id="a2" duration="60s" format="r0" hasVideo="1" src="file:///Videos/a2.mp4"/>
+        <asset id="a3" duration="60s" format="r0" hasVideo="1" src="file:///Videos/a3.mp4"/>
+        <asset id="a4" duration="60s" hasVideo="0" hasAudio="1" src="file:///Videos/music.wav"/>
+        <media id="m1" name="Compound">
+            <sequence format="r0">
+                <spine>
+                    <asset-clip ref="a1" offset="0s" start="10s" duration="4s"/>
+                    <asset-clip ref="a2" offset="4s" start="0s" duration="4s"/>
+                </spine>
+            </sequence>
+        </media>
+        <media id="m2" name="Multicam">
+            <multicam format="r0">
+                <mc-angle angleID="A1"><asset-clip ref="a1" offset="0s" duration="20s"/></mc-angle>
+                <mc-angle angleID="A2"><asset-clip ref="a3" offset="0s" duration="20s"/></mc-angle>
+            </multicam>
+        </media>
+    </resources>
+    <library>
+        <event name="Edit">
+            <project name="Edit">
+                <sequence format="r0">
+                    <spine>
+                        <ref-clip ref="m1" offset="0s" duration="8s">
+                            <asset-clip ref="a3" lane="1" offset="2s" start="5s" duration="1s"/>
+                        </ref-clip>
+                        <ref-clip ref="m1" offset="8s" start="3s" duration="2s"/>
+                        <mc-clip ref="m2" offset="10s" start="5s" duration="3s">
+                            <mc-source angleID="A1" srcEnable="audio"/>
+                            <mc-source angleID="A2" srcEnable="video"/>
+                        </mc-clip>
+                        <gap offset="13s" duration="2s">
+                            <asset-clip ref="a4" lane="-1" offset="0s" duration="2s"/>
+                            <spine lane="1" offset="0s">
+                                <asset-clip ref="a2" offset="0s" start="2s" duration="1s"/>
+                                <asset-clip ref="a1" duration="1s"/>
+                            </spine>
+                        </gap>
+                        <sync-clip offset="15s" duration="2s">
+                            <asset-clip ref="a3" offset="0s" start="1s" duration="5s"/>
+                        </sync-clip>
+                        <asset-clip ref="a1" offset="17s" duration="1s" enabled="0"/>
+                        <clip offset="17s" duration="1s">
+                            <video ref="a2" offset="0s" start="30s" duration="1s"/>
+                        </clip>
+                    </spine>
+                </sequence>
+            </project>
+        </event>
+    </library>
+</fcpxml>'''
+        
+        with patch.object(self.parser, '_collect_spans', wraps=self.parser._collect_spans) as mock_collect:
+            entries = self.parser.parse_fcpxml_file(self.create_temp_fcpxml_file(content))
+        
+        clips = [
+            (entry.start_time, os.path.basename(entry.file_path), entry.clip_start_time, entry.clip_end_time)
+            for entry in entries
+        ]
+        self.assertEqual(clips, [
+            (0.0, "a1.mp4", 10.0, 14.0),
+            (2.0, "a3.mp4", 5.0, 6.0),
+            (4.0, "a2.mp4", 0.0, 4.0),
+            (8.0, "a1.mp4", 13.0, 14.0),
+            (9.0, "a2.mp4", 0.0, 1.0),
+            (10.0, "a3.mp4", 5.0, 8.0),
+            (13.0, "a2.mp4", 2.0, 3.0),
+            (14.0, "a1.mp4", 0.0, 1.0),
+            (15.0, "a3.mp4", 1.0, 3.0),
+            (17.0, "a2.mp4", 30.0, 31.0),
+        ])
+        self.assertEqual([entry.end_time for entry in entries[:3]], [4.0, 3.0, 8.0])
+        # The compound used twice is expanded once
+        expanded = [call.args[0] for call in mock_collect.call_args_list if call.args[0].tag == 'sequence']
+        self.assertEqual(len(expanded), 2)
+    
     def test_invalid_fcpxml_file(self):
         """Test handling of invalid FCPXML files."""
         # Test non-existent file
@@ -122,6 +122,38 @@ class TestGUIFCPXMLValidation(unittest.TestCase):
         # Should not log "No source folders selected" error
         self.app.log_message.assert_not_called()
     
+    def test_validate_all_inputs_valid_with_edl_and_empty_folders(self):
+        """Test validation passes with a Samplitude EDL file and empty source folders."""
+        validation_methods = [
+            'validate_thumbnail_width',
+            'validate_clips_per_row',
+            'validate_positions',
+            'validate_font_size',
+            'validate_frame_thickness',
+            'validate_frame_padding',
+            'validate_max_rows',
+            'validate_padding'
+        ]
+        
+        for method in validation_methods:
+            setattr(self.app, method, Mock(return_value=True))
+        
+        edl_file = os.path.join(self.temp_dir, "test.edl")
+        with open(edl_file, 'w') as f:
+            f.write('Samplitude EDL File Format Version 1.7\n')
+        
+        self.app.fcpxml_file_var = Mock()
+        self.app.fcpxml_file_var.get.return_value = edl_file
+        self.app.get_current_folders = Mock(return_value=[])
+        self.app.output_path_var = Mock()
+        self.app.output_path_var.get.return_value = "output/test.jpg"
+        self.app.log_message = Mock()
+        
+        result = self.app.validate_all_inputs()
+        os.remove(edl_file)
+        self.assertTrue(result)
+        self.app.log_message.assert_not_called()
+    
     def test_validate_all_inputs_invalid_with_invalid_fcpxml_extension(self):
         """Test validation fails with invalid FCPXML file extension."""
         # Mock all validation methods to return True
@@ -153,7 +185,7 @@ class TestGUIFCPXMLValidation(unittest.TestCase):
         
         result = self.app.validate_all_inputs()
         self.assertFalse(result)
-        self.app.log_message.assert_called_with("Error: FCPXML file must have .fcpxml extension")
+        self.app.log_message.assert_called_with("Error: Timeline file must have .fcpxml or .edl extension")
         
         # Clean up
         os.remove(invalid_fcpxml_file)
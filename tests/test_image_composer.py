@@ -3,7 +3,10 @@ Unit tests for the Image Composer component.
 """
 
 import unittest
-from PIL import Image
+import os
+import tempfile
+import shutil
+from PIL import Image, ImageFont
 from pathlib import Path
 
 # Add src to path for imports
@@ -12,9 +15,48 @@ src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
 from core.image_composer import ImageComposer, CompositionSettings
+from core.page_writer import PageWriter
+from core.dzi_writer import DziWriter
 from core.thumbnail_extractor import VideoData, ThumbnailData, VideoMetadata
 from core.video_scanner import VideoFile
+from utils.image_utils import (
+    add_text_overlays_to_image,
+    calculate_overlay_position,
+    create_text_overlay,
+    get_font,
+    get_text_overlay_tile
+)
 from datetime import datetime
+from unittest.mock import patch
+
+
+def arrange_strips_in_grid(settings, strips):
+    """Paste strip images into a grid the way sheets were composed before the layout engine."""
+    strips_per_row = min(settings.clips_per_row, len(strips))
+    num_rows = -(-len(strips) // strips_per_row)
+    
+    # Strips of other widths are scaled to the widest one
+    max_width = max(strip.width for strip in strips)
+    strips = [
+        strip if strip.width == max_width
+        else strip.resize((max_width, int(max_width * strip.height / strip.width)), Image.Resampling.LANCZOS)
+        for strip in strips
+    ]
+    max_height = max(strip.height for strip in strips)
+    
+    padding = settings.padding
+    bg_color = (0, 0, 0) if settings.background_color.lower() == "black" else (255, 255, 255)
+    grid_image = Image.new('RGB', (
+        strips_per_row * max_width + (strips_per_row + 1) * padding,
+        num_rows * max_height + (num_rows + 1) * padding
+    ), bg_color)
+    
+    for i, strip in enumerate(strips):
+        x = padding + (i % strips_per_row) * (max_width + padding)
+        y = padding + (i // strips_per_row) * (max_height + padding) + (max_height - strip.height) // 2
+        grid_image.paste(strip, (x, y))
+    
+    return grid_image
 
 
 class TestImageComposer(unittest.TestCase):
@@ -102,6 +144,315 @@ class TestImageComposer(unittest.TestCase):
         expected_width = (3 * 320) + (2 * 5)  # 3 thumbnails + 2 padding
         self.assertEqual(strip.size[0], expected_width)
     
+    def test_layout_engine_matches_strip_pipeline(self):
+        """Test that direct page rendering matches composing intermediate strips."""
+        tall_thumbnails = [
+            ThumbnailData(Image.new('RGB', (320, 400), color=(30, 60 + i * 40, 90)), i * 10.0, f"00:{i * 10:02d}", i)
+            for i in range(3)
+        ]
+        tall_video = VideoData(self.test_video_file, self.test_metadata, tall_thumbnails, "success")
+        untimed_video = VideoData(
+            VideoFile("C:/Videos/a_much_longer_file_name_than_fits.mp4", "a_much_longer_file_name_than_fits.mp4",
+                      1, None, True),
+            VideoMetadata(5.0, None, (1920, 1080), 30.0, "h264", "mp4"),
+            [ThumbnailData(Image.new('RGB', (60, 34), color=(200, 10, 10)), 0.0, "00:00", 0)] * 3,
+            "success"
+        )
+        videos = [self.test_video_data, tall_video, self.test_video_data, untimed_video]
+        
+        for overrides in (
+            {},
+            {"overlay_position": "on_thumbnails"},
+            {"overlay_position": "on_thumbnails", "show_frame": False, "background_color": "black", "clips_per_row": 2},
+            {"frame_padding": 0, "frame_color": "#123456", "padding": 0},
+            {"show_filename": False, "show_creation_date": False, "show_duration": False},
+        ):
+            composer = ImageComposer(CompositionSettings(**overrides))
+            page_videos = videos if overrides.get("overlay_position") else videos[:3]
+            legacy = arrange_strips_in_grid(composer.settings, [composer._create_video_strip(vd) for vd in page_videos])
+            page = composer.compose_page([composer.create_strip(vd) for vd in page_videos])
+            
+            self.assertEqual(page.size, legacy.size, overrides)
+            self.assertEqual(page.tobytes(), legacy.tobytes(), overrides)
+    
+    def test_layout_engine_falls_back_for_mixed_widths(self):
+        """Test that strips of different widths are still scaled to a common width."""
+        short_video = VideoData(self.test_video_file, self.test_metadata, self.test_thumbnails[:2], "success")
+        videos = [self.test_video_data, short_video]
+        
+        legacy = arrange_strips_in_grid(
+            self.composer.settings, [self.composer._create_video_strip(vd) for vd in videos]
+        )
+        page = self.composer.compose_page([self.composer.create_strip(vd) for vd in videos])
+        
+        self.assertEqual(page.tobytes(), legacy.tobytes())
+    
+    def test_fonts_and_overlay_tiles_are_cached(self):
+        """Test that fonts load once per face and size and repeated overlays render once."""
+        missing_faces = []
+        real_truetype = ImageFont.truetype
+        
+        def fake_truetype(font, *args, **kwargs):
+            if isinstance(font, str):
+                missing_faces.append(font)
+                raise OSError(font)
+            return real_truetype(font, *args, **kwargs)
+        
+        with patch("utils.image_utils.ImageFont.truetype", side_effect=fake_truetype):
+            first = get_font(97)
+            second = get_font(97)
+        self.assertIs(first, second)
+        self.assertEqual(missing_faces, ["arial.ttf", "calibri.ttf"])
+        
+        tile = get_text_overlay_tile("00:00", 11, "white", "black", 0.7)
+        self.assertIs(get_text_overlay_tile("00:00", 11, "white", "black", 0.7), tile)
+        self.assertIsNot(get_text_overlay_tile("00:00", 11, "white", "black", 0.5), tile)
+        
+        # The public helper returns a private copy of the shared tile
+        overlay = create_text_overlay("00:00", 11, "white", "black", 0.7)
+        self.assertIsNot(overlay, tile)
+        self.assertEqual(overlay.tobytes(), tile.tobytes())
+    
+    def test_overlays_blend_in_place_like_rgba_compositing(self):
+        """Test that in-place overlay blending matches compositing through RGBA."""
+        image = Image.new('RGB', (60, 40), color=(10, 120, 240))
+        overlays = [("a_long_file_name.mp4", "top-left"), ("00:05", "bottom-left"), ("00:42", "bottom-right")]
+        
+        expected = image.convert('RGBA')
+        for text, position in overlays:
+            tile = create_text_overlay(text, 10, "white", "black", 0.6)
+            expected.paste(tile, calculate_overlay_position(expected.size, tile.size, position, 5), tile)
+        
+        result = add_text_overlays_to_image(image, overlays, 10, "white", "black", 0.6)
+        
+        self.assertEqual(result.mode, 'RGB')
+        self.assertEqual(result.tobytes(), expected.convert('RGB').tobytes())
+        self.assertEqual(image.getpixel((0, 0)), (10, 120, 240))
+    
+    def test_pages_are_rendered_and_written_one_at_a_time(self):
+        """Test that iter_pages composes each page only when it is requested."""
+        composer = ImageComposer(CompositionSettings(clips_per_row=2, max_rows_per_image=1))
+        pages = composer.iter_pages([self.test_video_data] * 5)
+        
+        with patch.object(composer, 'create_strip', wraps=composer.create_strip) as mock_strip:
+            first = next(pages)
+            self.assertEqual(mock_strip.call_count, 2)
+            self.assertEqual(first.size, composer.compose_page([composer.create_strip(self.test_video_data)] * 2).size)
+            
+            temp_dir = tempfile.mkdtemp()
+            try:
+                writer = PageWriter(os.path.join(temp_dir, "out", "sheet.png"), PageWriter.get_image_format("sheet.png"))
+                writer.write(first)
+                saved = writer.write_pages(pages)
+                
+                self.assertEqual(mock_strip.call_count, 5 + 1)
+                self.assertEqual(
+                    [os.path.basename(path) for path in saved],
+                    ["sheet.png", "sheet_page02.png", "sheet_page03.png"]
+                )
+                self.assertTrue(all(os.path.exists(path) for path in saved))
+                self.assertEqual(writer.page_sizes[0], first.size)
+            finally:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+    
+    def test_banded_png_matches_composed_page(self):
+        """Test that a PNG streamed in bands equals the page composed in one piece."""
+        short_video = VideoData(self.test_video_file, self.test_metadata, self.test_thumbnails[:2], "success")
+        videos = [self.test_video_data, short_video, self.test_video_data, self.test_video_data, self.test_video_data]
+        composer = ImageComposer(CompositionSettings(clips_per_row=2))
+        
+        temp_dir = tempfile.mkdtemp()
+        try:
+            writer = PageWriter(os.path.join(temp_dir, "sheet.png"))
+            saved = writer.write_contact_sheets(composer, videos, banded=True)
+            
+            expected = composer.compose_page([composer.create_strip(vd) for vd in videos])
+            self.assertEqual(len(saved), 1)
+            with Image.open(saved[0]) as banded:
+                self.assertEqual(banded.size, expected.size)
+                self.assertEqual(banded.convert('RGB').tobytes(), expected.tobytes())
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    
+    def test_parallel_pages_match_sequential_pages(self):
+        """Test that pages rendered on worker threads keep their content, order and names."""
+        videos = []
+        for i in range(7):
+            video_file = VideoFile(f"C:/Videos/clip_{i}.mp4", f"clip_{i}.mp4", 1000, datetime(2023, 1, 15), True)
+            videos.append(VideoData(video_file, self.test_metadata, self.test_thumbnails[:i % 3 + 1], "success"))
+        composer = ImageComposer(CompositionSettings(clips_per_row=1, max_rows_per_image=2))
+        expected = list(composer.iter_pages(videos))
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            writer = PageWriter(os.path.join(temp_dir, "sheet.png"), workers=3)
+            saved = writer.write_contact_sheets(composer, videos)
+
+            self.assertEqual(
+                [os.path.basename(path) for path in saved],
+                ["sheet.png", "sheet_page02.png", "sheet_page03.png", "sheet_page04.png"]
+            )
+            self.assertEqual(writer.page_sizes, [page.size for page in expected])
+            for path, page in zip(saved, expected):
+                with Image.open(path) as saved_page:
+                    self.assertEqual(saved_page.convert('RGB').tobytes(), page.tobytes())
+            self.assertIsNone(writer._executor)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_uniform_cells_compose_without_resampling(self):
+        """Test that mixed aspect ratios are composed without resizing in uniform-cell mode."""
+        vertical = [
+            ThumbnailData(Image.new('RGB', (320, 569), (200, 50, 50)), i * 30.0, f"00:{i * 30:02d}", i * 900)
+            for i in range(3)
+        ]
+        vertical_video = VideoData(self.test_video_file, self.test_metadata, vertical, "success")
+        short_video = VideoData(self.test_video_file, self.test_metadata, self.test_thumbnails[:2], "success")
+        videos = [self.test_video_data, vertical_video, short_video]
+        
+        heights = {}
+        for layout_mode, expect_resize in (("grid", True), ("uniform_cells", False)):
+            with self.subTest(layout_mode=layout_mode):
+                composer = ImageComposer(CompositionSettings(clips_per_row=3, layout_mode=layout_mode))
+                strips = [composer.create_strip(vd) for vd in videos]
+                with patch.object(Image.Image, 'resize', autospec=True, side_effect=Image.Image.resize) as mock_resize:
+                    page = composer.compose_page(strips)
+                self.assertEqual(mock_resize.called, expect_resize)
+                heights[layout_mode] = page.height
+        
+        self.assertLess(heights["uniform_cells"], heights["grid"])
+        self.assertEqual({strip.thumbnail_size for strip in strips}, {(320, 180)})
+        self.assertEqual(strips[0].height, strips[1].height)
+        geometry = composer.get_page_geometry(strips)
+        self.assertEqual(page.size, (geometry.width, geometry.height))
+        self.assertEqual(geometry.row_height, strips[0].height)
+        # The vertical frame is pillarboxed in the middle of its cell
+        x, y = strips[1].thumbnail_offsets[0]
+        left = 5 + geometry.strip_width + 5 + x
+        top = 5 + y
+        self.assertEqual(page.getpixel((left + 5, top + 90)), (0, 0, 0))
+        self.assertEqual(page.getpixel((left + 160, top + 90)), (200, 50, 50))
+    
+    def test_packed_layout_shrinks_mixed_height_sheets(self):
+        """Test that packing strips of different heights covers more of a smaller page."""
+        vertical = [
+            ThumbnailData(Image.new('RGB', (320, 569), (200, 50, 50)), i * 30.0, f"00:{i * 30:02d}", i * 900)
+            for i in range(3)
+        ]
+        vertical_video = VideoData(self.test_video_file, self.test_metadata, vertical, "success")
+        videos = [vertical_video, self.test_video_data, self.test_video_data, self.test_video_data,
+                  self.test_video_data, vertical_video, self.test_video_data, self.test_video_data]
+        
+        geometries = {}
+        for layout_mode in ("grid", "packed"):
+            composer = ImageComposer(CompositionSettings(clips_per_row=3, layout_mode=layout_mode))
+            strips = [composer.create_strip(vd) for vd in videos]
+            geometries[layout_mode] = composer.get_page_geometry(strips)
+        
+        grid, packed = geometries["grid"], geometries["packed"]
+        self.assertEqual(packed.width, grid.width)
+        self.assertLess(packed.height, grid.height)
+        self.assertGreater(packed.coverage, grid.coverage)
+        
+        # Every strip lies inside the page and no two strips overlap
+        boxes = [(x, y, x + strip.width, y + strip.height) for strip, (x, y) in zip(strips, packed.positions)]
+        for i, (left, top, right, bottom) in enumerate(boxes):
+            self.assertTrue(0 < left and right < packed.width and 0 < top and bottom < packed.height)
+            for other in boxes[i + 1:]:
+                self.assertFalse(left < other[2] and other[0] < right and top < other[3] and other[1] < bottom)
+        
+        page = composer.compose_page(strips)
+        self.assertEqual(page.size, (packed.width, packed.height))
+        bands = list(composer.iter_page_bands(strips))
+        self.assertEqual(sum(band.height for band in bands), page.height)
+        top = 0
+        for band in bands:
+            self.assertEqual(band.tobytes(), page.crop((0, top, page.width, top + band.height)).tobytes())
+            top += band.height
+        
+        max_height = max(strip.height for strip in strips) + 2 * 5
+        chunks = composer.split_strips_to_fit(strips, max_height)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(sum(len(chunk) for chunk in chunks), len(strips))
+        self.assertTrue(all(composer.get_page_geometry(chunk).height <= max_height for chunk in chunks))
+    
+    def test_sheet_too_tall_for_format_is_paginated(self):
+        """Test that sheets exceeding the format's dimension limit are split into pages."""
+        composer = ImageComposer(CompositionSettings(clips_per_row=2))
+        strips = [composer.create_strip(self.test_video_data) for _ in range(7)]
+        geometry = composer.get_page_geometry(strips)
+        max_height = 2 * (geometry.row_height + 5) + 5
+        
+        chunks = composer.split_strips_to_fit(strips, max_height)
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 3])
+        self.assertTrue(all(composer.get_page_geometry(chunk).height <= max_height for chunk in chunks))
+        self.assertEqual(composer.split_strips_to_fit(strips, None), [strips])
+        
+        temp_dir = tempfile.mkdtemp()
+        try:
+            writer = PageWriter(os.path.join(temp_dir, "sheet.jpg"), quality=95)
+            with patch.dict("core.page_writer.MAX_IMAGE_DIMENSIONS", {"JPEG": max_height}):
+                saved = writer.write_contact_sheets(composer, [self.test_video_data] * 7)
+            self.assertEqual([os.path.basename(path) for path in saved], ["sheet.jpg", "sheet_page02.jpg"])
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    
+    def test_format_dimension_limits(self):
+        """Test that the JPEG limit is the largest size Pillow can save and wide sheets are rejected."""
+        import io
+        
+        temp_dir = tempfile.mkdtemp()
+        try:
+            max_dimension = PageWriter(os.path.join(temp_dir, "sheet.jpg")).get_max_dimension()
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        self.assertEqual(max_dimension, 65500)
+        
+        Image.new('RGB', (1, max_dimension)).save(io.BytesIO(), format='JPEG')
+        with self.assertRaises((OSError, ValueError)):
+            Image.new('RGB', (1, max_dimension + 1)).save(io.BytesIO(), format='JPEG')
+        
+        composer = ImageComposer(CompositionSettings(clips_per_row=3))
+        strips = [composer.create_strip(self.test_video_data) for _ in range(3)]
+        geometry = composer.get_page_geometry(strips)
+        with patch('builtins.print') as mock_print:
+            composer.split_strips_to_fit(strips, geometry.width)
+            mock_print.assert_not_called()
+            self.assertEqual(composer.split_strips_to_fit(strips, geometry.width - 1), [strips])
+        self.assertIn("pixel wide sheet exceeds", mock_print.call_args[0][0])
+    
+    def test_deep_zoom_pyramid_from_bands(self):
+        """Test that every pyramid level built from bands matches halving the whole image."""
+        import numpy as np
+        
+        rng = np.random.default_rng(0)
+        image = Image.fromarray(rng.integers(0, 256, (301, 203, 3), dtype=np.uint8), 'RGB')
+        band_edges = [0, 17, 90, 91, 250, 301]
+        bands = [image.crop((0, top, image.width, bottom)) for top, bottom in zip(band_edges, band_edges[1:])]
+        
+        temp_dir = tempfile.mkdtemp()
+        try:
+            writer = DziWriter(os.path.join(temp_dir, "sheet.dzi"), tile_size=64, tile_format="png")
+            writer.write(image.size, bands)
+            
+            self.assertTrue(os.path.exists(os.path.join(temp_dir, "sheet.html")))
+            max_level = DziWriter.get_max_level(*image.size)
+            self.assertEqual(max_level, 9)
+            
+            expected = image
+            for level in range(max_level, -1, -1):
+                level_dir = os.path.join(temp_dir, "sheet_files", str(level))
+                rebuilt = Image.new('RGB', expected.size)
+                for name in os.listdir(level_dir):
+                    col, row = map(int, name[:-4].split("_"))
+                    with Image.open(os.path.join(level_dir, name)) as tile:
+                        rebuilt.paste(tile, (col * 64, row * 64))
+                self.assertEqual(rebuilt.tobytes(), expected.tobytes(), level)
+                expected = expected.reduce(2)
+            self.assertEqual(rebuilt.size, (1, 1))
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    
     def test_contact_sheet_creation(self):
         """Test complete contact sheet creation."""
         # Create multiple video data objects
@@ -0,0 +1,295 @@
+"""
+Unit tests for the Thumbnail Extractor component.
+"""
+
+import unittest
+import tempfile
+import shutil
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import cv2
+from PIL import Image
+import numpy as np
+
+# Add src to path for imports
+import sys
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from core.thumbnail_extractor import ThumbnailExtractor, VideoMetadata
+from core.thumbnail_cache import ThumbnailCache
+from core.video_scanner import VideoFile
+
+
+def write_test_video(path: str, frame_count: int = 50, fps: float = 25.0, size=(160, 90)) -> None:
+    """Write a small MJPG video whose frames encode their index as brightness."""
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), fps, size)
+    for i in range(frame_count):
+        frame = np.full((size[1], size[0], 3), (i * 5) % 256, dtype=np.uint8)
+        writer.write(frame)
+    writer.release()
+
+
+class TestThumbnailExtractor(unittest.TestCase):
+    """Test cases for the ThumbnailExtractor class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.video_path = os.path.join(self.temp_dir, "test.avi")
+        write_test_video(self.video_path)
+
+        self.metadata = VideoMetadata(
+            duration=2.0,
+            creation_date=None,
+            resolution=(160, 90),
+            fps=25.0,
+            codec="mjpeg",
+            format="avi"
+        )
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_invalid_extraction_mode_falls_back_to_seek(self):
+        """Test that unknown extraction modes fall back to seeking."""
+        extractor = ThumbnailExtractor(extraction_mode="bogus")
+        self.assertEqual(extractor.extraction_mode, "seek")
+
+    def test_resolve_frame_targets_keeps_order(self):
+        """Test that resolved targets keep the requested position order."""
+        extractor = ThumbnailExtractor()
+        targets = extractor._resolve_frame_targets(["99%", "0%", "bad", "50%"], 2.0, 25.0, 50)
+
+        self.assertEqual([t[0] for t in targets], ["99%", "0%", "50%"])
+        self.assertEqual([t[2] for t in targets], [49, 0, 25])
+
+    def test_single_pass_matches_seek_mode(self):
+        """Test that single-pass extraction returns the same thumbnails as seeking."""
+        positions = ["90%", "0%", "50%", "10%"]
+        results = {}
+
+        for mode in ("seek", "single_pass"):
+            extractor = ThumbnailExtractor(extraction_mode=mode)
+            with patch.object(extractor, "get_video_metadata", return_value=self.metadata):
+                results[mode] = extractor.extract_thumbnails(self.video_path, positions, 120)
+
+        self.assertEqual(len(results["seek"]), 4)
+        self.assertEqual(
+            [t.frame_number for t in results["seek"]],
+            [t.frame_number for t in results["single_pass"]]
+        )
+        for seek_thumb, pass_thumb in zip(results["seek"], results["single_pass"]):
+            self.assertEqual(seek_thumb.timestamp, pass_thumb.timestamp)
+            self.assertEqual(seek_thumb.image.size, (120, 67))
+            self.assertEqual(seek_thumb.image.tobytes(), pass_thumb.image.tobytes())
+
+    def test_ffmpeg_backend_uses_scaled_frames(self):
+        """Test that the ffmpeg backend requests frames at the thumbnail width."""
+        extractor = ThumbnailExtractor(frame_backend="ffmpeg")
+        scaled = Image.new("RGB", (120, 67))
+
+        with patch.object(extractor, "get_video_metadata", return_value=self.metadata), \
+             patch.object(extractor, "_read_scaled_frame_ffmpeg", return_value=scaled) as mock_read:
+            thumbnails = extractor.extract_thumbnails(self.video_path, ["50%", "0%"], 120)
+
+        self.assertEqual([t.position for t in thumbnails], [1.0, 0.0])
+        self.assertEqual([t.frame_number for t in thumbnails], [25, 0])
+        mock_read.assert_any_call(self.video_path, 1.0, 120)
+        self.assertEqual(mock_read.call_count, 2)
+
+    def test_ffmpeg_backend_reads_last_frame_of_short_clip(self):
+        """Test that end positions of short clips give the same frames with both backends."""
+        positions = ["0%", "50%", "99%", "100%"]
+        opencv_thumbs = ThumbnailExtractor().extract_thumbnails(self.video_path, positions, 120, self.metadata)
+        ffmpeg_thumbs = ThumbnailExtractor(frame_backend="ffmpeg").extract_thumbnails(
+            self.video_path, positions, 120, self.metadata
+        )
+
+        self.assertEqual([t.frame_number for t in ffmpeg_thumbs], [0, 25, 49, 49])
+        self.assertEqual([t.frame_number for t in ffmpeg_thumbs], [t.frame_number for t in opencv_thumbs])
+        # Frames encode their index as brightness
+        self.assertAlmostEqual(
+            ffmpeg_thumbs[-1].image.getpixel((60, 30))[0], opencv_thumbs[-1].image.getpixel((60, 30))[0], delta=8
+        )
+
+    def test_uniform_cells_pillarbox_vertical_frames(self):
+        """Test that uniform-cell extraction fits vertical frames into 16:9 cells."""
+        vertical_path = os.path.join(self.temp_dir, "vertical.avi")
+        write_test_video(vertical_path, size=(90, 160))
+        extractor = ThumbnailExtractor(uniform_cells=True)
+
+        with patch.object(extractor, "get_video_metadata", return_value=self.metadata):
+            thumbnails = extractor.extract_thumbnails(vertical_path, ["50%"], 160)
+
+        image = thumbnails[0].image
+        self.assertEqual(image.size, (160, 90))
+        self.assertEqual(image.getpixel((0, 45)), (0, 0, 0))
+        self.assertGreater(image.getpixel((80, 45))[0], 100)
+        self.assertNotEqual(extractor._get_cache_mode(), ThumbnailExtractor()._get_cache_mode())
+
+    def test_video_clips_share_one_extraction(self):
+        """Test that several clips of one file are decoded in a single pass."""
+        extractor = ThumbnailExtractor()
+        video_file = VideoFile(self.video_path, "test.avi", 0, None, True)
+        clip_positions = [["1.5s", "0.5s"], ["0.5s", "0.0s"], ["bad"]]
+
+        with patch.object(extractor, "get_video_metadata", return_value=self.metadata) as mock_metadata, \
+             patch("core.thumbnail_extractor.cv2.VideoCapture", wraps=cv2.VideoCapture) as mock_capture:
+            clips = extractor.process_video_clips(video_file, clip_positions, 120)
+
+        mock_metadata.assert_called_once()
+        mock_capture.assert_called_once()
+        self.assertEqual([clip.processing_status for clip in clips], ["success", "success", "no_thumbnails"])
+        self.assertEqual([t.position for t in clips[0].thumbnails], [1.5, 0.5])
+        self.assertEqual([t.position for t in clips[1].thumbnails], [0.5, 0.0])
+        self.assertIs(clips[0].thumbnails[1], clips[1].thumbnails[0])
+
+        separate = ThumbnailExtractor()
+        with patch.object(separate, "get_video_metadata", return_value=self.metadata):
+            expected = separate.process_video_file(video_file, clip_positions[0], 120)
+        self.assertEqual(
+            [t.image.tobytes() for t in clips[0].thumbnails],
+            [t.image.tobytes() for t in expected.thumbnails]
+        )
+
+    def test_parallel_batch_keeps_scan_order(self):
+        """Test that parallel batch processing returns results in input order."""
+        extractor = ThumbnailExtractor()
+        video_files = [
+            VideoFile(
+                path=os.path.join(self.temp_dir, f"missing_{i}.mp4"),
+                filename=f"missing_{i}.mp4",
+                size=0,
+                modified_date=None,
+                is_accessible=(i != 1)
+            )
+            for i in range(4)
+        ]
+        progress_calls = []
+
+        results = extractor.batch_process_videos(
+            video_files, ["0%"], 120,
+            lambda current, total, filename: progress_calls.append((current, total)),
+            max_workers=2
+        )
+
+        self.assertEqual([r.file.filename for r in results], [vf.filename for vf in video_files])
+        self.assertTrue(all(r.processing_status == "error" for r in results))
+        self.assertEqual(results[1].error_message, "File is not accessible")
+        self.assertEqual(sorted(progress_calls), [(2, 4), (3, 4), (4, 4)])
+
+    def test_metadata_probed_once_per_run(self):
+        """Test that process_video_file probes each file only once."""
+        extractor = ThumbnailExtractor()
+        video_file = VideoFile(self.video_path, "test.avi", 0, None, True)
+
+        with patch.object(extractor, "_probe_video_metadata", return_value=self.metadata) as mock_probe:
+            video_data = extractor.process_video_file(video_file, ["0%", "50%"], 120)
+            extractor.get_video_metadata(self.video_path)
+
+        self.assertEqual(video_data.processing_status, "success")
+        mock_probe.assert_called_once()
+
+    def test_persistent_metadata_cache(self):
+        """Test that cached metadata is reused until the file changes."""
+        cache_dir = os.path.join(self.temp_dir, "cache")
+
+        first = ThumbnailExtractor(metadata_cache_dir=cache_dir)
+        with patch.object(first, "_probe_video_metadata", return_value=self.metadata):
+            first.get_video_metadata(self.video_path)
+
+        second = ThumbnailExtractor(metadata_cache_dir=cache_dir)
+        with patch.object(second, "_probe_video_metadata", return_value=None) as mock_probe:
+            cached = second.get_video_metadata(self.video_path)
+        mock_probe.assert_not_called()
+        self.assertEqual(cached, self.metadata)
+
+        # Changing the file size invalidates the entry
+        with open(self.video_path, "ab") as f:
+            f.write(b"\0")
+        third = ThumbnailExtractor(metadata_cache_dir=cache_dir)
+        with patch.object(third, "_probe_video_metadata", return_value=None) as mock_probe:
+            self.assertIsNone(third.get_video_metadata(self.video_path))
+        mock_probe.assert_called_once()
+        third.metadata_cache.close()
+        second.metadata_cache.close()
+        first.metadata_cache.close()
+
+    def test_thumbnail_cache_skips_decoding(self):
+        """Test that cached thumbnails are served without opening the video."""
+        cache_dir = os.path.join(self.temp_dir, "cache")
+        positions = ["50%", "0%", "50%"]
+
+        first = ThumbnailExtractor(thumbnail_cache_dir=cache_dir)
+        decoded = first.extract_thumbnails(self.video_path, positions, 120, self.metadata)
+        self.assertEqual((first.thumbnail_cache.hits, first.thumbnail_cache.misses), (0, 2))
+        first.thumbnail_cache.close()
+
+        second = ThumbnailExtractor(thumbnail_cache_dir=cache_dir)
+        with patch("core.thumbnail_extractor.cv2.VideoCapture") as mock_capture:
+            cached = second.extract_thumbnails(self.video_path, positions, 120, self.metadata)
+        mock_capture.assert_not_called()
+        self.assertEqual((second.thumbnail_cache.hits, second.thumbnail_cache.misses), (2, 0))
+        self.assertIn("2 hits, 0 misses", second.get_cache_summary())
+
+        self.assertEqual([t.frame_number for t in cached], [t.frame_number for t in decoded])
+        self.assertEqual([t.timestamp for t in cached], [t.timestamp for t in decoded])
+        for cached_thumb, decoded_thumb in zip(cached, decoded):
+            self.assertEqual(cached_thumb.image.tobytes(), decoded_thumb.image.tobytes())
+
+        # A different width is a different cache entry
+        second.extract_thumbnails(self.video_path, ["0%"], 100, self.metadata)
+        self.assertEqual(second.thumbnail_cache.misses, 1)
+        second.thumbnail_cache.close()
+
+    def test_thumbnail_cache_evicts_least_recently_used(self):
+        """Test that the thumbnail cache stays within its byte budget."""
+        cache = ThumbnailCache(os.path.join(self.temp_dir, "cache"))
+        keys = [cache.make_key(self.video_path, float(i), 120, "opencv/seek") for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put(key, Image.new("RGB", (120, 67), (i * 80, 0, 0)), i)
+            time.sleep(0.01)
+
+        # Touch the oldest entry, then shrink the budget to about two entries
+        self.assertIsNotNone(cache.get(keys[0]))
+        entry_size = cache.get_total_bytes() // 3
+        cache.max_bytes = entry_size * 2 + entry_size // 2
+        cache.put(keys[2], Image.new("RGB", (120, 67), (160, 0, 0)), 2)
+
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertIsNotNone(cache.get(keys[2]))
+        self.assertLessEqual(cache.get_total_bytes(), cache.max_bytes)
+        cache.close()
+
+    def test_thumbnail_cache_flush_records_hits(self):
+        """Test that flushed cache hits count for eviction without closing the cache."""
+        cache_dir = os.path.join(self.temp_dir, "cache")
+        cache = ThumbnailCache(cache_dir)
+        keys = [cache.make_key(self.video_path, float(i), 120, "opencv/seek") for i in range(4)]
+        for i, key in enumerate(keys[:3]):
+            cache.put(key, Image.new("RGB", (120, 67), (i * 80, 0, 0)), i)
+            time.sleep(0.01)
+
+        # A hit from another run is only buffered until flushed
+        extractor = ThumbnailExtractor(thumbnail_cache_dir=cache_dir)
+        self.assertIsNotNone(extractor.thumbnail_cache.get(keys[0]))
+        extractor.flush_cache()
+
+        entry_size = cache.get_total_bytes() // 3
+        cache.max_bytes = entry_size * 3 + entry_size // 2
+        cache.put(keys[3], Image.new("RGB", (120, 67), (240, 0, 0)), 3)
+
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+        extractor.thumbnail_cache.close()
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
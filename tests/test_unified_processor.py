@@ -19,6 +19,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from core.unified_processor import UnifiedProcessor
 from core.config_manager import ConfigManager
+from core.video_scanner import VideoScanner as VideoScannerForTest
+from core.thumbnail_extractor import VideoData, VideoMetadata, ThumbnailData
+from PIL import Image
 
 
 class TestUnifiedProcessor(unittest.TestCase):
@@ -227,12 +230,8 @@ class TestUnifiedProcessor(unittest.TestCase):
         # Mock image composer
         mock_composer_instance = Mock()
         mock_composer.return_value = mock_composer_instance
-        mock_composer_instance.create_contact_sheet.return_value = Mock()
-        mock_composer_instance.get_additional_pages.return_value = []
-        
-        # Mock save method
-        mock_image = Mock()
-        mock_composer_instance.create_contact_sheet.return_value = mock_image
+        mock_composer_instance.iter_page_strips.return_value = [[Mock()]]
+        mock_composer_instance.split_strips_to_fit.side_effect = lambda strips, max_height: [strips]
         
         # Execute processing
         result = self.processor.process_thumbnails()
@@ -241,7 +240,7 @@ class TestUnifiedProcessor(unittest.TestCase):
         self.assertTrue(result)
         mock_scanner_instance.scan_folders.assert_called_once()
         mock_extractor_instance.process_video_file.assert_called_once()
-        mock_composer_instance.create_contact_sheet.assert_called_once()
+        mock_composer_instance.compose_page.assert_called_once()
     
     @patch('core.unified_processor.FCPXMLParser')
     @patch('core.unified_processor.ImageComposer')
@@ -295,8 +294,8 @@ class TestUnifiedProcessor(unittest.TestCase):
         # Mock the image composer to avoid actual image processing
         mock_composer_instance = Mock()
         mock_composer.return_value = mock_composer_instance
-        mock_composer_instance.create_contact_sheet.return_value = Mock()
-        mock_composer_instance.get_additional_pages.return_value = []
+        mock_composer_instance.iter_page_strips.return_value = [[Mock()]]
+        mock_composer_instance.split_strips_to_fit.side_effect = lambda strips, max_height: [strips]
         
         # Patch the methods in the processor instance
         with patch.object(self.processor, '_validate_fcpxml_files', return_value=[mock_match]), \
@@ -308,7 +307,7 @@ class TestUnifiedProcessor(unittest.TestCase):
             # Verify FCPXML workflow
             self.assertTrue(result)
             mock_parser_instance.parse_fcpxml_file.assert_called_once_with(fcpxml_file)
-            mock_composer_instance.create_contact_sheet.assert_called_once()
+            mock_composer_instance.compose_page.assert_called_once()
     
     def test_progress_callback(self):
         """Test progress callback functionality."""
@@ -327,7 +326,7 @@ class TestUnifiedProcessor(unittest.TestCase):
         self.assertEqual(self.progress_calls[0], (0.5, "Test progress"))
     
     def test_mode_switching(self):
-        """Test switching between folder and FCPXML modes."""
+        """Test switching between folder, FCPXML and EDL modes."""
         # Start in folder mode
         self.assertEqual(self.processor.get_processing_mode(), "folder")
         
@@ -339,6 +338,14 @@ class TestUnifiedProcessor(unittest.TestCase):
         
         self.assertEqual(self.processor.get_processing_mode(), "fcpxml")
         
+        # Switch to EDL mode
+        edl_file = os.path.join(self.temp_dir, "test.edl")
+        with open(edl_file, 'w') as f:
+            f.write("Samplitude EDL File Format Version 1.7\n")
+        self.config_manager.set_fcpxml_file(edl_file)
+        
+        self.assertEqual(self.processor.get_processing_mode(), "edl")
+        
         # Switch back to folder mode
         self.config_manager.clear_fcpxml_file()
         self.assertEqual(self.processor.get_processing_mode(), "folder")
@@ -417,8 +424,9 @@ class TestUnifiedProcessor(unittest.TestCase):
         # Mock the image composer to avoid actual image processing
         with patch('core.unified_processor.ImageComposer') as mock_composer:
             mock_composer_instance = Mock()
-            mock_composer_instance.create_contact_sheet.return_value = Mock()
-            mock_composer_instance.get_additional_pages.return_value = []
+            mock_composer_instance.iter_pages.return_value = [Mock()]
+            mock_composer_instance.iter_page_strips.return_value = [[Mock()]]
+            mock_composer_instance.split_strips_to_fit.side_effect = lambda strips, max_height: [strips]
             mock_composer.return_value = mock_composer_instance
             
             # Test processing
@@ -428,5 +436,286 @@ class TestUnifiedProcessor(unittest.TestCase):
             # Should succeed even with missing files (will generate placeholders)
             self.assertTrue(result)
 
+    def test_incremental_mode_rerenders_changed_pages_only(self):
+        """Test that incremental runs only extract and render what changed."""
+        source_dir = os.path.join(self.temp_dir, "footage")
+        os.makedirs(source_dir)
+        for name in ("a.mp4", "b.mp4", "c.mp4"):
+            with open(os.path.join(source_dir, name), 'wb') as f:
+                f.write(b"\0" * 16)
+        
+        output_path = os.path.join(self.temp_dir, "out", "sheet.jpg")
+        self.config_manager.update_config({
+            "source_folders": [source_dir],
+            "output_path": output_path,
+            "clips_per_row": 1,
+            "max_rows_per_image": 1,
+            "incremental_mode": True,
+            "cache_dir": os.path.join(self.temp_dir, "cache")
+        })
+        
+        extracted = []
+        failing = set()
+        
+        def fake_extract(video_files, config):
+            extracted.append([vf.filename for vf in video_files])
+            return [
+                VideoData(
+                    file=vf,
+                    metadata=VideoMetadata(1.0, None, (160, 90), 25.0, "h264", "mp4"),
+                    thumbnails=[ThumbnailData(Image.new("RGB", (160, 90)), 0.0, "00:00", 0)],
+                    processing_status="success"
+                )
+                for vf in video_files if vf.filename not in failing
+            ]
+        
+        def run():
+            extracted.clear()
+            self.log_calls.clear()
+            with patch.object(UnifiedProcessor, '_extract_video_files', side_effect=fake_extract):
+                self.assertTrue(self.processor.process_thumbnails())
+            return [m for m in self.log_calls if m.startswith("Incremental update complete")][0]
+        
+        self.assertIn("3 of 3 pages rendered", run())
+        self.assertEqual(extracted, [["a.mp4", "b.mp4", "c.mp4"]])
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "out", "sheet.manifest.json")))
+        
+        # Nothing changed
+        self.assertIn("0 of 3 pages rendered", run())
+        self.assertEqual(extracted, [])
+        
+        # A changed file is the only one extracted
+        with open(os.path.join(source_dir, "b.mp4"), 'ab') as f:
+            f.write(b"\0")
+        self.assertIn("1 of 3 pages rendered", run())
+        self.assertEqual(extracted, [["b.mp4"]])
+        
+        # A file that failed is retried on the next run although it is unchanged
+        failing.add("c.mp4")
+        with open(os.path.join(source_dir, "c.mp4"), 'ab') as f:
+            f.write(b"\0")
+        self.assertIn("0 of 2 pages rendered", run())
+        self.assertEqual(extracted, [["c.mp4"]])
+        failing.clear()
+        self.assertIn("1 of 3 pages rendered", run())
+        self.assertEqual(extracted, [["c.mp4"]])
+        
+        # Removing the last file deletes its page
+        os.remove(os.path.join(source_dir, "c.mp4"))
+        self.assertIn("0 of 2 pages rendered", run())
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, "out", "sheet_page03.jpg")))
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "out", "sheet_page02.jpg")))
+    
+    def test_recompose_from_bundle_skips_extraction(self):
+        """Test that re-composing rebuilds the sheet from the bundle without extracting."""
+        from core.extraction_bundle import ExtractionBundle
+        
+        source_dir = os.path.join(self.temp_dir, "footage")
+        os.makedirs(source_dir)
+        for name in ("a.mp4", "b.mp4", "c.mp4"):
+            with open(os.path.join(source_dir, name), 'wb') as f:
+                f.write(b"\0" * 16)
+        
+        output_path = os.path.join(self.temp_dir, "out", "sheet.png")
+        self.config_manager.update_config({
+            "source_folders": [source_dir],
+            "output_path": output_path,
+            "clips_per_row": 1,
+            "cache_dir": os.path.join(self.temp_dir, "cache")
+        })
+        
+        extracted = []
+        
+        def fake_extract(video_files, config):
+            extracted.extend(video_files)
+            return [
+                VideoData(
+                    file=vf,
+                    metadata=VideoMetadata(12.5, None, (160, 90), 25.0, "h264", "mp4"),
+                    thumbnails=[
+                        ThumbnailData(Image.new("RGB", (160, 90), (i * 60, 100, 200 - i * 50)), i * 5.0, f"00:0{i * 5}", i)
+                        for i in range(2)
+                    ],
+                    processing_status="success"
+                )
+                for vf in video_files
+            ]
+        
+        with patch.object(UnifiedProcessor, '_extract_video_files', side_effect=fake_extract):
+            self.assertTrue(self.processor.process_thumbnails())
+        bundle_path = os.path.join(self.temp_dir, "out", "sheet.bundle.zip")
+        self.assertTrue(os.path.exists(bundle_path))
+        
+        # Layout changes are applied without touching the videos
+        self.config_manager.update_config({"clips_per_row": 2, "background_color": "black"})
+        with patch.object(UnifiedProcessor, '_extract_video_files', side_effect=AssertionError("extracted")):
+            self.assertTrue(self.processor.recompose_from_bundle())
+        
+        composer = self.processor._create_image_composer(self.config_manager.load_config())
+        self.assertEqual(composer.settings.clips_per_row, 2)
+        expected = composer.compose_page([composer.create_strip(vd) for vd in fake_extract(extracted[:3], {})])
+        with Image.open(output_path) as sheet:
+            self.assertEqual(sheet.size, expected.size)
+            self.assertEqual(sheet.convert("RGB").tobytes(), expected.tobytes())
+        
+        loaded = ExtractionBundle(bundle_path).load()
+        self.assertEqual([vd.file.filename for vd in loaded], ["a.mp4", "b.mp4", "c.mp4"])
+        self.assertEqual(loaded[0].metadata.duration, 12.5)
+        self.assertEqual([t.timestamp for t in loaded[0].thumbnails], ["00:00", "00:05"])
+        
+        self.assertFalse(self.processor.recompose_from_bundle(bundle_path=os.path.join(self.temp_dir, "missing.zip")))
+    
+    def test_streaming_pipeline_writes_pages_in_scan_order(self):
+        """Test that the streaming pipeline composes in scan order despite out-of-order extraction."""
+        import random
+        import time
+        from core.image_composer import ImageComposer
+        from core.thumbnail_extractor import ThumbnailExtractor
+        
+        source_dir = os.path.join(self.temp_dir, "footage")
+        os.makedirs(os.path.join(source_dir, "sub"))
+        names = ["b.mp4", "A.mp4", os.path.join("sub", "c.mp4"), "sub.mp4", "d.mp4"]
+        for name in names:
+            with open(os.path.join(source_dir, name), 'wb') as f:
+                f.write(b"\0")
+        
+        output_path = os.path.join(self.temp_dir, "out", "sheet.jpg")
+        self.config_manager.update_config({
+            "source_folders": [source_dir],
+            "output_path": output_path,
+            "clips_per_row": 2,
+            "max_rows_per_image": 1,
+            "streaming_pipeline": True,
+            "cache_dir": os.path.join(self.temp_dir, "cache"),
+            "pipeline_queue_size": 2,
+            "max_workers": 3
+        })
+        
+        def fake_process(extractor, video_file, positions, width):
+            time.sleep(random.uniform(0, 0.02))
+            if video_file.filename == "d.mp4":
+                return VideoData(video_file, VideoMetadata(0, None, (0, 0), 0, "unknown", "unknown"), [], "error")
+            return VideoData(
+                file=video_file,
+                metadata=VideoMetadata(1.0, None, (160, 90), 25.0, "h264", "mp4"),
+                thumbnails=[ThumbnailData(Image.new("RGB", (160, 90)), 0.0, "00:00", 0)],
+                processing_status="success"
+            )
+        
+        composed = []
+        
+        def fake_strip(composer, video_data):
+            composed.append(video_data.file.filename)
+            return Image.new("RGB", (100, 50))
+        
+        with patch.object(ThumbnailExtractor, 'process_video_file', autospec=True, side_effect=fake_process), \
+             patch.object(ImageComposer, 'create_strip', autospec=True, side_effect=fake_strip):
+            self.assertTrue(self.processor.process_thumbnails())
+        
+        scanned = [os.path.basename(vf.path) for vf in VideoScannerForTest().scan_folders([source_dir])]
+        self.assertEqual(composed, [name for name in scanned if name != "d.mp4"])
+        self.assertEqual(composed, ["A.mp4", "b.mp4", "sub.mp4", "c.mp4"])
+        self.assertTrue(os.path.exists(output_path))
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "out", "sheet_page02.jpg")))
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, "out", "sheet_page03.jpg")))
+    
+    def test_fcpxml_clips_extracted_once_per_source(self):
+        """Test that clips sharing a source file are extracted together and kept in timeline order."""
+        from core.thumbnail_extractor import ThumbnailExtractor
+        from core.timeline_data_models import TimelineEntry
+        
+        sources = ["a.mp4", "b.mp4", "a.mp4", "missing.mp4", "a.mp4"]
+        matches = [
+            {
+                'timeline_entry': TimelineEntry(i + 1, name, start_time=i * 10.0, end_time=i * 10.0 + 10.0,
+                                                clip_start_time=i * 2.0, clip_end_time=i * 2.0 + 4.0),
+                'matched_file_path': os.path.join(self.temp_dir, name),
+                'is_found': name != "missing.mp4"
+            }
+            for i, name in enumerate(sources)
+        ]
+        calls = []
+        
+        def fake_clips(extractor, video_file, clip_positions, width, known_metadata=None):
+            calls.append((video_file.filename, clip_positions))
+            return [
+                VideoData(
+                    file=video_file,
+                    metadata=VideoMetadata(60.0, None, (160, 90), 25.0, "h264", "mp4"),
+                    thumbnails=[ThumbnailData(Image.new("RGB", (160, 90)), 0.0, "00:00", 0)],
+                    processing_status="success"
+                )
+                for _ in clip_positions
+            ]
+        
+        with patch.object(ThumbnailExtractor, 'process_video_clips', autospec=True, side_effect=fake_clips):
+            results = self.processor._extract_fcpxml_thumbnails(matches, ["0%", "50%"], 160, True)
+        
+        self.assertEqual(calls, [
+            ("a.mp4", [["0.0s", "2.0s"], ["4.0s", "6.0s"], ["8.0s", "10.0s"]]),
+            ("b.mp4", [["2.0s", "4.0s"]]),
+        ])
+        self.assertEqual([vd.source_id for vd in results], [1, 2, 3, 4, 5])
+        self.assertEqual([vd.is_placeholder for vd in results], [False, False, False, True, False])
+    
+    def test_fcpxml_resource_metadata_skips_probe(self):
+        """Test that FCPXML asset and format records replace probing."""
+        import struct
+        from datetime import datetime
+        from core.thumbnail_extractor import ThumbnailExtractor
+        from core.timeline_data_models import TimelineEntry, TimelineResource
+        
+        def box(kind, payload):
+            return struct.pack('>I4s', 8 + len(payload), kind) + payload
+        
+        # Minimal MP4 whose movie header records 2019-05-08 10:58:46 UTC
+        creation_time = int((datetime(2019, 5, 8, 10, 58, 46) - datetime(1904, 1, 1)).total_seconds())
+        mvhd = box(b'mvhd', struct.pack('>B3xII', 0, creation_time, creation_time) + b"\0" * 88)
+        video_path = os.path.join(self.temp_dir, "a.mp4")
+        with open(video_path, 'wb') as f:
+            f.write(box(b'ftyp', b"isom" + b"\0" * 4) + box(b'free', b"\0" * 16) + box(b'moov', mvhd))
+        mts_path = os.path.join(self.temp_dir, "b.mts")
+        with open(mts_path, 'wb') as f:
+            f.write(b"\x47" * 188)
+        complete = TimelineResource("r1", video_path, start=0.0, duration=12.0, width=3840, height=2160, fps=25.0)
+        partial = TimelineResource("r2", video_path, duration=12.0)
+        
+        metadata = self.processor._get_resource_metadata(TimelineEntry(1, video_path, resource=complete))
+        self.assertEqual((metadata.duration, metadata.resolution, metadata.fps), (12.0, (3840, 2160), 25.0))
+        self.assertEqual(metadata.creation_date, datetime(2019, 5, 8, 10, 58, 46))
+        self.assertIsNone(self.processor._get_resource_metadata(TimelineEntry(1, video_path, resource=partial)))
+        self.assertIsNone(self.processor._get_resource_metadata(TimelineEntry(1, video_path)))
+        # Recording dates of other containers need probing
+        self.assertIsNone(self.processor._get_resource_metadata(TimelineEntry(1, mts_path, resource=complete)))
+        
+        matches = [{
+            'timeline_entry': TimelineEntry(1, video_path, clip_start_time=2.0, clip_end_time=4.0, resource=complete),
+            'matched_file_path': video_path,
+            'is_found': True
+        }]
+        self.processor.thumbnail_extractor = ThumbnailExtractor()
+        with patch.object(ThumbnailExtractor, '_probe_video_metadata') as mock_probe, \
+             patch.object(ThumbnailExtractor, 'extract_thumbnails', return_value=[]) as mock_extract:
+            self.processor._extract_fcpxml_thumbnails(matches, ["0%", "50%"], 160, True)
+        
+        mock_probe.assert_not_called()
+        self.assertEqual(mock_extract.call_args[0][3].resolution, (3840, 2160))
+        
+        self.config_manager.update_config({"fcpxml_resource_metadata": False})
+        with patch.object(ThumbnailExtractor, 'get_video_metadata', return_value=None) as mock_metadata:
+            self.processor._extract_fcpxml_thumbnails(matches, ["0%", "50%"], 160, True)
+        self.assertIsNone(mock_metadata.call_args[0][1])
+    
+    def test_run_manifest_settings_hash(self):
+        """Test that the manifest settings hash changes with render settings."""
+        from core.run_manifest import RunManifest
+        
+        config = self.config_manager.load_config()
+        changed = dict(config, background_color="black")
+        
+        self.assertEqual(RunManifest.compute_settings_hash(config), RunManifest.compute_settings_hash(dict(config)))
+        self.assertNotEqual(RunManifest.compute_settings_hash(config), RunManifest.compute_settings_hash(changed))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
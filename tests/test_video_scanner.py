@@ -5,7 +5,9 @@ Unit tests for the Video Scanner component.
 import unittest
 import tempfile
 import os
+import shutil
 from pathlib import Path
+from unittest.mock import patch
 
 # Add src to path for imports
 import sys
@@ -13,6 +15,7 @@ src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
 from core.video_scanner import VideoScanner, VideoFile
+from utils.file_utils import scan_directories_parallel
 
 
 class TestVideoScanner(unittest.TestCase):
@@ -123,6 +126,68 @@ class TestVideoScanner(unittest.TestCase):
         self.assertTrue(video_file.is_accessible)
         self.assertGreater(video_file.size, 0)
     
+    def test_parallel_scan_matches_sequential_scan(self):
+        """Test that concurrent listing keeps dedupe and sorted ordering."""
+        # Overlapping roots must not produce duplicates
+        roots = [self.test_videos_dir, self.test_subdir, self.test_videos_dir + os.sep]
+        
+        sequential = VideoScanner(max_workers=1).scan_folders(roots, recursive=True)
+        parallel = VideoScanner(max_workers=4).scan_folders(roots, recursive=True)
+        
+        self.assertEqual(len(parallel), 5)
+        self.assertEqual([vf.path for vf in parallel], [vf.path for vf in sequential])
+        self.assertEqual([vf.path for vf in parallel], sorted((vf.path for vf in parallel), key=str.lower))
+    
+    def test_scan_index_skips_unchanged_directories(self):
+        """Test that unchanged directories are served from the scan index."""
+        index_dir = tempfile.mkdtemp()
+        try:
+            VideoScanner(scan_index_dir=index_dir).scan_folders([self.test_videos_dir])
+            
+            scanner = VideoScanner(scan_index_dir=index_dir)
+            with patch("utils.file_utils.list_directory_files", side_effect=AssertionError("listed")):
+                video_files = scanner.scan_folders([self.test_videos_dir])
+            self.assertEqual(len(video_files), 5)
+            self.assertEqual(scanner.scan_index.hits, 2)
+            
+            # Adding a file changes the directory mtime, so only that directory is listed again
+            new_file = os.path.join(self.test_subdir, "video6.mp4")
+            with open(new_file, "w") as f:
+                f.write("test content")
+            self.test_files.append(new_file)
+            os.utime(self.test_subdir, ns=(0, os.stat(self.test_subdir).st_mtime_ns + 10 ** 9))
+            
+            scanner = VideoScanner(scan_index_dir=index_dir)
+            video_files = scanner.scan_folders([self.test_videos_dir])
+            self.assertIn("video6.mp4", [vf.filename for vf in video_files])
+            self.assertEqual((scanner.scan_index.hits, scanner.scan_index.misses), (1, 1))
+        finally:
+            shutil.rmtree(index_dir, ignore_errors=True)
+    
+    def test_summary_methods_reuse_last_scan(self):
+        """Test that the summary methods share one scan result."""
+        with patch("core.video_scanner.scan_directories_parallel", wraps=scan_directories_parallel) as mock_scan:
+            self.video_scanner.get_scan_summary([self.test_videos_dir])
+            self.video_scanner.get_video_count([self.test_videos_dir])
+            self.video_scanner.get_total_size([self.test_videos_dir])
+            self.video_scanner.get_file_extension_stats([self.test_videos_dir])
+            self.assertEqual(mock_scan.call_count, 1)
+            
+            self.video_scanner.get_video_count([self.test_videos_dir], recursive=False)
+            self.assertEqual(mock_scan.call_count, 2)
+    
+    def test_scan_uses_directory_entry_stat(self):
+        """Test that scanning fills VideoFile from the directory entry without extra stat calls."""
+        with patch("os.path.getsize", side_effect=AssertionError("extra stat")), \
+             patch("os.path.getmtime", side_effect=AssertionError("extra stat")), \
+             patch("os.path.isfile", side_effect=AssertionError("extra stat")):
+            video_files = self.video_scanner.scan_folders([self.test_videos_dir], recursive=True)
+        
+        self.assertEqual(len(video_files), 5)
+        for video_file in video_files:
+            self.assertEqual(video_file.size, os.path.getsize(video_file.path))
+            self.assertAlmostEqual(video_file.modified_date.timestamp(), os.path.getmtime(video_file.path), places=3)
+    
     def test_folder_validation(self):
         """Test folder accessibility validation."""
         validation_results = self.video_scanner.validate_folders([